@@ -0,0 +1,106 @@
+"""add foreign key and scheduler indexes
+
+Revision ID: 13c19ec43262
+Revises: f7dec3df7abe
+Create Date: 2026-10-18 10:12:41.503214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "13c19ec43262"
+down_revision = "f7dec3df7abe"
+branch_labels = None
+depends_on = None
+
+FOREIGN_KEY_INDEXES = [
+    ("cart", "user_id"),
+    ("cart_item", "cart_id"),
+    ("cart_item", "product_id"),
+    ("order", "user_id"),
+    ("order_item", "order_id"),
+    ("order_item", "product_id"),
+    ("payment", "order_id"),
+    ("payment", "user_id"),
+    ("product_inventory", "product_id"),
+    ("user_address", "user_id"),
+    ("category_product_association_table", "product_id"),
+]
+
+
+def upgrade() -> None:
+    for table_name, column_name in FOREIGN_KEY_INDEXES:
+        op.create_index(
+            op.f(f"ix_{table_name}_{column_name}"), table_name, [column_name]
+        )
+
+    op.create_index(
+        op.f("ix_cart_item_cart_item_validity"), "cart_item", ["cart_item_validity"]
+    )
+    op.create_index(
+        "ix_order_payment_deadline_awaiting_payment",
+        "order",
+        ["payment_deadline"],
+        postgresql_where=sa.text("waiting_for_payment AND NOT cancelled"),
+    )
+
+    op.execute(
+        "DELETE FROM category_product_association_table WHERE category_id IS NULL"
+    )
+    op.execute(
+        "DELETE FROM category_product_association_table a "
+        "USING category_product_association_table b "
+        "WHERE a.ctid > b.ctid "
+        "AND a.category_id = b.category_id AND a.product_id = b.product_id"
+    )
+    op.alter_column("category_product_association_table", "category_id", nullable=False)
+    op.drop_constraint(
+        "category_product_association_table_category_id_fkey",
+        "category_product_association_table",
+        type_="foreignkey",
+    )
+    op.create_foreign_key(
+        "category_product_association_table_category_id_fkey",
+        "category_product_association_table",
+        "category",
+        ["category_id"],
+        ["id"],
+        onupdate="cascade",
+        ondelete="cascade",
+    )
+    op.create_primary_key(
+        "category_product_association_table_pkey",
+        "category_product_association_table",
+        ["category_id", "product_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "category_product_association_table_pkey",
+        "category_product_association_table",
+        type_="primary",
+    )
+    op.drop_constraint(
+        "category_product_association_table_category_id_fkey",
+        "category_product_association_table",
+        type_="foreignkey",
+    )
+    op.create_foreign_key(
+        "category_product_association_table_category_id_fkey",
+        "category_product_association_table",
+        "category",
+        ["category_id"],
+        ["id"],
+        onupdate="cascade",
+        ondelete="SET NULL",
+    )
+    op.alter_column("category_product_association_table", "category_id", nullable=True)
+
+    op.drop_index("ix_order_payment_deadline_awaiting_payment", table_name="order")
+    op.drop_index(op.f("ix_cart_item_cart_item_validity"), table_name="cart_item")
+
+    for table_name, column_name in reversed(FOREIGN_KEY_INDEXES):
+        op.drop_index(op.f(f"ix_{table_name}_{column_name}"), table_name=table_name)
@@ -0,0 +1,36 @@
+"""add revoked subject
+
+Revision ID: 3d9e71c4a6b2
+Revises: a85c3e9d1b47
+Create Date: 2026-10-18 19:12:05.417302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3d9e71c4a6b2"
+down_revision = "a85c3e9d1b47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_subject",
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("subject"),
+    )
+    op.create_index(
+        op.f("ix_revoked_subject_expires_at"),
+        "revoked_subject",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_revoked_subject_expires_at"), table_name="revoked_subject")
+    op.drop_table("revoked_subject")
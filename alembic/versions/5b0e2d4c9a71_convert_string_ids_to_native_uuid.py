@@ -0,0 +1,90 @@
+"""convert string ids to native uuid
+
+Revision ID: 5b0e2d4c9a71
+Revises: 13c19ec43262
+Create Date: 2026-10-18 11:02:17.284530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5b0e2d4c9a71'
+down_revision = '13c19ec43262'
+branch_labels = None
+depends_on = None
+
+PRIMARY_KEY_COLUMNS = [
+    ('category', 'id'),
+    ('product', 'id'),
+    ('user', 'id'),
+    ('cart', 'id'),
+    ('order', 'id'),
+    ('product_inventory', 'id'),
+    ('user_address', 'id'),
+    ('cart_item', 'id'),
+    ('order_item', 'id'),
+    ('payment', 'id'),
+]
+
+FOREIGN_KEYS = [
+    ('cart', 'user_id', 'user', 'cascade'),
+    ('category_product_association_table', 'category_id', 'category', 'cascade'),
+    ('category_product_association_table', 'product_id', 'product', 'cascade'),
+    ('order', 'user_id', 'user', 'cascade'),
+    ('product_inventory', 'product_id', 'product', 'cascade'),
+    ('user_address', 'user_id', 'user', 'cascade'),
+    ('cart_item', 'cart_id', 'cart', 'cascade'),
+    ('cart_item', 'product_id', 'product', 'cascade'),
+    ('order_item', 'order_id', 'order', 'cascade'),
+    ('order_item', 'product_id', 'product', 'cascade'),
+    ('payment', 'order_id', 'order', 'SET NULL'),
+    ('payment', 'user_id', 'user', 'SET NULL'),
+]
+
+
+def drop_foreign_keys() -> None:
+    for table_name, column_name, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(
+            f'{table_name}_{column_name}_fkey', table_name, type_='foreignkey'
+        )
+
+
+def create_foreign_keys() -> None:
+    for table_name, column_name, referred_table_name, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(
+            f'{table_name}_{column_name}_fkey',
+            table_name,
+            referred_table_name,
+            [column_name],
+            ['id'],
+            onupdate='cascade',
+            ondelete=ondelete,
+        )
+
+
+def alter_id_columns(type_, using: str) -> None:
+    columns = PRIMARY_KEY_COLUMNS + [
+        (table_name, column_name) for table_name, column_name, _, _ in FOREIGN_KEYS
+    ]
+    for table_name, column_name in columns:
+        op.alter_column(
+            table_name,
+            column_name,
+            type_=type_,
+            postgresql_using=f'"{column_name}"::{using}',
+        )
+
+
+def upgrade() -> None:
+    drop_foreign_keys()
+    alter_id_columns(postgresql.UUID(as_uuid=False), 'uuid')
+    create_foreign_keys()
+
+
+def downgrade() -> None:
+    drop_foreign_keys()
+    alter_id_columns(sa.String(), 'varchar')
+    create_foreign_keys()
@@ -0,0 +1,46 @@
+"""add category product count
+
+Revision ID: 6f2b8d0c4e19
+Revises: d3a81f5c6e02
+Create Date: 2026-10-18 16:05:12.318406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "6f2b8d0c4e19"
+down_revision = "d3a81f5c6e02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_product_count",
+        sa.Column("category_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("product_count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(
+            ["category_id"], ["category.id"], onupdate="cascade", ondelete="cascade"
+        ),
+        sa.PrimaryKeyConstraint("category_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO category_product_count (category_id, product_count)
+        SELECT category.id, count(product.id)
+        FROM category
+        LEFT JOIN category_product_association_table AS association
+            ON association.category_id = category.id
+        LEFT JOIN product
+            ON product.id = association.product_id
+            AND product.removed_from_store = false
+        GROUP BY category.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("category_product_count")
@@ -0,0 +1,46 @@
+"""add product inventory shard
+
+Revision ID: 8c4f1a7e2d95
+Revises: 3d9e71c4a6b2
+Create Date: 2026-10-18 21:40:27.503118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "8c4f1a7e2d95"
+down_revision = "3d9e71c4a6b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "product_inventory",
+        sa.Column("shard_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_table(
+        "product_inventory_shard",
+        sa.Column("id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("inventory_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("quantity_for_cart_items", sa.Integer(), nullable=False),
+        sa.Column("sold", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["inventory_id"],
+            ["product_inventory.id"],
+            onupdate="cascade",
+            ondelete="cascade",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("id"),
+        sa.UniqueConstraint("inventory_id", "shard"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("product_inventory_shard")
+    op.drop_column("product_inventory", "shard_count")
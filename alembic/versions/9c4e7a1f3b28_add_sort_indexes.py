@@ -0,0 +1,33 @@
+"""add sort indexes
+
+Revision ID: 9c4e7a1f3b28
+Revises: 5b0e2d4c9a71
+Create Date: 2026-10-18 13:41:09.118352
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9c4e7a1f3b28"
+down_revision = "5b0e2d4c9a71"
+branch_labels = None
+depends_on = None
+
+SORT_INDEXES = [
+    ("ix_product_price_id", "product", ["price", "id"]),
+    ("ix_product_created_at_id", "product", ["created_at", "id"]),
+    ("ix_user_last_name_email_id", "user", ["last_name", "email", "id"]),
+    ("ix_order_created_at_id", "order", ["created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    for index_name, table_name, column_names in SORT_INDEXES:
+        op.create_index(index_name, table_name, column_names)
+
+
+def downgrade() -> None:
+    for index_name, table_name, _ in reversed(SORT_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,35 @@
+"""add updated_at columns
+
+Revision ID: a85c3e9d1b47
+Revises: 6f2b8d0c4e19
+Create Date: 2026-10-18 17:41:36.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a85c3e9d1b47"
+down_revision = "6f2b8d0c4e19"
+branch_labels = None
+depends_on = None
+
+TABLES = {
+    "product": "created_at",
+    "category": "now()",
+    "cart": "now()",
+    "order": "created_at",
+}
+
+
+def upgrade() -> None:
+    for table, initial_value in TABLES.items():
+        op.add_column(table, sa.Column("updated_at", sa.DateTime(), nullable=True))
+        op.execute(f'UPDATE "{table}" SET updated_at = {initial_value}')
+        op.alter_column(table, "updated_at", nullable=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "updated_at")
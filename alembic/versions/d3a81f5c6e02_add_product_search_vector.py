@@ -0,0 +1,44 @@
+"""add product search vector
+
+Revision ID: d3a81f5c6e02
+Revises: 9c4e7a1f3b28
+Create Date: 2026-10-18 14:22:51.640217
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "d3a81f5c6e02"
+down_revision = "9c4e7a1f3b28"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "product",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', name), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_product_search_vector",
+        "product",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_product_search_vector", table_name="product")
+    op.drop_column("product", "search_vector")
@@ -0,0 +1,51 @@
+import argparse
+import random
+import string
+import time
+import tracemalloc
+
+from src.apps.products.services.autocomplete_services import (
+    PRODUCT_KIND,
+    AutocompleteIndex,
+)
+
+
+def generate_items(rows: int) -> list[tuple[str, str, str, int]]:
+    words = [
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 9)))
+        for _ in range(5_000)
+    ]
+    return [
+        (PRODUCT_KIND, str(index), " ".join(random.choices(words, k=3)).title(), index)
+        for index in range(rows)
+    ]
+
+
+def main(rows: int, rounds: int) -> None:
+    items = generate_items(rows)
+    index = AutocompleteIndex(rows, cached_prefix_length=2, top_size=20)
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    index.rebuild(items)
+    build_seconds = time.perf_counter() - start_time
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+    print(f"build: {build_seconds:.2f} s, {memory_mb:.1f} MB for {rows} names")
+
+    for query in ["s", "st", "ste", items[0][2][:5]]:
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            index.lookup(query, 10)
+        duration_us = (time.perf_counter() - start_time) / rounds * 1_000_000
+        print(f"{query!r:>8}: {duration_us:8.1f} us per lookup")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure autocomplete index build time, memory and lookups."
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=1_000)
+    args = parser.parse_args()
+    main(args.rows, args.rounds)
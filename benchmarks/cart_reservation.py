@@ -0,0 +1,189 @@
+import argparse
+import asyncio
+import datetime
+import time
+from decimal import Decimal
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.apps.orders.models import Cart, CartItem
+from src.apps.products.models import Product, ProductInventory, ProductInventoryShard
+from src.apps.products.schemas import InventoryOutputSchema
+from src.apps.products.services.inventory_services import (
+    apply_inventory_shards,
+    rebalance_inventory,
+    reserve_quantity_for_cart_items,
+)
+from src.apps.user.models import User
+from src.core.exceptions import ExceededItemQuantityException
+from src.database.db_connection import Base
+from src.settings import alembic  # noqa: F401  registers every mapped model
+from src.settings.db_settings import settings
+
+PRICE = Decimal("10.00")
+
+
+async def seed(session: AsyncSession, carts: int, stock: int) -> tuple[str, list[str]]:
+    product = Product(name="Hot product", price=PRICE, description="Flash sale")
+    users = [
+        User(
+            first_name="Bench",
+            last_name="User",
+            email=f"bench{index}@example.com",
+            username=f"bench{index}",
+            password="unused",
+            birth_date=datetime.date(1990, 1, 1),
+            is_active=True,
+        )
+        for index in range(carts)
+    ]
+    session.add_all([product, *users])
+    await session.flush()
+    cart_objects = [Cart(user_id=user.id) for user in users]
+    session.add_all(
+        [
+            *cart_objects,
+            ProductInventory(
+                quantity=stock, quantity_for_cart_items=stock, product_id=product.id
+            ),
+        ]
+    )
+    await session.commit()
+    return product.id, [cart.id for cart in cart_objects]
+
+
+async def get_inventory(session: AsyncSession, product_id: str):
+    inventory = InventoryOutputSchema.from_orm(
+        await session.scalar(
+            select(ProductInventory).filter(ProductInventory.product_id == product_id)
+        )
+    )
+    await apply_inventory_shards(session, [inventory])
+    return inventory
+
+
+async def reset(
+    session: AsyncSession, product_id: str, stock: int, shard_count: int
+) -> None:
+    await session.execute(delete(CartItem))
+    await session.execute(delete(ProductInventoryShard))
+    await session.execute(update(Cart).values(cart_total_price=0))
+    await session.execute(
+        update(ProductInventory)
+        .filter(ProductInventory.product_id == product_id)
+        .values(quantity_for_cart_items=stock, shard_count=0)
+    )
+    if shard_count:
+        inventory = await get_inventory(session, product_id)
+        await rebalance_inventory(session, inventory.id, shard_count)
+    await session.commit()
+
+
+async def add_item(session: AsyncSession, product_id: str, cart_id: str, lock: bool):
+    # the read-check-write sequence cart items used before reservations became
+    # a single conditional update
+    query = select(ProductInventory).filter(ProductInventory.product_id == product_id)
+    inventory = await session.scalar(query.with_for_update() if lock else query)
+    if (available_quantity := inventory.quantity_for_cart_items) < 1:
+        await session.rollback()
+        raise ExceededItemQuantityException(available_quantity, 1)
+
+    cart = await session.get(Cart, cart_id)
+    cart.cart_total_price += PRICE
+    session.add(CartItem(cart_id=cart_id, product_id=product_id, cart_item_price=PRICE))
+    inventory.quantity_for_cart_items -= 1
+    await session.commit()
+
+
+async def reserve_item(session: AsyncSession, product_id: str, cart_id: str):
+    if await reserve_quantity_for_cart_items(session, product_id, 1) is None:
+        await session.rollback()
+        raise ExceededItemQuantityException(0, 1)
+
+    cart = await session.get(Cart, cart_id)
+    cart.cart_total_price += PRICE
+    session.add(CartItem(cart_id=cart_id, product_id=product_id, cart_item_price=PRICE))
+    await session.commit()
+
+
+STRATEGIES = {
+    "read-modify-write": (lambda *args: add_item(*args, lock=False), 0),
+    "select-for-update": (lambda *args: add_item(*args, lock=True), 0),
+    "conditional-update": (reserve_item, 0),
+}
+
+
+async def run(session_factory, strategy, product_id, cart_ids, concurrency):
+    queue = list(cart_ids)
+    added = 0
+
+    async def worker():
+        nonlocal added
+        while queue:
+            cart_id = queue.pop()
+            async with session_factory() as session:
+                try:
+                    await strategy(session, product_id, cart_id)
+                    added += 1
+                except ExceededItemQuantityException:
+                    pass
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return added, time.perf_counter() - start_time
+
+
+async def main(carts: int, stock: int, concurrency: int, shards: list[int]) -> None:
+    engine = create_async_engine(
+        settings.test_postgres_async_url, pool_size=concurrency, max_overflow=0
+    )
+    session_factory = sessionmaker(
+        engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    try:
+        async with session_factory() as session:
+            product_id, cart_ids = await seed(session, carts, stock)
+
+        strategies = {
+            **STRATEGIES,
+            **{
+                f"{shard_count} shards": (reserve_item, shard_count)
+                for shard_count in shards
+            },
+        }
+        for name, (strategy, shard_count) in strategies.items():
+            async with session_factory() as session:
+                await reset(session, product_id, stock, shard_count)
+            added, duration = await run(
+                session_factory, strategy, product_id, cart_ids, concurrency
+            )
+            async with session_factory() as session:
+                inventory = await get_inventory(session, product_id)
+                remaining = inventory.quantity_for_cart_items
+            print(
+                f"{name:>20}: {carts / duration:8.0f} attempts/s, {added} added, "
+                f"{max(added + remaining - stock, 0)} oversold, "
+                f"{remaining} left in stock"
+            )
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Add one hot product to many carts concurrently and compare "
+        "inventory reservation strategies."
+    )
+    parser.add_argument("--carts", type=int, default=5_000)
+    parser.add_argument("--stock", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--shards", type=int, nargs="*", default=[4, 16])
+    args = parser.parse_args()
+    asyncio.run(main(args.carts, args.stock, args.concurrency, args.shards))
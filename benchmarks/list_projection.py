@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.apps.products.models import Category
+from src.apps.products.schemas import CategoryOutputSchema
+from src.core.projection import get_projection
+from src.core.utils.utils import generate_uuid, serialize_instances
+from src.database.db_connection import Base
+from src.settings import alembic  # noqa: F401  registers every mapped model
+from src.settings.db_settings import settings
+
+
+async def load_entities(session: AsyncSession, page_size: int) -> list:
+    instances = (
+        await session.scalars(
+            select(Category).limit(page_size).execution_options(populate_existing=True)
+        )
+    ).all()
+    return await serialize_instances(session, CategoryOutputSchema, instances)
+
+
+async def load_projection(session: AsyncSession, page_size: int) -> list:
+    projection = get_projection(Category, CategoryOutputSchema)
+    rows = (
+        await session.execute(projection.select(select(Category)).limit(page_size))
+    ).all()
+    return [projection.build(iter(row)) for row in rows]
+
+
+async def measure(load, session: AsyncSession, page_size: int, rounds: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        await load(session, page_size)
+        session.expunge_all()
+    return (time.perf_counter() - start_time) / rounds * 1000
+
+
+async def main(rows: int, page_size: int, rounds: int) -> None:
+    engine = create_async_engine(settings.test_postgres_async_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            insert(Category),
+            [
+                {"id": generate_uuid(), "name": f"category-{index}"}
+                for index in range(rows)
+            ],
+        )
+
+    async with AsyncSession(engine) as session:
+        for name, load in [
+            ("orm entities", load_entities),
+            ("projection", load_projection),
+        ]:
+            duration_ms = await measure(load, session, page_size, rounds)
+            print(f"{name:>12}: {duration_ms:8.2f} ms per {page_size}-row page")
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare entity hydration with column projection for list pages."
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=1_000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.page_size, args.rounds))
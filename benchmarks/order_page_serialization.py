@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.apps.orders.schemas import OrderItemOutputSchema, OrderOutputSchema
+from src.apps.products.schemas import (
+    CategoryOutputSchema,
+    InventoryOutputSchema,
+    ProductOutputSchema,
+)
+from src.core.pagination.schemas import PagedResponseSchema
+from src.core.responses import SchemaJSONResponse
+from src.core.utils.utils import generate_uuid
+
+
+def build_order(items_count: int) -> OrderOutputSchema:
+    order_id = generate_uuid()
+    return OrderOutputSchema(
+        id=order_id,
+        user_id=generate_uuid(),
+        waiting_for_payment=True,
+        order_accepted=False,
+        payment_accepted=False,
+        being_delivered=False,
+        received=False,
+        cancelled=False,
+        total_order_price=Decimal("129.97"),
+        created_at=datetime.now(),
+        payment_deadline=datetime.now(),
+        order_items=[
+            OrderItemOutputSchema(
+                id=generate_uuid(),
+                order_id=order_id,
+                quantity=1,
+                order_item_price=Decimal("43.29"),
+                product_price_when_order_created=Decimal("43.29"),
+                product=ProductOutputSchema(
+                    id=generate_uuid(),
+                    name=f"Product {index}",
+                    description="Benchmark product",
+                    price=Decimal("43.29"),
+                    removed_from_store=False,
+                    categories=[
+                        CategoryOutputSchema(id=generate_uuid(), name="Benchmark")
+                    ],
+                    inventory=InventoryOutputSchema(
+                        id=generate_uuid(),
+                        quantity=100,
+                        quantity_for_cart_items=99,
+                        sold=1,
+                    ),
+                ),
+            )
+            for index in range(items_count)
+        ],
+    )
+
+
+async def render_with_validation(field, page: PagedResponseSchema) -> bytes:
+    content = await serialize_response(field=field, response_content=page)
+    return JSONResponse(content).body
+
+
+async def render_without_validation(field, page: PagedResponseSchema) -> bytes:
+    return SchemaJSONResponse(page.dict()).body
+
+
+async def measure(render, field, page: PagedResponseSchema, rounds: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        await render(field, page)
+    return (time.perf_counter() - start_time) / rounds * 1000
+
+
+async def main(orders: int, items_per_order: int, rounds: int) -> None:
+    page_schema = PagedResponseSchema[OrderOutputSchema]
+    page = page_schema(
+        total=orders,
+        page=1,
+        size=orders,
+        results=[build_order(items_per_order) for _ in range(orders)],
+        has_next_page=False,
+    )
+    field = create_response_field(name="response", type_=page_schema)
+
+    for name, render in [
+        ("validate + json", render_with_validation),
+        ("orjson", render_without_validation),
+    ]:
+        duration_ms = await measure(render, field, page, rounds)
+        print(f"{name:>16}: {duration_ms:8.2f} ms per {orders}-order page")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare FastAPI's default response path with the orjson one."
+    )
+    parser.add_argument("--orders", type=int, default=100)
+    parser.add_argument("--items-per-order", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.orders, args.items_per_order, args.rounds))
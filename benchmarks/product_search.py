@@ -0,0 +1,63 @@
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.apps.products.services.product_services import search_available_products
+from src.core.pagination.models import PageParams
+from src.database.db_connection import Base
+from src.settings import alembic  # noqa: F401  registers every mapped model
+from src.settings.db_settings import settings
+
+WORDS = ["steel", "wooden", "rubber", "cotton", "granite", "plastic", "fresh"]
+NOUNS = ["chair", "table", "shoes", "gloves", "keyboard", "mouse", "towels"]
+
+
+async def seed_products(session: AsyncSession, rows: int) -> None:
+    await session.execute(
+        text(
+            "INSERT INTO product (id, name, price, description, created_at) "
+            "SELECT gen_random_uuid(), "
+            "(CAST(:words AS text[]))[1 + n % 7] || ' ' || (CAST(:nouns AS text[]))[1 + n / 7 % 7] || ' ' || n, "
+            "n % 1000, 'Item number ' || n || ' made of ' || (CAST(:words AS text[]))[1 + n / 49 % 7], "
+            "now() FROM generate_series(1, :rows) AS n"
+        ),
+        {"rows": rows, "words": WORDS, "nouns": NOUNS},
+    )
+    await session.execute(text("ANALYZE product"))
+    await session.commit()
+
+
+async def measure(session: AsyncSession, search_query: str, rounds: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        await search_available_products(session, search_query, PageParams())
+    return (time.perf_counter() - start_time) / rounds * 1000
+
+
+async def main(rows: int, rounds: int) -> None:
+    engine = create_async_engine(settings.test_postgres_async_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        await seed_products(session, rows)
+        for search_query in ["granite keyboard", "wood", "towels 4242"]:
+            duration_ms = await measure(session, search_query, rounds)
+            print(f"{search_query!r:>20}: {duration_ms:8.2f} ms per page")
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time ranked full-text product search over a seeded catalogue."
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.rounds))
@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.utils.utils import generate_uuid
+from src.settings.db_settings import settings
+
+VARIANTS = {
+    "text_uuid4": ("varchar", lambda: str(uuid.uuid4())),
+    "native_uuid7": ("uuid", generate_uuid),
+}
+
+
+async def run_variant(connection, name: str, rows: int, batch_size: int) -> dict:
+    column_type, generate_key = VARIANTS[name]
+    table_name = f"benchmark_{name}"
+    await connection.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
+    await connection.execute(
+        text(
+            f"CREATE TABLE {table_name} "
+            f"(id {column_type} PRIMARY KEY, quantity integer NOT NULL)"
+        )
+    )
+    statement = text(f"INSERT INTO {table_name} (id, quantity) VALUES (:id, :quantity)")
+
+    start_time = time.perf_counter()
+    for _ in range(rows // batch_size):
+        await connection.execute(
+            statement,
+            [{"id": generate_key(), "quantity": 1} for _ in range(batch_size)],
+        )
+    elapsed = time.perf_counter() - start_time
+
+    index_size = await connection.scalar(
+        text(f"SELECT pg_relation_size('{table_name}_pkey')")
+    )
+    await connection.execute(text(f"DROP TABLE {table_name}"))
+    return {
+        "variant": name,
+        "rows_per_second": round(rows / elapsed),
+        "pk_index_kb": index_size // 1024,
+    }
+
+
+async def main(rows: int, batch_size: int) -> None:
+    engine = create_async_engine(settings.test_postgres_async_url)
+    async with engine.begin() as connection:
+        for name in VARIANTS:
+            result = await run_variant(connection, name, rows, batch_size)
+            print(
+                f"{result['variant']:>14}: {result['rows_per_second']:>8} rows/s, "
+                f"pk index {result['pk_index_kb']} kB"
+            )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare random text keys with time-ordered native UUID keys."
+    )
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch_size))
@@ -15,6 +15,7 @@ from src.apps.products.routers.product_routers import product_router
 from src.apps.user.routers.address_routers import address_router
 from src.apps.user.routers.user_routers import user_router
 from src.apps.payments.routers import stripe_router, payment_router
+from src.core.cache import cache
 from src.core.exceptions import (
     AccountNotActivatedException,
     ActiveCartException,
@@ -34,11 +35,23 @@ from src.core.exceptions import (
     QuantityLowerThanAmountOfProductItemsInCartsException,
     ServiceException,
     PaymentAlreadyAccepted,
+    PasswordHashingUnavailableException,
     OrderCancelledException
 )
-from src.core.tasks import scheduler
+from src.core.hashing import password_hasher
+from src.core.instrumentation import instrument_sql_queries
+from src.core.registry import get_model_registry
+from src.core.responses import SchemaJSONResponse
+from src.core.tasks import (
+    refresh_autocomplete_index,
+    refresh_revocation_filter,
+    scheduler,
+)
+from src.database.db_connection import engine, replica_engines
+from src.settings.password import settings as password_settings
 
-app = FastAPI()
+app = FastAPI(default_response_class=SchemaJSONResponse)
+app.middleware("http")(instrument_sql_queries)
 
 
 root_router = APIRouter(prefix="/api")
@@ -61,6 +74,24 @@ root_router.include_router(payment_router)
 app.include_router(root_router)
 
 
+@app.on_event("startup")
+async def on_startup() -> None:
+    get_model_registry()
+    await refresh_autocomplete_index()
+    await refresh_revocation_filter()
+    scheduler.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    scheduler.shutdown(wait=False)
+    password_hasher.shutdown()
+    await cache.close()
+    await engine.dispose()
+    for replica_engine in replica_engines:
+        await replica_engine.dispose()
+
+
 @app.exception_handler(AuthJWTException)
 def handle_auth_jwt_exception(
     request: Request, exception: AuthJWTException
@@ -232,3 +263,14 @@ def handle_payment_already_accepted_exception(
     return JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exception)}
     )
+
+
+@app.exception_handler(PasswordHashingUnavailableException)
+def handle_password_hashing_unavailable_exception(
+    request: Request, exception: PasswordHashingUnavailableException
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exception)},
+        headers={"Retry-After": str(password_settings.PASSWORD_HASH_RETRY_AFTER)},
+    )
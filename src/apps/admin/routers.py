@@ -1,6 +1,6 @@
 from fastapi import Depends, Request, status
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.admin.services import (
     get_all_staff_users,
@@ -13,10 +13,13 @@ from src.apps.user.schemas import UserOutputSchema
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.permissions import check_if_staff, check_if_superuser
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_db, get_read_db
 from src.dependencies.user import authenticate_user
 
-admin_router = APIRouter(prefix="/admin", tags=["admin"])
+admin_router = APIRouter(
+    prefix="/admin", tags=["admin"], route_class=SchemaResponseRoute
+)
 
 
 @admin_router.get(
@@ -24,14 +27,14 @@ admin_router = APIRouter(prefix="/admin", tags=["admin"])
     response_model=PagedResponseSchema[UserOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_superusers(
+async def get_superusers(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[UserOutputSchema]:
     check_if_superuser(request_user)
-    return get_all_superusers(db, page_params, request.query_params.multi_items())
+    return await get_all_superusers(db, page_params, request.query_params.multi_items())
 
 
 @admin_router.get(
@@ -39,35 +42,37 @@ def get_superusers(
     response_model=PagedResponseSchema[UserOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_staff_users(
+async def get_staff_users(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[UserOutputSchema]:
     check_if_staff(request_user)
-    return get_all_staff_users(db, page_params, request.query_params.multi_items())
+    return await get_all_staff_users(
+        db, page_params, request.query_params.multi_items()
+    )
 
 
 @admin_router.patch(
     "/grant-staff-permissions/{user_id}", status_code=status.HTTP_200_OK
 )
-def grant_staff_status(
+async def grant_staff_status(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ):
     check_if_superuser(request_user)
-    return grant_staff_permissions(db, user_id)
+    return await grant_staff_permissions(db, user_id)
 
 
 @admin_router.patch(
     "/revoke-staff-permissions/{user_id}", status_code=status.HTTP_200_OK
 )
-def revoke_staff_status(
+async def revoke_staff_status(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ):
     check_if_superuser(request_user)
-    return revoke_staff_permissions(db, user_id)
+    return await revoke_staff_permissions(db, user_id)
@@ -2,27 +2,32 @@ from fastapi import BackgroundTasks, Depends, status
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRouter
 from fastapi_jwt_auth import AuthJWT
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.emails.schemas import EmailUpdateSchema
 from src.apps.emails.services import change_email_service, confirm_email_change_service
 from src.apps.user.models import User
 from src.apps.user.services.user_services import activate_account_service
+from src.core.responses import SchemaResponseRoute
 from src.dependencies.get_db import get_db
 from src.dependencies.user import authenticate_user
 
-email_router = APIRouter(prefix="/email", tags=["emails"])
+email_router = APIRouter(
+    prefix="/email", tags=["emails"], route_class=SchemaResponseRoute
+)
 
 
 @email_router.post("/change-email", status_code=status.HTTP_200_OK)
-def change_email(
+async def change_email(
     email_update_schema: EmailUpdateSchema,
     background_tasks: BackgroundTasks,
     request_user: User = Depends(authenticate_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     auth_jwt: AuthJWT = Depends(),
 ) -> JSONResponse:
-    change_email_service(email_update_schema, request_user.email, background_tasks, db)
+    await change_email_service(
+        email_update_schema, request_user.email, background_tasks, db
+    )
 
     return JSONResponse(
         status_code=status.HTTP_200_OK,
@@ -36,13 +41,13 @@ def change_email(
     "/confirm-email-change/{token}",
     status_code=status.HTTP_200_OK,
 )
-def confirm_email_change(
+async def confirm_email_change(
     token: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     auth_jwt: AuthJWT = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> JSONResponse:
-    confirm_email_change_service(db, token, request_user.email)
+    await confirm_email_change_service(db, token, request_user.email)
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content={"message": "Email updated successfully!"},
@@ -53,10 +58,10 @@ def confirm_email_change(
     "/confirm-account-activation/{token}",
     status_code=status.HTTP_200_OK,
 )
-def confirm_account_activation(
-    token: str, db: Session = Depends(get_db), auth_jwt: AuthJWT = Depends()
+async def confirm_account_activation(
+    token: str, db: AsyncSession = Depends(get_db), auth_jwt: AuthJWT = Depends()
 ) -> JSONResponse:
-    activate_account_service(db, token)
+    await activate_account_service(db, token)
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content={"message": "Account activated successfully!"},
@@ -2,12 +2,14 @@ from fastapi import BackgroundTasks
 from fastapi_mail import ConnectionConfig
 from pydantic import BaseSettings, EmailStr
 from sqlalchemy import update
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.emails.schemas import EmailSchema, EmailUpdateSchema
 from src.apps.jwt.schemas import ConfirmationTokenSchema
+from src.apps.jwt.services import revoke_subjects
 from src.apps.payments.schemas import PaymentAwaitSchema, PaymentConfirmationSchema
 from src.apps.user.models import User
+from src.apps.user.services.principal_services import invalidate_principal
 from src.core.exceptions import DoesNotExist, IsOccupied, ServiceException
 from src.core.utils.utils import (
     check_field_values,
@@ -24,7 +26,7 @@ def email_config(settings: BaseSettings = EmailSettings):
 
 
 def send_activation_email(
-    email: EmailStr, session: Session, background_tasks: BackgroundTasks
+    email: EmailStr, session: AsyncSession, background_tasks: BackgroundTasks
 ) -> None:
     email_schema = EmailSchema(
         email_subject="Activate your account",
@@ -37,7 +39,7 @@ def send_activation_email(
 
 
 def send_awaiting_for_payment_mail(
-    email: EmailStr, session: Session,
+    email: EmailStr, session: AsyncSession,
     background_tasks: BackgroundTasks, order_id: str
 ) -> None:
     email_schema = EmailSchema(
@@ -50,7 +52,7 @@ def send_awaiting_for_payment_mail(
 
 
 def send_payment_confirmaion_mail(
-    email: EmailStr, session: Session,
+    email: EmailStr, session: AsyncSession,
     background_tasks: BackgroundTasks, order_id: str
 ) -> None:
     email_schema = EmailSchema(
@@ -62,21 +64,23 @@ def send_payment_confirmaion_mail(
     send_email(email_schema, body_schema, background_tasks, settings=email_config())
 
 
-def validate_email_update_data(schema: EmailUpdateSchema, session: Session) -> None:
+async def validate_email_update_data(
+    schema: EmailUpdateSchema, session: AsyncSession
+) -> None:
     if schema.email == schema.new_email:
         raise ServiceException("The current email is the same as the desired one!")
 
-    if if_exists(User, "email", schema.new_email, session):
+    if await if_exists(User, "email", schema.new_email, session):
         raise IsOccupied(User.__name__, "email", schema.new_email)
 
 
-def send_email_change_confirmation_mail(
+async def send_email_change_confirmation_mail(
     update_schema: EmailUpdateSchema,
-    session: Session,
+    session: AsyncSession,
     token: str,
     background_tasks: BackgroundTasks,
 ) -> None:
-    validate_email_update_data(update_schema, session)
+    await validate_email_update_data(update_schema, session)
 
     email_schema = EmailSchema(
         email_subject="Confirm your email update",
@@ -87,11 +91,11 @@ def send_email_change_confirmation_mail(
     send_email(email_schema, body_schema, background_tasks, settings=email_config())
 
 
-def change_email_service(
+async def change_email_service(
     email_update_schema: EmailUpdateSchema,
     request_user_email: EmailStr,
     background_tasks: BackgroundTasks,
-    session: Session,
+    session: AsyncSession,
 ) -> None:
     check_field_values(
         request_user_email,
@@ -101,7 +105,7 @@ def change_email_service(
     token = generate_confirm_token(
         [email_update_schema.email, email_update_schema.new_email]
     )
-    send_email_change_confirmation_mail(
+    await send_email_change_confirmation_mail(
         email_update_schema,
         session,
         token,
@@ -109,10 +113,10 @@ def change_email_service(
     )
 
 
-def update_email(
-    session: Session, new_email: EmailStr, current_email: EmailStr
+async def update_email(
+    session: AsyncSession, new_email: EmailStr, current_email: EmailStr
 ) -> None:
-    user = if_exists(User, "email", current_email, session)
+    user = await if_exists(User, "email", current_email, session)
 
     if user is None:
         raise DoesNotExist(User.__name__, "email", current_email)
@@ -123,12 +127,14 @@ def update_email(
         )
 
     statement = update(User).filter(User.email == current_email).values(email=new_email)
-    session.execute(statement)
-    session.commit()
+    await session.execute(statement)
+    await revoke_subjects(session, current_email)
+    await session.commit()
+    await invalidate_principal(current_email, new_email)
 
 
-def confirm_email_change_service(
-    db: Session, token: str, request_user_email: EmailStr
+async def confirm_email_change_service(
+    db: AsyncSession, token: str, request_user_email: EmailStr
 ) -> None:
     emails = confirm_token(token)
     current_email, new_email = emails[0], emails[1]
@@ -138,4 +144,4 @@ def confirm_email_change_service(
         "Your email is different from the email requested to be changed!",
     )
 
-    update_email(db, new_email, current_email)
+    await update_email(db, new_email, current_email)
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, DateTime, String
+
+from src.database.db_connection import Base
+
+
+class RevokedSubject(Base):
+    __tablename__ = "revoked_subject"
+
+    subject = Column(String, primary_key=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
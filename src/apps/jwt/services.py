@@ -0,0 +1,93 @@
+import datetime
+from typing import Any, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.jwt.models import RevokedSubject
+from src.apps.user.schemas import UserPrincipalSchema
+from src.core.bloom import BloomFilter
+from src.core.utils.utils import get_current_time
+from src.settings.jwt_settings import settings
+
+PRINCIPAL_CLAIM = "principal"
+
+
+class RevocationFilter:
+    def __init__(self, size: int, hash_count: int):
+        self.size = size
+        self.hash_count = hash_count
+        self.bloom = BloomFilter(size, hash_count)
+        self.pending: set[str] = set()
+
+    def add(self, subject: str) -> None:
+        self.bloom.add(subject)
+        self.pending.add(subject)
+
+    def __contains__(self, subject: str) -> bool:
+        return subject in self.bloom
+
+    async def sync(self, session: AsyncSession) -> None:
+        # bloom filters cannot forget, so expired revocations are dropped by
+        # rebuilding from the table; subjects revoked locally while the query
+        # runs are carried over to the new filter
+        self.pending = set()
+        subjects = await session.scalars(
+            select(RevokedSubject.subject).filter(
+                RevokedSubject.expires_at > get_current_time()
+            )
+        )
+        bloom = BloomFilter(self.size, self.hash_count)
+        for subject in [*subjects, *self.pending]:
+            bloom.add(subject)
+        self.bloom = bloom
+
+
+revocation_filter = RevocationFilter(
+    settings.REVOCATION_FILTER_SIZE, settings.REVOCATION_FILTER_HASHES
+)
+
+
+def get_principal_claims(principal: UserPrincipalSchema) -> dict[str, Any]:
+    if not settings.STATELESS_TOKENS_ENABLED:
+        return {}
+    return {PRINCIPAL_CLAIM: principal.dict(exclude={"email"})}
+
+
+def get_claimed_principal(claims: dict[str, Any]) -> Optional[UserPrincipalSchema]:
+    if not settings.STATELESS_TOKENS_ENABLED or PRINCIPAL_CLAIM not in claims:
+        return None
+    # a positive answer may be a false one, which only costs a regular lookup
+    if claims["sub"] in revocation_filter:
+        return None
+    return UserPrincipalSchema(email=claims["sub"], **claims[PRINCIPAL_CLAIM])
+
+
+async def revoke_subjects(session: AsyncSession, *subjects: str) -> None:
+    if not settings.STATELESS_TOKENS_ENABLED or not subjects:
+        return
+
+    # every token carrying the old claims expires within the token lifetime
+    expires_at = get_current_time() + datetime.timedelta(
+        seconds=settings.STATELESS_TOKEN_TTL + settings.REVOCATION_SYNC_SECONDS
+    )
+    statement = insert(RevokedSubject).values(
+        [{"subject": subject, "expires_at": expires_at} for subject in subjects]
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[RevokedSubject.subject],
+            set_={"expires_at": statement.excluded.expires_at},
+        )
+    )
+    await session.execute(
+        delete(RevokedSubject).filter(RevokedSubject.expires_at <= get_current_time())
+    )
+    for subject in subjects:
+        revocation_filter.add(subject)
+
+
+async def sync_revocation_filter(session: AsyncSession) -> None:
+    if settings.STATELESS_TOKENS_ENABLED:
+        await revocation_filter.sync(session)
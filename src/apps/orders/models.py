@@ -1,8 +1,17 @@
-from sqlalchemy import DECIMAL, Boolean, Column, ForeignKey, Integer, String, Table
+from sqlalchemy import (
+    DECIMAL,
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.sql.sqltypes import DateTime
 
 from src.core.utils.utils import (
@@ -17,51 +26,80 @@ from src.database.db_connection import Base
 class Cart(Base):
     __tablename__ = "cart"
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     user_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("user.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
+        index=True,
     )
     cart_total_price = Column(DECIMAL, nullable=False, default=0)
+    updated_at = Column(
+        DateTime, nullable=False, default=get_current_time, onupdate=get_current_time
+    )
     user = relationship("User", back_populates="carts")
-    cart_items = relationship("CartItem", back_populates="cart")
+    cart_items = relationship(
+        "CartItem", back_populates="cart", order_by="CartItem.id"
+    )
 
 
 class CartItem(Base):
     __tablename__ = "cart_item"
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     cart_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("cart.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
+        index=True,
     )
     cart = relationship("Cart", back_populates="cart_items")
     product_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("product.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
+        index=True,
     )
     product = relationship("Product", back_populates="cart_items")
     quantity = Column(Integer, nullable=False, default=1)
     cart_item_price = Column(DECIMAL, nullable=False)
     cart_item_validity = Column(
-        DateTime, nullable=False, default=set_cart_item_validity
+        DateTime, nullable=False, default=set_cart_item_validity, index=True
     )
 
 
 class Order(Base):
     __tablename__ = "order"
+    __table_args__ = (
+        Index(
+            "ix_order_payment_deadline_awaiting_payment",
+            "payment_deadline",
+            postgresql_where=text("waiting_for_payment AND NOT cancelled"),
+        ),
+        Index("ix_order_created_at_id", "created_at", "id"),
+    )
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     user_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("user.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
+        index=True,
     )
     user = relationship("User", back_populates="orders")
     payment = relationship(
@@ -73,27 +111,38 @@ class Order(Base):
     being_delivered = Column(Boolean, nullable=False, server_default="false")
     received = Column(Boolean, nullable=False, server_default="false")
     cancelled = Column(Boolean, nullable=False, server_default="false")
-    order_items = relationship("OrderItem", back_populates="order")
+    order_items = relationship(
+        "OrderItem", back_populates="order", order_by="OrderItem.id"
+    )
     total_order_price = Column(DECIMAL, nullable=False, default=0)
     created_at = Column(DateTime, nullable=False, default=get_current_time)
+    updated_at = Column(
+        DateTime, nullable=False, default=get_current_time, onupdate=get_current_time
+    )
     payment_deadline = Column(DateTime, nullable=False, default=set_payment_deadline)
 
 
 class OrderItem(Base):
     __tablename__ = "order_item"
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     order_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("order.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
+        index=True,
     )
     order = relationship("Order", back_populates="order_items")
     product_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("product.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
+        index=True,
     )
     product = relationship("Product", back_populates="order_items")
     quantity = Column(Integer, nullable=False, default=0)
@@ -2,19 +2,22 @@ from typing import Union
 
 from fastapi import Depends, Request, Response, status
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.orders.routers.cart_routers import cart_router
 from src.apps.orders.schemas import (
     CartInputSchema,
     CartItemInputSchema,
     CartItemOutputSchema,
+    CartItemsInputSchema,
+    CartItemsOutputSchema,
     CartItemUpdateSchema,
     CartOutputSchema,
     UserCartItemOutputSchema,
 )
 from src.apps.orders.services.cart_items_services import (
     create_cart_item,
+    create_cart_items,
     delete_single_cart_item,
     get_all_cart_items_for_single_cart,
     get_single_cart_item,
@@ -25,10 +28,15 @@ from src.apps.user.models import User
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.permissions import check_if_owner, check_if_staff, check_if_staff_or_owner
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_db, get_read_db
 from src.dependencies.user import authenticate_user
 
-cart_items_router = APIRouter(prefix="/carts/{cart_id}/items", tags=["cart-items"])
+cart_items_router = APIRouter(
+    prefix="/carts/{cart_id}/items",
+    tags=["cart-items"],
+    route_class=SchemaResponseRoute,
+)
 
 
 @cart_items_router.post(
@@ -36,15 +44,31 @@ cart_items_router = APIRouter(prefix="/carts/{cart_id}/items", tags=["cart-items
     response_model=UserCartItemOutputSchema,
     status_code=status.HTTP_201_CREATED,
 )
-def post_cart_item(
+async def post_cart_item(
     cart_id: str,
     cart_item: CartItemInputSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> UserCartItemOutputSchema:
-    cart_check = get_single_cart(db, cart_id)
+    cart_check = await get_single_cart(db, cart_id)
+    check_if_staff_or_owner(request_user, "id", cart_check.user_id)
+    return await create_cart_item(db, cart_item, cart_id)
+
+
+@cart_items_router.post(
+    "/batch",
+    response_model=CartItemsOutputSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def post_cart_items(
+    cart_id: str,
+    cart_items: CartItemsInputSchema,
+    db: AsyncSession = Depends(get_db),
+    request_user: User = Depends(authenticate_user),
+) -> CartItemsOutputSchema:
+    cart_check = await get_single_cart(db, cart_id)
     check_if_staff_or_owner(request_user, "id", cart_check.user_id)
-    return create_cart_item(db, cart_item, cart_id)
+    return await create_cart_items(db, cart_items.items, cart_id)
 
 
 @cart_items_router.get(
@@ -52,17 +76,17 @@ def post_cart_item(
     response_model=Union[CartItemOutputSchema, UserCartItemOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_cart_item(
+async def get_cart_item(
     cart_id: str,
     cart_item_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> Union[CartItemOutputSchema, UserCartItemOutputSchema]:
-    db_cart = get_single_cart(db, cart_id)
+    db_cart = await get_single_cart(db, cart_id)
     if check_if_staff_or_owner(request_user, "id", db_cart.user_id):
         if request_user.is_staff:
-            return get_single_cart_item(db, cart_item_id, as_staff=True)
-        return get_single_cart_item(db, cart_item_id)
+            return await get_single_cart_item(db, cart_item_id, as_staff=True)
+        return await get_single_cart_item(db, cart_item_id)
 
 
 @cart_items_router.get(
@@ -73,27 +97,27 @@ def get_cart_item(
     ],
     status_code=status.HTTP_200_OK,
 )
-def get_cart_items_for_single_cart(
+async def get_cart_items_for_single_cart(
     request: Request,
     cart_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> Union[
     PagedResponseSchema[CartItemOutputSchema],
     PagedResponseSchema[UserCartItemOutputSchema],
 ]:
-    db_cart = get_single_cart(db, cart_id)
+    db_cart = await get_single_cart(db, cart_id)
     if check_if_staff_or_owner(request_user, "id", db_cart.user_id):
         if request_user.is_staff:
-            return get_all_cart_items_for_single_cart(
+            return await get_all_cart_items_for_single_cart(
                 db,
                 cart_id,
                 page_params,
                 request.query_params.multi_items(),
                 as_staff=True,
             )
-        return get_all_cart_items_for_single_cart(
+        return await get_all_cart_items_for_single_cart(
             db, cart_id, page_params, request.query_params.multi_items()
         )
 
@@ -103,29 +127,29 @@ def get_cart_items_for_single_cart(
     response_model=UserCartItemOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def update_single_cart_item(
+async def update_single_cart_item(
     cart_id: str,
     cart_item_id: str,
     cart_item_input: CartItemUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> UserCartItemOutputSchema:
-    cart_check = get_single_cart(db, cart_id)
+    cart_check = await get_single_cart(db, cart_id)
     check_if_staff_or_owner(request_user, "id", cart_check.user_id)
-    return update_cart_item(db, cart_item_input, cart_item_id, cart_id)
+    return await update_cart_item(db, cart_item_input, cart_item_id, cart_id)
 
 
 @cart_items_router.delete(
     "/{cart_item_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_cart_item(
+async def delete_cart_item(
     cart_id: str,
     cart_item_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> Response:
-    cart_check = get_single_cart(db, cart_id)
+    cart_check = await get_single_cart(db, cart_id)
     check_if_staff_or_owner(request_user, "id", cart_check.user_id)
-    delete_single_cart_item(db, cart_id, cart_item_id)
+    await delete_single_cart_item(db, cart_id, cart_item_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,7 +2,7 @@ from typing import Union
 
 from fastapi import Depends, Request, Response, status
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.orders.schemas import OrderItemOutputSchema, UserOrderItemOutputSchema
 from src.apps.orders.services.order_items_services import (
@@ -14,10 +14,15 @@ from src.apps.user.models import User
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.permissions import check_if_staff, check_if_staff_or_owner
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_read_db
 from src.dependencies.user import authenticate_user
 
-order_items_router = APIRouter(prefix="/orders/{order_id}/items", tags=["order-items"])
+order_items_router = APIRouter(
+    prefix="/orders/{order_id}/items",
+    tags=["order-items"],
+    route_class=SchemaResponseRoute,
+)
 
 
 @order_items_router.get(
@@ -25,17 +30,17 @@ order_items_router = APIRouter(prefix="/orders/{order_id}/items", tags=["order-i
     response_model=Union[OrderItemOutputSchema, UserOrderItemOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_order_item(
+async def get_order_item(
     order_id: str,
     order_item_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> Union[OrderItemOutputSchema, UserOrderItemOutputSchema]:
-    db_order = get_single_order(db, order_id)
+    db_order = await get_single_order(db, order_id)
     if check_if_staff_or_owner(request_user, "id", db_order.user_id):
         if request_user.is_staff:
-            return get_single_order_item(db, order_item_id, as_staff=True)
-        return get_single_order_item(db, order_item_id)
+            return await get_single_order_item(db, order_item_id, as_staff=True)
+        return await get_single_order_item(db, order_item_id)
 
 
 @order_items_router.get(
@@ -43,15 +48,15 @@ def get_order_item(
     response_model=PagedResponseSchema[UserOrderItemOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_order_items_for_single_order(
+async def get_order_items_for_single_order(
     request: Request,
     order_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[UserOrderItemOutputSchema]:
-    order_check = get_single_order(db, order_id)
+    order_check = await get_single_order(db, order_id)
     check_if_staff_or_owner(request_user, "id", order_check.user_id)
-    return get_all_order_items_for_single_order(
+    return await get_all_order_items_for_single_order(
         db, order_id, page_params, request.query_params.multi_items()
     )
@@ -2,7 +2,7 @@ from datetime import date, datetime, time
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 
 from src.apps.products.schemas import (
     ProductOutputSchema,
@@ -56,6 +56,22 @@ class CartItemOutputSchema(BaseCartItemOutputSchema):
         orm_mode = True
 
 
+class CartItemsInputSchema(BaseModel):
+    items: list[CartItemInputSchema] = Field(min_items=1, max_items=100)
+
+
+class CartItemResultSchema(BaseModel):
+    product_id: str
+    quantity: int
+    cart_item: Optional[UserCartItemOutputSchema]
+    error: Optional[str]
+
+
+class CartItemsOutputSchema(BaseModel):
+    cart_total_price: Decimal
+    results: list[CartItemResultSchema]
+
+
 class CartBaseSchema(BaseModel):
     user_id: str
 
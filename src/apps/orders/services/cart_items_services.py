@@ -2,26 +2,37 @@ import datetime
 from typing import Union
 
 from sqlalchemy import delete, insert, select, update
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.orders.models import Cart, CartItem
 from src.apps.orders.schemas import (
     CartItemInputSchema,
     CartItemOutputSchema,
+    CartItemResultSchema,
+    CartItemsOutputSchema,
     CartItemUpdateSchema,
     UserCartItemOutputSchema,
 )
-from src.apps.products.models import Product
+from src.apps.products.models import Product, ProductInventory
+from src.apps.products.schemas import ProductWithoutInventoryOutputSchema
+from src.apps.products.services.inventory_services import (
+    get_available_quantity,
+    reserve_quantities_for_cart_items,
+    reserve_quantity_for_cart_items,
+)
 from src.apps.user.models import User
+from src.core.eager_loading import get_eager_load_options
 from src.core.exceptions import (
     ActiveCartException,
     CartItemWithZeroQuantityException,
     DoesNotExist,
+    DuplicatedCartItemException,
     EmptyCartException,
     ExceededItemQuantityException,
     NonPositiveCartItemQuantityException,
     NoSuchItemInCartException,
     ProductRemovedFromStoreException,
+    ReservationConflictException,
     ServiceException,
 )
 from src.core.pagination.models import PageParams
@@ -31,43 +42,72 @@ from src.core.utils.utils import (
     calculate_item_price,
     filter_and_sort_instances,
     if_exists,
-    set_cart_item_validity,
-    validate_item_quantity,
+    is_valid_uuid,
+    serialize_instance,
+    serialize_instances,
 )
 
+MAX_ITEM_QUANTITY = 2**31 - 1
+
+
+async def check_if_cart_has_items(session: AsyncSession, cart_id: str) -> bool:
+    return bool(
+        await session.scalar(
+            select(CartItem.id).filter(CartItem.cart_id == cart_id).limit(1)
+        )
+    )
+
+
+async def reserve_cart_item_quantity(
+    session: AsyncSession,
+    product_id: str,
+    requested_quantity: int,
+    item_quantity_in_cart: int = 0,
+) -> None:
+    # a failed reservation rolls back the cart writes of the same request,
+    # whether or not they were already flushed
+    if requested_quantity <= MAX_ITEM_QUANTITY:
+        remaining_quantity = await reserve_quantity_for_cart_items(
+            session, product_id, requested_quantity - item_quantity_in_cart
+        )
+        if remaining_quantity is not None:
+            return
+
+    await session.rollback()
+    available_quantity = await session.scalar(
+        select(get_available_quantity()).filter(
+            ProductInventory.product_id == product_id
+        )
+    )
+    raise ExceededItemQuantityException(
+        (available_quantity or 0) + item_quantity_in_cart, requested_quantity
+    )
+
 
-def create_cart_item(
-    session: Session, cart_item: CartItemInputSchema, cart_id: str
+async def create_cart_item(
+    session: AsyncSession, cart_item: CartItemInputSchema, cart_id: str
 ) -> UserCartItemOutputSchema:
-    if not (cart_object := if_exists(Cart, "id", cart_id, session)):
+    if not (cart_object := await if_exists(Cart, "id", cart_id, session)):
         raise DoesNotExist(Cart.__name__, "id", cart_id)
 
     cart_item_data = cart_item.dict()
     product_id = cart_item_data.get("product_id")
     requested_quantity = cart_item_data.get("quantity")
 
-    if not (product_object := if_exists(Product, "id", product_id, session)):
+    if not (product_object := await if_exists(Product, "id", product_id, session)):
         raise DoesNotExist(Product.__name__, "id", product_id)
 
     if product_object.removed_from_store:
         raise ProductRemovedFromStoreException
 
-    item_in_cart_check = session.scalar(
+    item_in_cart_check = await session.scalar(
         select(CartItem)
         .filter(CartItem.cart_id == cart_id, CartItem.product_id == product_id)
         .limit(1)
     )
 
-    available_quantity = product_object.inventory.quantity_for_cart_items
-
-    if item_quantity_in_cart := getattr(item_in_cart_check, "quantity", False):
-        available_quantity += item_quantity_in_cart
-
-    if not validate_item_quantity(available_quantity, requested_quantity):
-        raise ExceededItemQuantityException(available_quantity, requested_quantity)
-
     if new_cart_item := item_in_cart_check:
-        update_single_cart_item(
+        await update_single_cart_item(
             session, new_cart_item, cart_object, product_object, requested_quantity
         )
 
@@ -79,40 +119,177 @@ def create_cart_item(
         cart_object.cart_total_price += cart_item_price
         session.add(cart_object)
 
-        product_object.inventory.quantity_for_cart_items -= requested_quantity
-
-        session.add(product_object)
-
         cart_item_data["cart_item_price"] = cart_item_price
         cart_item_data["cart_id"] = cart_id
 
         new_cart_item = CartItem(**cart_item_data)
         session.add(new_cart_item)
-        session.commit()
+        await reserve_cart_item_quantity(session, product_id, requested_quantity)
+        await session.commit()
+
+    return await serialize_instance(session, UserCartItemOutputSchema, new_cart_item)
+
+
+async def create_cart_items(
+    session: AsyncSession, cart_items: list[CartItemInputSchema], cart_id: str
+) -> CartItemsOutputSchema:
+    product_ids = {
+        cart_item.product_id
+        for cart_item in cart_items
+        if is_valid_uuid(cart_item.product_id)
+    }
+    products, items_in_cart = {}, {}
+    if product_ids:
+        products = {
+            product.id: (product, available_quantity or 0)
+            for product, available_quantity in await session.execute(
+                select(Product, get_available_quantity())
+                .outerjoin(Product.inventory)
+                .filter(Product.id.in_(product_ids))
+                .options(
+                    *get_eager_load_options(
+                        Product, ProductWithoutInventoryOutputSchema
+                    )
+                )
+            )
+        }
+        items_in_cart = {
+            cart_item.product_id: cart_item
+            for cart_item in await session.scalars(
+                select(CartItem).filter(
+                    CartItem.cart_id == cart_id, CartItem.product_id.in_(product_ids)
+                )
+            )
+        }
+
+    def get_quantity_in_cart(product_id: str) -> int:
+        cart_item = items_in_cart.get(product_id)
+        return cart_item.quantity if cart_item else 0
+
+    errors: dict[int, ServiceException] = {}
+    requested_items: dict[str, tuple[int, int]] = {}
+    for index, cart_item in enumerate(cart_items):
+        product_id, requested_quantity = cart_item.product_id, cart_item.quantity
+        if product_id in requested_items:
+            errors[index] = DuplicatedCartItemException()
+        elif product_id not in products:
+            errors[index] = DoesNotExist(Product.__name__, "id", product_id)
+        elif products[product_id][0].removed_from_store:
+            errors[index] = ProductRemovedFromStoreException()
+        elif requested_quantity == 0:
+            errors[index] = NonPositiveCartItemQuantityException()
+        else:
+            requested_items[product_id] = (index, requested_quantity)
+            if requested_quantity > MAX_ITEM_QUANTITY:
+                errors[index] = ExceededItemQuantityException(
+                    products[product_id][1] + get_quantity_in_cart(product_id),
+                    requested_quantity,
+                )
+
+    remaining_quantities = await reserve_quantities_for_cart_items(
+        session,
+        {
+            product_id: requested_quantity - get_quantity_in_cart(product_id)
+            for product_id, (index, requested_quantity) in requested_items.items()
+            if index not in errors
+        },
+    )
 
-    return UserCartItemOutputSchema.from_orm(new_cart_item)
+    saved_items: dict[int, CartItem] = {}
+    price_difference = 0
+    for product_id, (index, requested_quantity) in requested_items.items():
+        if index in errors:
+            continue
+        product, available_quantity = products[product_id]
+        if product_id not in remaining_quantities:
+            errors[index] = ExceededItemQuantityException(
+                available_quantity + get_quantity_in_cart(product_id),
+                requested_quantity,
+            )
+            continue
+        if remaining_quantities[product_id] is None:
+            errors[index] = ReservationConflictException()
+            continue
+
+        cart_item_price = calculate_item_price(requested_quantity, product.price)
+        if cart_item := items_in_cart.get(product_id):
+            price_difference += cart_item_price - cart_item.cart_item_price
+            cart_item.quantity = requested_quantity
+            cart_item.cart_item_price = cart_item_price
+        else:
+            cart_item = CartItem(
+                cart_id=cart_id,
+                product_id=product_id,
+                quantity=requested_quantity,
+                cart_item_price=cart_item_price,
+            )
+            price_difference += cart_item_price
+        session.add(cart_item)
+        saved_items[index] = cart_item
+
+    statement = select(Cart.cart_total_price).filter(Cart.id == cart_id)
+    if saved_items:
+        statement = (
+            update(Cart)
+            .filter(Cart.id == cart_id)
+            .values(cart_total_price=Cart.cart_total_price + price_difference)
+            .returning(Cart.cart_total_price)
+            .execution_options(synchronize_session=False)
+        )
+    if (cart_total_price := await session.scalar(statement)) is None:
+        await session.rollback()
+        raise DoesNotExist(Cart.__name__, "id", cart_id)
+    await session.commit()
+
+    serialized_items = dict(
+        zip(
+            saved_items,
+            await serialize_instances(
+                session, UserCartItemOutputSchema, list(saved_items.values())
+            ),
+        )
+    )
+    return CartItemsOutputSchema(
+        cart_total_price=cart_total_price,
+        results=[
+            CartItemResultSchema(
+                product_id=cart_item.product_id,
+                quantity=cart_item.quantity,
+                cart_item=serialized_items.get(index),
+                error=str(errors[index]) if index in errors else None,
+            )
+            for index, cart_item in enumerate(cart_items)
+        ],
+    )
 
 
-def get_single_cart_item(
-    session: Session, cart_item_id: int, as_staff: bool = False
+async def get_single_cart_item(
+    session: AsyncSession, cart_item_id: int, as_staff: bool = False
 ) -> Union[CartItemOutputSchema, UserCartItemOutputSchema]:
-    if not (cart_item_object := if_exists(CartItem, "id", cart_item_id, session)):
+    schema = CartItemOutputSchema if as_staff else UserCartItemOutputSchema
+    if not (
+        cart_item_object := await if_exists(
+            CartItem,
+            "id",
+            cart_item_id,
+            session,
+            options=get_eager_load_options(CartItem, schema),
+        )
+    ):
         raise DoesNotExist(CartItem.__name__, "id", cart_item_id)
 
-    if as_staff:
-        return CartItemOutputSchema.from_orm(cart_item_object)
-    return UserCartItemOutputSchema.from_orm(cart_item_object)
+    return await serialize_instance(session, schema, cart_item_object)
 
 
-def get_all_cart_items(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_all_cart_items(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema[CartItemOutputSchema]:
-    query = select(CartItem).join(Product, CartItem.product_id == Product.id)
+    query = select(CartItem)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, CartItem)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=CartItemOutputSchema,
         table=CartItem,
@@ -121,8 +298,8 @@ def get_all_cart_items(
     )
 
 
-def get_all_cart_items_for_single_cart(
-    session: Session,
+async def get_all_cart_items_for_single_cart(
+    session: AsyncSession,
     cart_id: str,
     page_params: PageParams,
     query_params: list[tuple] = None,
@@ -135,16 +312,12 @@ def get_all_cart_items_for_single_cart(
     if as_staff:
         schema = CartItemOutputSchema
 
-    query = (
-        select(CartItem)
-        .join(Product, CartItem.product_id == Product.id)
-        .filter(CartItem.cart_id == cart_id)
-    )
+    query = select(CartItem).filter(CartItem.cart_id == cart_id)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, CartItem)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=schema,
         table=CartItem,
@@ -153,8 +326,8 @@ def get_all_cart_items_for_single_cart(
     )
 
 
-def update_single_cart_item(
-    session: Session,
+async def update_single_cart_item(
+    session: AsyncSession,
     cart_item: CartItem,
     cart: Cart,
     product: Product,
@@ -164,17 +337,16 @@ def update_single_cart_item(
         cart.cart_total_price -= cart_item.cart_item_price
         session.add(cart)
 
-        product.inventory.quantity_for_cart_items += cart_item.quantity
-        session.add(product)
+        await reserve_quantity_for_cart_items(session, product.id, -cart_item.quantity)
 
         statement = delete(CartItem).filter(CartItem.id == cart_item.id)
-        session.execute(statement)
-        session.commit()
+        await session.execute(statement)
+        await session.commit()
 
-        if not cart.cart_items:
+        if not await check_if_cart_has_items(session, cart.id):
             statement = delete(Cart).filter(Cart.id == cart.id)
-            session.execute(statement)
-            session.commit()
+            await session.execute(statement)
+            await session.commit()
             raise EmptyCartException()
 
         raise CartItemWithZeroQuantityException()
@@ -186,29 +358,29 @@ def update_single_cart_item(
     cart.cart_total_price -= price_difference
     session.add(cart)
 
-    quantity_difference = cart_item.quantity - requested_quantity
-    product.inventory.quantity_for_cart_items += quantity_difference
-    session.add(product)
-
+    item_quantity_in_cart = cart_item.quantity
     cart_item.quantity = requested_quantity
     cart_item.cart_item_price = new_item_price
     session.add(cart_item)
-    session.commit()
+    await reserve_cart_item_quantity(
+        session, product.id, requested_quantity, item_quantity_in_cart
+    )
+    await session.commit()
 
 
-def update_cart_item(
-    session: Session,
+async def update_cart_item(
+    session: AsyncSession,
     cart_item_input: CartItemUpdateSchema,
     cart_item_id: str,
     cart_id: str,
 ) -> UserCartItemOutputSchema:
-    if not (cart_item_object := if_exists(CartItem, "id", cart_item_id, session)):
+    if not (cart_item_object := await if_exists(CartItem, "id", cart_item_id, session)):
         raise DoesNotExist(CartItem.__name__, "id", cart_item_id)
 
-    if not (cart_object := if_exists(Cart, "id", cart_id, session)):
+    if not (cart_object := await if_exists(Cart, "id", cart_id, session)):
         raise DoesNotExist(Cart.__name__, "id", cart_id)
 
-    item_in_cart_check = session.scalar(
+    item_in_cart_check = await session.scalar(
         select(CartItem)
         .filter(CartItem.id == cart_item_id, CartItem.cart_id == cart_id)
         .limit(1)
@@ -218,9 +390,11 @@ def update_cart_item(
         raise NoSuchItemInCartException
 
     if not (
-        product_object := if_exists(Product, "id", new_cart_item.product.id, session)
+        product_object := await if_exists(
+            Product, "id", new_cart_item.product_id, session
+        )
     ):
-        raise DoesNotExist(Product.__name__, "id", new_cart_item.product.id)
+        raise DoesNotExist(Product.__name__, "id", new_cart_item.product_id)
 
     if product_object.removed_from_store:
         raise ProductRemovedFromStoreException
@@ -228,55 +402,41 @@ def update_cart_item(
     cart_item_data = cart_item_input.dict()
     requested_quantity = cart_item_data.get("quantity")
 
-    available_quantity = product_object.inventory.quantity_for_cart_items
-
-    if item_quantity_in_cart := getattr(item_in_cart_check, "quantity", False):
-        available_quantity += item_quantity_in_cart
-
-    if not validate_item_quantity(available_quantity, requested_quantity):
-        raise ExceededItemQuantityException(available_quantity, requested_quantity)
-
-    update_single_cart_item(
+    await update_single_cart_item(
         session, cart_item_object, cart_object, product_object, requested_quantity
     )
 
-    return get_single_cart_item(session, cart_item_id)
+    return await get_single_cart_item(session, cart_item_id)
 
 
-def delete_single_cart_item(
-    session: Session, cart_id: str, cart_item_id: str, cart_removing: bool = False
+async def delete_single_cart_item(
+    session: AsyncSession, cart_id: str, cart_item_id: str, cart_removing: bool = False
 ):
-    if not (cart_object := if_exists(Cart, "id", cart_id, session)):
+    if not (cart_object := await if_exists(Cart, "id", cart_id, session)):
         raise DoesNotExist(Cart.__name__, "id", cart_id)
 
-    cart_item_object = session.scalar(
+    cart_item_object = is_valid_uuid(cart_item_id) and await session.scalar(
         select(CartItem)
         .filter(CartItem.id == cart_item_id, CartItem.cart_id == cart_id)
         .limit(1)
     )
 
     if cart_item_object:
-        if not (
-            product_object := if_exists(
-                Product, "id", cart_item_object.product.id, session
-            )
-        ):
-            raise DoesNotExist(Product.__name__, "id", cart_item_object.product.id)
-
         cart_object.cart_total_price -= cart_item_object.cart_item_price
         session.add(cart_object)
 
-        product_object.inventory.quantity_for_cart_items += cart_item_object.quantity
-        session.add(product_object)
+        await reserve_quantity_for_cart_items(
+            session, cart_item_object.product_id, -cart_item_object.quantity
+        )
 
         statement = delete(CartItem).filter(CartItem.id == cart_item_id)
-        result = session.execute(statement)
-        session.commit()
+        result = await session.execute(statement)
+        await session.commit()
 
-        if not cart_object.cart_items:
+        if not await check_if_cart_has_items(session, cart_object.id):
             statement = delete(Cart).filter(Cart.id == cart_object.id)
-            session.execute(statement)
-            session.commit()
+            await session.execute(statement)
+            await session.commit()
             if cart_removing:
                 return
             raise EmptyCartException()
@@ -285,26 +445,26 @@ def delete_single_cart_item(
     raise DoesNotExist(CartItem.__name__, "id", cart_item_id)
 
 
-def delete_specific_cart_items(
-    session: Session, statement, cart_removing: bool = False
+async def delete_specific_cart_items(
+    session: AsyncSession, statement, cart_removing: bool = False
 ) -> None:
-    cart_items_to_delete = session.scalars(statement).unique().all()
+    cart_items_to_delete = (await session.scalars(statement)).unique().all()
 
-    [
-        delete_single_cart_item(session, cart_item.cart_id, cart_item.id, cart_removing)
-        for cart_item in cart_items_to_delete
-    ]
+    for cart_item in cart_items_to_delete:
+        await delete_single_cart_item(
+            session, cart_item.cart_id, cart_item.id, cart_removing
+        )
 
 
-def delete_invalid_cart_items(session: Session) -> None:
+async def delete_invalid_cart_items(session: AsyncSession) -> None:
     statement = select(CartItem).filter(
         CartItem.cart_item_validity < datetime.datetime.now()
     )
-    delete_specific_cart_items(session, statement=statement)
+    await delete_specific_cart_items(session, statement=statement)
 
 
-def delete_cart_items_with_product_removed_from_store(
-    session: Session, product_id: str
+async def delete_cart_items_with_product_removed_from_store(
+    session: AsyncSession, product_id: str
 ) -> None:
     statement = select(CartItem).filter(CartItem.product_id == product_id)
-    delete_specific_cart_items(session, statement=statement, cart_removing=True)
+    await delete_specific_cart_items(session, statement=statement, cart_removing=True)
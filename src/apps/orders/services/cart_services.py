@@ -1,7 +1,9 @@
 from typing import Union
 
-from sqlalchemy import delete, insert, select, update
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
 from src.apps.orders.models import Cart, CartItem
 from src.apps.orders.schemas import (
@@ -11,17 +13,32 @@ from src.apps.orders.schemas import (
     UserCartOutputSchema,
 )
 from src.apps.orders.services.cart_items_services import delete_single_cart_item
-from src.apps.products.models import Product
+from src.apps.products.models import (
+    Category,
+    Product,
+    category_product_association_table,
+)
 from src.apps.user.models import User
+from src.core.conditional import Validators, get_validators
+from src.core.eager_loading import get_eager_load_options
 from src.core.exceptions import ActiveCartException, DoesNotExist, ServiceException
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.pagination.services import paginate
-from src.core.utils.utils import filter_and_sort_instances, if_exists
+from src.core.utils.utils import (
+    filter_and_sort_instances,
+    if_exists,
+    is_valid_uuid,
+    serialize_instance,
+)
 
 
-def create_cart(session: Session, user_id: str) -> UserCartOutputSchema:
-    if not (user_object := if_exists(User, "id", user_id, session)):
+async def create_cart(session: AsyncSession, user_id: str) -> UserCartOutputSchema:
+    if not (
+        user_object := await if_exists(
+            User, "id", user_id, session, options=[selectinload(User.carts)]
+        )
+    ):
         raise DoesNotExist(User.__name__, "id", user_id)
 
     if user_object.carts:
@@ -29,34 +46,83 @@ def create_cart(session: Session, user_id: str) -> UserCartOutputSchema:
 
     new_cart = Cart(user_id=user_id)
     session.add(new_cart)
-    session.commit()
+    await session.commit()
 
-    return UserCartOutputSchema.from_orm(new_cart)
+    return await serialize_instance(session, UserCartOutputSchema, new_cart)
 
 
-def get_single_cart(
-    session: Session, cart_id: int, as_staff: bool = False
+async def get_single_cart(
+    session: AsyncSession, cart_id: int, as_staff: bool = False
 ) -> Union[CartOutputSchema, UserCartOutputSchema]:
-    if not (cart_object := if_exists(Cart, "id", cart_id, session)):
+    schema = CartOutputSchema if as_staff else UserCartOutputSchema
+    if not (
+        cart_object := await if_exists(
+            Cart, "id", cart_id, session, options=get_eager_load_options(Cart, schema)
+        )
+    ):
         raise DoesNotExist(Cart.__name__, "id", cart_id)
 
-    if not (user_object := if_exists(User, "id", cart_object.user_id, session)):
+    if not (user_object := await if_exists(User, "id", cart_object.user_id, session)):
         raise DoesNotExist(User.__name__, "user_id", cart_object.user_id)
 
-    if as_staff:
-        return CartOutputSchema.from_orm(cart_object)
-    return UserCartOutputSchema.from_orm(cart_object)
+    return await serialize_instance(session, schema, cart_object)
 
 
-def get_all_carts(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_cart_validators(
+    session: AsyncSession, cart_id: str
+) -> tuple[str, Validators]:
+    if not is_valid_uuid(cart_id):
+        raise DoesNotExist(Cart.__name__, "id", cart_id)
+    row = (
+        await session.execute(
+            select(
+                Cart.user_id,
+                Cart.updated_at,
+                func.count(CartItem.id.distinct()),
+                func.max(CartItem.cart_item_validity),
+                func.max(Product.updated_at),
+                func.max(Category.updated_at),
+                func.array_agg(aggregate_order_by(Category.id.distinct(), Category.id)),
+            )
+            .outerjoin(CartItem, CartItem.cart_id == Cart.id)
+            .outerjoin(Product, Product.id == CartItem.product_id)
+            .outerjoin(
+                category_product_association_table,
+                category_product_association_table.c.product_id == Product.id,
+            )
+            .outerjoin(
+                Category,
+                Category.id == category_product_association_table.c.category_id,
+            )
+            .filter(Cart.id == cart_id)
+            .group_by(Cart.id)
+        )
+    ).first()
+    if row is None:
+        raise DoesNotExist(Cart.__name__, "id", cart_id)
+
+    user_id, updated_at, items_count, items_validity, *related_versions = row
+    # cart item validity lies in the future, so it is passed as text to keep
+    # it in the etag without moving Last-Modified
+    return user_id, get_validators(
+        Cart.__name__,
+        cart_id,
+        updated_at,
+        *related_versions,
+        items_count,
+        str(items_validity),
+    )
+
+
+async def get_all_carts(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema[CartOutputSchema]:
-    query = select(Cart).join(User, Cart.user_id == User.id)
+    query = select(Cart)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, Cart)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=CartOutputSchema,
         table=Cart,
@@ -65,17 +131,17 @@ def get_all_carts(
     )
 
 
-def get_all_user_carts(
-    session: Session,
+async def get_all_user_carts(
+    session: AsyncSession,
     user_id: int,
     page_params: PageParams,
     query_params: list[tuple] = None,
 ) -> PagedResponseSchema[UserCartOutputSchema]:
-    query = select(Cart).join(User, Cart.user_id == User.id).filter(User.id == user_id)
+    query = select(Cart).filter(Cart.user_id == user_id)
     if query_params:
         query = filter_and_sort_instances(query_params, query, Cart)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=UserCartOutputSchema,
         table=Cart,
@@ -84,18 +150,21 @@ def get_all_user_carts(
     )
 
 
-def delete_single_cart(session: Session, cart_id: int):
-    if not (cart_object := if_exists(Cart, "id", cart_id, session)):
+async def delete_single_cart(session: AsyncSession, cart_id: int):
+    if not (
+        cart_object := await if_exists(
+            Cart, "id", cart_id, session, options=[selectinload(Cart.cart_items)]
+        )
+    ):
         raise DoesNotExist(Cart.__name__, "id", cart_id)
 
-    [
-        delete_single_cart_item(
+    for cart_item in cart_object.cart_items:
+        await delete_single_cart_item(
             session, cart_object.id, cart_item.id, cart_removing=True
         )
-        for cart_item in cart_object.cart_items
-    ]
+
     statement = delete(Cart).filter(Cart.id == cart_id)
-    result = session.execute(statement)
-    session.commit()
+    result = await session.execute(statement)
+    await session.commit()
 
     return result
@@ -1,11 +1,13 @@
 from typing import Union
 
 from sqlalchemy import delete, insert, select, update
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.apps.orders.models import Order, OrderItem
 from src.apps.orders.schemas import OrderItemOutputSchema, UserOrderItemOutputSchema
 from src.apps.products.models import Product
+from src.core.eager_loading import get_eager_load_options
 from src.core.exceptions import DoesNotExist, EmptyCartException, ServiceException
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
@@ -13,17 +15,26 @@ from src.core.pagination.services import paginate
 from src.core.utils.utils import (
     filter_and_sort_instances,
     if_exists,
+    serialize_instance,
     validate_item_quantity,
 )
 
 
-def create_order_items(session: Session, order: Order, cart_items: list[OrderItem]):
+async def create_order_items(
+    session: AsyncSession, order: Order, cart_items: list[OrderItem]
+):
     if not cart_items:
         raise EmptyCartException
 
     for cart_item in cart_items:
         if not (
-            product_object := if_exists(Product, "id", cart_item.product_id, session)
+            product_object := await if_exists(
+                Product,
+                "id",
+                cart_item.product_id,
+                session,
+                options=[selectinload(Product.inventory)],
+            )
         ):
             raise DoesNotExist(Product.__name__, "id", cart_item.product_id)
 
@@ -43,30 +54,37 @@ def create_order_items(session: Session, order: Order, cart_items: list[OrderIte
         session.add(new_order_item)
 
     session.add(order)
-    session.commit()
+    await session.commit()
     return
 
 
-def get_single_order_item(
-    session: Session, order_item_id: str, as_staff: bool = False
+async def get_single_order_item(
+    session: AsyncSession, order_item_id: str, as_staff: bool = False
 ) -> Union[UserOrderItemOutputSchema, OrderItemOutputSchema]:
-    if not (order_item_object := if_exists(OrderItem, "id", order_item_id, session)):
+    schema = OrderItemOutputSchema if as_staff else UserOrderItemOutputSchema
+    if not (
+        order_item_object := await if_exists(
+            OrderItem,
+            "id",
+            order_item_id,
+            session,
+            options=get_eager_load_options(OrderItem, schema),
+        )
+    ):
         raise DoesNotExist(OrderItem.__name__, "id", order_item_id)
 
-    if as_staff:
-        return OrderItemOutputSchema.from_orm(order_item_object)
-    return UserOrderItemOutputSchema.from_orm(order_item_object)
+    return await serialize_instance(session, schema, order_item_object)
 
 
-def get_all_order_items(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_all_order_items(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema[OrderItemOutputSchema]:
-    query = select(OrderItem).join(Product, OrderItem.product_id == Product.id)
+    query = select(OrderItem)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, OrderItem)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=OrderItemOutputSchema,
         table=OrderItem,
@@ -75,22 +93,18 @@ def get_all_order_items(
     )
 
 
-def get_all_order_items_for_single_order(
-    session: Session,
+async def get_all_order_items_for_single_order(
+    session: AsyncSession,
     order_id: str,
     page_params: PageParams,
     query_params: list[tuple] = None,
 ) -> PagedResponseSchema[UserOrderItemOutputSchema]:
-    query = (
-        select(OrderItem)
-        .join(Product, OrderItem.product_id == Product.id)
-        .filter(OrderItem.order_id == order_id)
-    )
+    query = select(OrderItem).filter(OrderItem.order_id == order_id)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, OrderItem)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=UserOrderItemOutputSchema,
         table=OrderItem,
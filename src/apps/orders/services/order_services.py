@@ -2,14 +2,16 @@ import datetime
 from typing import Union
 
 from fastapi import BackgroundTasks
-from sqlalchemy import delete, insert, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.apps.emails.services import (
     send_awaiting_for_payment_mail,
     send_payment_confirmaion_mail,
 )
-from src.apps.orders.models import Cart, Order
+from src.apps.orders.models import Cart, Order, OrderItem
 from src.apps.orders.schemas import (
     OrderItemOutputSchema,
     OrderOutputSchema,
@@ -18,8 +20,18 @@ from src.apps.orders.schemas import (
 from src.apps.orders.services.order_items_services import create_order_items
 from src.apps.payments.models import Payment
 from src.apps.payments.schemas import PaymentOutputSchema
-from src.apps.products.models import Product
+from src.apps.products.models import (
+    Category,
+    Product,
+    category_product_association_table,
+)
+from src.apps.products.services.inventory_services import (
+    record_sold_quantity,
+    reserve_quantity_for_cart_items,
+)
 from src.apps.user.models import User
+from src.core.conditional import Validators, get_validators
+from src.core.eager_loading import get_eager_load_options
 from src.core.exceptions import (
     DoesNotExist,
     EmptyCartException,
@@ -30,16 +42,25 @@ from src.core.exceptions import (
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.pagination.services import paginate
-from src.core.utils.utils import filter_and_sort_instances, if_exists
+from src.core.utils.utils import (
+    filter_and_sort_instances,
+    if_exists,
+    is_valid_uuid,
+    serialize_instance,
+)
 
 
-def create_order(
-    session: Session, user_id: str, cart_id: str, background_tasks: BackgroundTasks
+async def create_order(
+    session: AsyncSession, user_id: str, cart_id: str, background_tasks: BackgroundTasks
 ) -> UserOrderOutputSchema:
-    if not (user_object := if_exists(User, "id", user_id, session)):
+    if not (user_object := await if_exists(User, "id", user_id, session)):
         raise DoesNotExist(User.__name__, "id", user_id)
 
-    if not (cart_object := if_exists(Cart, "id", cart_id, session)):
+    if not (
+        cart_object := await if_exists(
+            Cart, "id", cart_id, session, options=[selectinload(Cart.cart_items)]
+        )
+    ):
         raise DoesNotExist(Cart.__name__, "id", cart_id)
 
     if not cart_object.cart_items:
@@ -47,45 +68,88 @@ def create_order(
 
     new_order = Order(user_id=user_id)
     session.add(new_order)
-    session.commit()
+    await session.commit()
 
-    create_order_items(
+    await create_order_items(
         session=session, order=new_order, cart_items=cart_object.cart_items
     )
     new_order.total_order_price = cart_object.cart_total_price
     session.add(new_order)
-    session.commit()
+    await session.commit()
 
     statement = delete(Cart).filter(Cart.id == cart_id)
-    session.execute(statement)
-    session.commit()
+    await session.execute(statement)
+    await session.commit()
     
     send_awaiting_for_payment_mail(
         user_object.email, session, background_tasks, new_order.id 
     )
-    return UserOrderOutputSchema.from_orm(new_order)
+    return await serialize_instance(session, UserOrderOutputSchema, new_order)
 
 
-def get_single_order(
-    session: Session, order_id: str, as_staff: bool = False
+async def get_single_order(
+    session: AsyncSession, order_id: str, as_staff: bool = False
 ) -> Union[OrderOutputSchema, UserOrderOutputSchema]:
-    if not (order_object := if_exists(Order, "id", order_id, session)):
+    schema = OrderOutputSchema if as_staff else UserOrderOutputSchema
+    if not (
+        order_object := await if_exists(
+            Order,
+            "id",
+            order_id,
+            session,
+            options=get_eager_load_options(Order, schema),
+        )
+    ):
         raise DoesNotExist(Order.__name__, "id", order_id)
 
-    if as_staff:
-        return OrderOutputSchema.from_orm(order_object)
-    return UserOrderOutputSchema.from_orm(order_object)
+    return await serialize_instance(session, schema, order_object)
+
 
+async def get_order_validators(
+    session: AsyncSession, order_id: str
+) -> tuple[str, Validators]:
+    if not is_valid_uuid(order_id):
+        raise DoesNotExist(Order.__name__, "id", order_id)
+    row = (
+        await session.execute(
+            select(
+                Order.user_id,
+                Order.updated_at,
+                func.max(Product.updated_at),
+                func.max(Category.updated_at),
+                func.array_agg(aggregate_order_by(Category.id.distinct(), Category.id)),
+                func.count(OrderItem.id.distinct()),
+            )
+            .outerjoin(OrderItem, OrderItem.order_id == Order.id)
+            .outerjoin(Product, Product.id == OrderItem.product_id)
+            .outerjoin(
+                category_product_association_table,
+                category_product_association_table.c.product_id == Product.id,
+            )
+            .outerjoin(
+                Category,
+                Category.id == category_product_association_table.c.category_id,
+            )
+            .filter(Order.id == order_id)
+            .group_by(Order.id)
+        )
+    ).first()
+    if row is None:
+        raise DoesNotExist(Order.__name__, "id", order_id)
 
-def get_all_orders(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+    user_id, *versions = row
+    return user_id, get_validators(Order.__name__, order_id, *versions)
+
+
+async def get_all_orders(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema:
     query = select(Order)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, Order)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=OrderOutputSchema,
         table=Order,
@@ -94,60 +158,74 @@ def get_all_orders(
     )
 
 
-def get_all_user_orders(
-    session: Session,
+async def get_all_user_orders(
+    session: AsyncSession,
     user_id: str,
     page_params: PageParams,
     query_params: list[tuple] = None,
-) -> PagedResponseSchema[OrderOutputSchema]:
-    query = (
-        select(Order).filter(User.id == user_id).join(User, Order.user_id == User.id)
-    )
+    as_staff: bool = False,
+) -> Union[
+    PagedResponseSchema[OrderOutputSchema],
+    PagedResponseSchema[UserOrderOutputSchema],
+]:
+    if not is_valid_uuid(user_id):
+        raise DoesNotExist(User.__name__, "id", user_id)
+
+    schema = OrderOutputSchema if as_staff else UserOrderOutputSchema
+    query = select(Order).filter(Order.user_id == user_id)
     if query_params:
         query = filter_and_sort_instances(query_params, query, Order)
 
-    return paginate(
+    return await paginate(
         query=query,
-        response_schema=OrderOutputSchema,
+        response_schema=schema,
         table=Order,
         page_params=page_params,
         session=session,
     )
 
 
-def cancel_orders_with_exceeded_payment_deadline(session: Session) -> None:
+async def cancel_orders_with_exceeded_payment_deadline(
+    session: AsyncSession,
+) -> None:
     invalid_orders = (
-        session.scalars(
-            select(Order).filter(
-                Order.waiting_for_payment == True,
-                Order.cancelled == False,
-                Order.payment_deadline < datetime.datetime.now(),
+        (
+            await session.scalars(
+                select(Order).filter(
+                    Order.waiting_for_payment == True,
+                    Order.cancelled == False,
+                    Order.payment_deadline < datetime.datetime.now(),
+                )
             )
         )
         .unique()
         .all()
     )
 
-    [cancel_single_order(session, order.id, True) for order in invalid_orders]
+    for order in invalid_orders:
+        await cancel_single_order(session, order.id, True)
 
 
-def cancel_single_order(
-    session: Session, order_id: int, exceeded_payment_deadline: bool = False
+async def cancel_single_order(
+    session: AsyncSession, order_id: int, exceeded_payment_deadline: bool = False
 ):
-    if not (order_object := if_exists(Order, "id", order_id, session)):
+    if not (
+        order_object := await if_exists(
+            Order, "id", order_id, session, options=[selectinload(Order.order_items)]
+        )
+    ):
         raise DoesNotExist(Order.__name__, "id", order_id)
 
     if order_object.cancelled:
         raise OrderAlreadyCancelledException
 
     for order_item in order_object.order_items:
-        if not (
-            product_object := if_exists(Product, "id", order_item.product_id, session)
-        ):
+        if not await if_exists(Product, "id", order_item.product_id, session):
             raise DoesNotExist(Product.__name__, "id", order_item.product_id)
 
-        product_object.inventory.quantity_for_cart_items += order_item.quantity
-        session.add(product_object)
+        await reserve_quantity_for_cart_items(
+            session, order_item.product_id, -order_item.quantity
+        )
 
     if exceeded_payment_deadline:
         order_object.waiting_for_payment = False
@@ -155,11 +233,11 @@ def cancel_single_order(
 
     order_object.cancelled = True
     session.add(order_object)
-    session.commit()
+    await session.commit()
 
 
-def fulfill_order(
-    session: Session,
+async def fulfill_order(
+    session: AsyncSession,
     stripe_session, payment_intent,
     background_tasks: BackgroundTasks,
     order_id: str = None, amount: int = None,
@@ -173,7 +251,15 @@ def fulfill_order(
         
     stripe_charge_id = payment_intent["latest_charge"]
     
-    if not (order_object := if_exists(Order, "id", order_id, session)):
+    if not (
+        order_object := await if_exists(
+            Order,
+            "id",
+            order_id,
+            session,
+            options=[selectinload(Order.order_items), selectinload(Order.user)],
+        )
+    ):
         raise DoesNotExist(Order.__name__, "id", order_id)
     
     if order_object.cancelled:
@@ -196,20 +282,18 @@ def fulfill_order(
     session.add(new_payment)
     
     for order_item in order_object.order_items:
-        if not (
-            product_object := if_exists(Product, "id", order_item.product_id, session)
-        ):
+        if not await if_exists(Product, "id", order_item.product_id, session):
             raise DoesNotExist(Product.__name__, "id", order_item.product_id)
 
-        product_object.inventory.quantity -= order_item.quantity
-        product_object.inventory.sold += order_item.quantity
-        session.add(product_object)
+        await record_sold_quantity(
+            session, order_item.product_id, order_item.quantity
+        )
         
     session.add(order_object)
     send_payment_confirmaion_mail(
         order_object.user.email, session, background_tasks, order_id
     )
-    session.commit()
+    await session.commit()
     if testing:
-        return PaymentOutputSchema.from_orm(new_payment)
+        return await serialize_instance(session, PaymentOutputSchema, new_payment)
     return
\ No newline at end of file
@@ -12,20 +12,26 @@ from src.database.db_connection import Base
 class Payment(Base):
     __tablename__ = "payment"
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     stripe_charge_id = Column(String(length=300), nullable=False)
     amount = Column(DECIMAL, nullable=False)
     order_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("order.id", ondelete="SET NULL", onupdate="cascade"),
         nullable=True,
+        index=True,
     )
     order = relationship("Order", back_populates="payment")
     user_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("user.id", ondelete="SET NULL", onupdate="cascade"),
-        nullable=True
+        nullable=True,
+        index=True,
     )
     user = relationship("User", back_populates="payments")
     created_at = Column(DateTime, nullable=False, default=get_current_time)
\ No newline at end of file
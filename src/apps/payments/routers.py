@@ -3,7 +3,7 @@ from typing import Union
 import stripe
 from fastapi import BackgroundTasks, Depends, Request, Response, status
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.payments.schemas import (
     PaymentOutputSchema,
@@ -23,13 +23,18 @@ from src.apps.user.models import User
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.permissions import check_if_staff, check_if_staff_or_owner
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_db, get_read_db
 from src.dependencies.user import authenticate_user
 from src.settings.stripe import settings
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
-stripe_router = APIRouter(prefix="/stripe", tags=["stripe"])
-payment_router = APIRouter(prefix="/payments", tags=["payment"])
+stripe_router = APIRouter(
+    prefix="/stripe", tags=["stripe"], route_class=SchemaResponseRoute
+)
+payment_router = APIRouter(
+    prefix="/payments", tags=["payment"], route_class=SchemaResponseRoute
+)
 
 
 @stripe_router.post(
@@ -39,7 +44,7 @@ payment_router = APIRouter(prefix="/payments", tags=["payment"])
 async def handle_webhook_event(
     request: Request,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> None:
     return await handle_stripe_webhook_event(db, request, background_tasks)
 
@@ -48,14 +53,14 @@ async def handle_webhook_event(
     response_model=PagedResponseSchema[PaymentOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_payments(
+async def get_payments(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[PaymentOutputSchema]:
     check_if_staff(request_user)
-    return get_all_payments(db, page_params, request.query_params.multi_items())
+    return await get_all_payments(db, page_params, request.query_params.multi_items())
 
 
 @payment_router.get(
@@ -63,13 +68,13 @@ def get_payments(
     response_model=PagedResponseSchema[UserPaymentOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_logged_user_payments(
+async def get_logged_user_payments(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[UserPaymentOutputSchema]:
-    return get_all_user_payments(
+    return await get_all_user_payments(
         db, request_user.id, page_params, request.query_params.multi_items()
     )
 
@@ -79,14 +84,14 @@ def get_logged_user_payments(
     response_model=Union[PaymentOutputSchema, UserPaymentOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_payment(
+async def get_payment(
     payment_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> Union[PaymentOutputSchema, UserPaymentOutputSchema]:
-    db_payment = get_single_payment(db, payment_id)
+    db_payment = await get_single_payment(db, payment_id)
     if check_if_staff_or_owner(request_user, "id", db_payment.user.id):
         if request_user.is_staff:
-            return get_single_payment(db, payment_id, as_staff=True)
-        return get_single_payment(db, payment_id)
+            return await get_single_payment(db, payment_id, as_staff=True)
+        return await get_single_payment(db, payment_id)
 
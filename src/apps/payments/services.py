@@ -5,7 +5,8 @@ import stripe
 from fastapi import BackgroundTasks, Request
 from pydantic import BaseSettings
 from sqlalchemy import delete, insert, select, update
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.apps.orders.models import Order
 from src.apps.orders.services.order_services import fulfill_order
@@ -16,7 +17,7 @@ from src.apps.payments.schemas import (
     StripeSessionSchema,
     UserPaymentOutputSchema,
 )
-from src.apps.user.models import User
+from src.core.eager_loading import get_eager_load_options
 from src.core.exceptions import (
     DoesNotExist,
     EmptyCartException,
@@ -26,30 +27,41 @@ from src.core.exceptions import (
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.pagination.services import paginate
-from src.core.utils.utils import filter_and_sort_instances, if_exists
+from src.core.utils.utils import (
+    filter_and_sort_instances,
+    if_exists,
+    serialize_instance,
+)
 from src.settings.stripe import settings as stripe_settings
 
 
-def get_single_payment(
-    session: Session, payment_id: str, as_staff: bool = False
+async def get_single_payment(
+    session: AsyncSession, payment_id: str, as_staff: bool = False
 ) -> Union[PaymentOutputSchema, UserPaymentOutputSchema]:
-    if not (payment_object := if_exists(Payment, "id", payment_id, session)):
+    schema = PaymentOutputSchema if as_staff else UserPaymentOutputSchema
+    if not (
+        payment_object := await if_exists(
+            Payment,
+            "id",
+            payment_id,
+            session,
+            options=get_eager_load_options(Payment, schema),
+        )
+    ):
         raise DoesNotExist(Payment.__name__, "id", payment_id)
 
-    if as_staff:
-        return PaymentOutputSchema.from_orm(payment_object)
-    return UserPaymentOutputSchema.from_orm(payment_object)
+    return await serialize_instance(session, schema, payment_object)
 
 
-def get_all_payments(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_all_payments(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema[PaymentOutputSchema]:
     query = select(Payment)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, Payment)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=PaymentOutputSchema,
         table=Payment,
@@ -58,19 +70,17 @@ def get_all_payments(
     )
 
 
-def get_all_user_payments(
-    session: Session,
+async def get_all_user_payments(
+    session: AsyncSession,
     user_id: str,
     page_params: PageParams,
     query_params: list[tuple] = None,
 ) -> PagedResponseSchema[UserPaymentOutputSchema]:
-    query = (
-        select(Payment).filter(User.id == user_id).join(User, Payment.user_id == User.id)
-    )
+    query = select(Payment).filter(Payment.user_id == user_id)
     if query_params:
         query = filter_and_sort_instances(query_params, query, Payment)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=UserPaymentOutputSchema,
         table=Payment,
@@ -99,8 +109,8 @@ def create_checkout_session(
         )
     return checkout_session
 
-def get_stripe_session_data(session: Session, order_id: str):
-    if not (order_object := if_exists(Order, "id", order_id, session)):
+async def get_stripe_session_data(session: AsyncSession, order_id: str):
+    if not (order_object := await if_exists(Order, "id", order_id, session)):
         raise DoesNotExist(Order.__name__, "id", order_id)
     
     if order_object.payment_accepted:
@@ -130,7 +140,7 @@ def get_stripe_session_data(session: Session, order_id: str):
     )
 
 async def handle_stripe_webhook_event(
-    session: Session,
+    session: AsyncSession,
     request: Request,
     background_tasks: BackgroundTasks,
     settings: BaseSettings=stripe_settings
@@ -149,5 +159,7 @@ async def handle_stripe_webhook_event(
     if event["type"] == "checkout.session.completed":
         stripe_session = event["data"]["object"]
         payment_intent = stripe.PaymentIntent.retrieve(id=stripe_session["payment_intent"])
-        fulfill_order(session, stripe_session, payment_intent, background_tasks)
+        await fulfill_order(
+            session, stripe_session, payment_intent, background_tasks
+        )
     return
\ No newline at end of file
@@ -2,16 +2,20 @@ from sqlalchemy import (
     DECIMAL,
     Boolean,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
+    UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql.sqltypes import DateTime
 
+from src.core.utils.constants import SEARCH_CONFIG
 from src.core.utils.utils import (
     generate_uuid,
     get_current_time,
@@ -25,13 +29,14 @@ category_product_association_table = Table(
     Base.metadata,
     Column(
         "category_id",
-        ForeignKey("category.id", ondelete="SET NULL", onupdate="cascade"),
-        nullable=True,
+        ForeignKey("category.id", ondelete="cascade", onupdate="cascade"),
+        primary_key=True,
     ),
     Column(
         "product_id",
         ForeignKey("product.id", ondelete="cascade", onupdate="cascade"),
-        nullable=False,
+        primary_key=True,
+        index=True,
     ),
 )
 
@@ -39,9 +44,16 @@ category_product_association_table = Table(
 class Category(Base):
     __tablename__ = "category"
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     name = Column(String(length=75), nullable=False, unique=True)
+    updated_at = Column(
+        DateTime, nullable=False, default=get_current_time, onupdate=get_current_time
+    )
     products = relationship(
         "Product",
         secondary=category_product_association_table,
@@ -49,16 +61,49 @@ class Category(Base):
     )
 
 
+class CategoryProductCount(Base):
+    __tablename__ = "category_product_count"
+    category_id = Column(
+        UUID(as_uuid=False),
+        ForeignKey("category.id", ondelete="cascade", onupdate="cascade"),
+        primary_key=True,
+    )
+    product_count = Column(Integer, nullable=False, server_default="0")
+
+
 class Product(Base):
     __tablename__ = "product"
+    __table_args__ = (
+        Index("ix_product_price_id", "price", "id"),
+        Index("ix_product_created_at_id", "created_at", "id"),
+        Index("ix_product_search_vector", "search_vector", postgresql_using="gin"),
+    )
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     name = Column(String(length=75), nullable=False, unique=True)
     price = Column(DECIMAL, nullable=False)
     description = Column(String(length=300), nullable=True)
     created_at = Column(DateTime, nullable=False, default=get_current_time)
+    updated_at = Column(
+        DateTime, nullable=False, default=get_current_time, onupdate=get_current_time
+    )
     removed_from_store = Column(Boolean, nullable=False, server_default="false")
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', name), 'A') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', "
+                "coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
     inventory = relationship(
         "ProductInventory", uselist=False, back_populates="product"
     )
@@ -74,14 +119,41 @@ class Product(Base):
 class ProductInventory(Base):
     __tablename__ = "product_inventory"
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     quantity = Column(Integer, nullable=False)
     quantity_for_cart_items = Column(Integer, nullable=False, default=0)
     sold = Column(Integer, nullable=False, default=0)
+    shard_count = Column(Integer, nullable=False, default=0, server_default="0")
     product_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("product.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
+        index=True,
     )
     product = relationship("Product", back_populates="inventory")
+
+
+class ProductInventoryShard(Base):
+    __tablename__ = "product_inventory_shard"
+    __table_args__ = (UniqueConstraint("inventory_id", "shard"),)
+
+    id = Column(
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
+    )
+    inventory_id = Column(
+        UUID(as_uuid=False),
+        ForeignKey("product_inventory.id", ondelete="cascade", onupdate="cascade"),
+        nullable=False,
+    )
+    shard = Column(Integer, nullable=False)
+    quantity_for_cart_items = Column(Integer, nullable=False, default=0)
+    sold = Column(Integer, nullable=False, default=0)
@@ -1,6 +1,6 @@
 from fastapi import Depends, Request, Response, status
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.products.schemas import (
     CategoryInputSchema,
@@ -11,17 +11,22 @@ from src.apps.products.services.category_services import (
     create_category,
     delete_single_category,
     get_all_categories,
+    get_category_validators,
     get_single_category,
     update_single_category,
 )
 from src.apps.user.models import User
+from src.core.conditional import get_conditional_response
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.permissions import check_if_staff
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_db, get_read_db
 from src.dependencies.user import authenticate_user
 
-category_router = APIRouter(prefix="/categories", tags=["category"])
+category_router = APIRouter(
+    prefix="/categories", tags=["category"], route_class=SchemaResponseRoute
+)
 
 
 @category_router.post(
@@ -29,13 +34,13 @@ category_router = APIRouter(prefix="/categories", tags=["category"])
     response_model=CategoryInputSchema,
     status_code=status.HTTP_201_CREATED,
 )
-def post_category(
+async def post_category(
     category: CategoryInputSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> CategoryOutputSchema:
     check_if_staff(request_user)
-    return create_category(db, category)
+    return await create_category(db, category)
 
 
 @category_router.get(
@@ -43,13 +48,13 @@ def post_category(
     response_model=PagedResponseSchema[CategoryOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_categories(
+async def get_categories(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[CategoryOutputSchema]:
-    return get_all_categories(db, page_params, request.query_params.multi_items())
+    return await get_all_categories(db, page_params, request.query_params.multi_items())
 
 
 @category_router.get(
@@ -57,13 +62,18 @@ def get_categories(
     response_model=CategoryOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def get_category(
+async def get_category(
     category_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> CategoryOutputSchema:
     check_if_staff(request_user)
-    return get_single_category(db, category_id)
+    validators = await get_category_validators(db, category_id)
+    if not_modified := get_conditional_response(request, response, validators):
+        return not_modified
+    return await get_single_category(db, category_id)
 
 
 @category_router.patch(
@@ -71,25 +81,25 @@ def get_category(
     response_model=CategoryOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def update_category(
+async def update_category(
     category_id: str,
     category_input: CategoryUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> CategoryOutputSchema:
     check_if_staff(request_user)
-    return update_single_category(db, category_input, category_id)
+    return await update_single_category(db, category_input, category_id)
 
 
 @category_router.delete(
     "/{category_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_category(
+async def delete_category(
     category_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> Response:
     check_if_staff(request_user)
-    delete_single_category(db, category_id)
+    await delete_single_category(db, category_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,6 +1,6 @@
 from fastapi import Depends, Request, Response, status
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.products.schemas import InventoryInputSchema, InventoryOutputSchema
 from src.apps.products.services.inventory_services import (
@@ -12,10 +12,13 @@ from src.apps.user.models import User
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.permissions import check_if_staff
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_db, get_read_db
 from src.dependencies.user import authenticate_user
 
-inventory_router = APIRouter(prefix="/inventories", tags=["inventory"])
+inventory_router = APIRouter(
+    prefix="/inventories", tags=["inventory"], route_class=SchemaResponseRoute
+)
 
 
 @inventory_router.get(
@@ -23,13 +26,15 @@ inventory_router = APIRouter(prefix="/inventories", tags=["inventory"])
     response_model=PagedResponseSchema[InventoryOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_inventories(
+async def get_inventories(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[InventoryOutputSchema]:
-    return get_all_inventories(db, page_params, request.query_params.multi_items())
+    return await get_all_inventories(
+        db, page_params, request.query_params.multi_items()
+    )
 
 
 @inventory_router.get(
@@ -37,13 +42,13 @@ def get_inventories(
     response_model=InventoryOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def get_inventory(
+async def get_inventory(
     inventory_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> InventoryOutputSchema:
     check_if_staff(request_user)
-    return get_single_inventory(db, inventory_id)
+    return await get_single_inventory(db, inventory_id)
 
 
 @inventory_router.patch(
@@ -51,11 +56,11 @@ def get_inventory(
     response_model=InventoryOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def update_inventory(
+async def update_inventory(
     inventory_id: str,
     inventory: InventoryInputSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> InventoryOutputSchema:
     check_if_staff(request_user)
-    return update_single_inventory(db, inventory, inventory_id)
+    return await update_single_inventory(db, inventory, inventory_id)
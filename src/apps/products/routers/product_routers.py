@@ -1,11 +1,12 @@
-from typing import Union
+from typing import Optional, Union
 
-from fastapi import Depends, Request, Response, status
+from fastapi import Depends, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.products.schemas import (
+    AutocompleteSuggestionSchema,
     InventoryOutputSchema,
     ProductInputSchema,
     ProductOutputSchema,
@@ -13,24 +14,35 @@ from src.apps.products.schemas import (
     ProductWithoutInventoryOutputSchema,
     RemovedProductOutputSchema,
 )
+from src.apps.products.services.autocomplete_services import (
+    get_autocomplete_suggestions,
+)
 from src.apps.products.services.inventory_services import get_single_inventory
 from src.apps.products.services.product_services import (
     create_product,
     get_all_available_products,
     get_all_products,
+    get_available_product_validators,
     get_available_single_product,
+    get_product_facets,
     get_single_product_or_inventory,
     remove_single_product_from_store,
+    search_available_products,
     update_single_product,
 )
 from src.apps.user.models import User
+from src.core.conditional import get_conditional_response
 from src.core.pagination.models import PageParams
-from src.core.pagination.schemas import PagedResponseSchema
+from src.core.pagination.schemas import FacetCountSchema, PagedResponseSchema
 from src.core.permissions import check_if_staff
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_db, get_read_db
 from src.dependencies.user import authenticate_user
+from src.settings.autocomplete import settings as autocomplete_settings
 
-product_router = APIRouter(prefix="/products", tags=["product"])
+product_router = APIRouter(
+    prefix="/products", tags=["product"], route_class=SchemaResponseRoute
+)
 
 
 @product_router.post(
@@ -38,13 +50,13 @@ product_router = APIRouter(prefix="/products", tags=["product"])
     response_model=ProductOutputSchema,
     status_code=status.HTTP_201_CREATED,
 )
-def post_product(
+async def post_product(
     product: ProductInputSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> ProductOutputSchema:
     check_if_staff(request_user)
-    return create_product(db, product)
+    return await create_product(db, product)
 
 
 @product_router.get(
@@ -52,27 +64,77 @@ def post_product(
     response_model=PagedResponseSchema[ProductWithoutInventoryOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_available_products(
-    request: Request, db: Session = Depends(get_db), page_params: PageParams = Depends()
+async def get_available_products(
+    request: Request,
+    facets: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+    page_params: PageParams = Depends(),
+) -> PagedResponseSchema[ProductWithoutInventoryOutputSchema]:
+    return await get_all_available_products(
+        db,
+        page_params,
+        query_params=request.query_params.multi_items(),
+        with_facets=facets,
+    )
+
+
+@product_router.get(
+    "/facets",
+    response_model=list[FacetCountSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_available_product_facets(
+    request: Request,
+    q: Optional[str] = Query(None, min_length=1, max_length=200),
+    db: AsyncSession = Depends(get_read_db),
+) -> list[FacetCountSchema]:
+    return await get_product_facets(
+        db, query_params=request.query_params.multi_items(), search_query=q
+    )
+
+
+@product_router.get(
+    "/search",
+    response_model=PagedResponseSchema[ProductWithoutInventoryOutputSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def search_products(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    facets: bool = False,
+    db: AsyncSession = Depends(get_read_db),
+    page_params: PageParams = Depends(),
 ) -> PagedResponseSchema[ProductWithoutInventoryOutputSchema]:
-    return get_all_available_products(
-        db, page_params, query_params=request.query_params.multi_items()
+    return await search_available_products(
+        db, q, page_params, request.query_params.multi_items(), with_facets=facets
     )
 
 
+@product_router.get(
+    "/autocomplete",
+    response_model=list[AutocompleteSuggestionSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def autocomplete_products(
+    q: str = Query(..., min_length=1, max_length=75),
+    limit: int = Query(10, ge=1, le=autocomplete_settings.AUTOCOMPLETE_MAX_RESULTS),
+) -> list[AutocompleteSuggestionSchema]:
+    return get_autocomplete_suggestions(q, limit)
+
+
 @product_router.get(
     "/all",
     response_model=PagedResponseSchema[ProductOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_products(
+async def get_products(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
     page_params: PageParams = Depends(),
 ) -> PagedResponseSchema[ProductOutputSchema]:
     check_if_staff(request_user)
-    return get_all_products(db, page_params, request.query_params.multi_items())
+    return await get_all_products(db, page_params, request.query_params.multi_items())
 
 
 @product_router.get(
@@ -80,13 +142,13 @@ def get_products(
     response_model=ProductOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def get_product_as_staff(
+async def get_product_as_staff(
     product_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> ProductOutputSchema:
     check_if_staff(request_user)
-    return get_single_product_or_inventory(db, product_id)
+    return await get_single_product_or_inventory(db, product_id)
 
 
 @product_router.get(
@@ -96,10 +158,16 @@ def get_product_as_staff(
     ],
     status_code=status.HTTP_200_OK,
 )
-def get_product(
-    product_id: str, db: Session = Depends(get_db)
+async def get_product(
+    product_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ) -> Union[ProductWithoutInventoryOutputSchema, RemovedProductOutputSchema]:
-    return get_available_single_product(db, product_id)
+    validators = await get_available_product_validators(db, product_id)
+    if not_modified := get_conditional_response(request, response, validators):
+        return not_modified
+    return await get_available_single_product(db, product_id)
 
 
 @product_router.get(
@@ -107,13 +175,13 @@ def get_product(
     response_model=InventoryOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def get_product_inventory(
+async def get_product_inventory(
     product_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> InventoryOutputSchema:
     check_if_staff(request_user)
-    return get_single_product_or_inventory(db, product_id, get_inventory=True)
+    return await get_single_product_or_inventory(db, product_id, get_inventory=True)
 
 
 @product_router.patch(
@@ -121,25 +189,25 @@ def get_product_inventory(
     response_model=ProductOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def update_product(
+async def update_product(
     product_id: str,
     product: ProductUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> ProductOutputSchema:
     check_if_staff(request_user)
-    return update_single_product(db, product, product_id)
+    return await update_single_product(db, product, product_id)
 
 
 @product_router.patch(
     "/{product_id}/remove",
     status_code=status.HTTP_200_OK,
 )
-def remove_product_from_store(
+async def remove_product_from_store(
     product_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> Response:
     check_if_staff(request_user)
-    result = remove_single_product_from_store(db, product_id)
+    result = await remove_single_product_from_store(db, product_id)
     return JSONResponse(result)
@@ -3,6 +3,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, validator
 
+from src.settings.inventory import settings as inventory_settings
+
 
 class CategoryBaseSchema(BaseModel):
     name: str = Field(max_length=75)
@@ -39,6 +41,7 @@ class InventoryInputSchema(InventoryBaseSchema):
 
 class InventoryUpdateSchema(BaseModel):
     quantity: Optional[int]
+    shard_count: Optional[int]
 
     @validator("quantity")
     def validate_quantity(cls, quantity: int) -> str:
@@ -46,11 +49,24 @@ class InventoryUpdateSchema(BaseModel):
             raise ValueError("Quantity of a product must be a positive integer!")
         return quantity
 
+    @validator("shard_count")
+    def validate_shard_count(cls, shard_count: Optional[int]) -> Optional[int]:
+        if (
+            shard_count is not None
+            and not 0 <= shard_count <= inventory_settings.INVENTORY_MAX_SHARDS
+        ):
+            raise ValueError(
+                "Number of stock shards must be between 0 and "
+                f"{inventory_settings.INVENTORY_MAX_SHARDS}!"
+            )
+        return shard_count
+
 
 class InventoryOutputSchema(InventoryBaseSchema):
     id: str
     quantity_for_cart_items: int
     sold: int
+    shard_count: int = 0
 
     class Config:
         orm_mode = True
@@ -97,3 +113,9 @@ class RemovedProductOutputSchema(ProductBaseSchema):
 
     class Config:
         orm_mode = True
+
+
+class AutocompleteSuggestionSchema(BaseModel):
+    kind: str
+    id: str
+    name: str
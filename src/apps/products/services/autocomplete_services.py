@@ -0,0 +1,226 @@
+import asyncio
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from heapq import nlargest
+from typing import Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.products.models import (
+    Category,
+    Product,
+    ProductInventory,
+    category_product_association_table,
+)
+from src.apps.products.schemas import AutocompleteSuggestionSchema
+from src.settings.autocomplete import settings
+
+PRODUCT_KIND = "product"
+CATEGORY_KIND = "category"
+MAX_INDEXED_WORDS = 5
+
+
+def normalize_name(name: str) -> str:
+    if not name.isascii():
+        name = "".join(
+            char
+            for char in unicodedata.normalize("NFKD", name)
+            if not unicodedata.combining(char)
+        )
+    return " ".join(re.findall(r"\w+", name.lower()))
+
+
+def get_index_keys(name: str) -> list[str]:
+    words = normalize_name(name).split()
+    return [
+        " ".join(words[index:]) for index in range(min(len(words), MAX_INDEXED_WORDS))
+    ]
+
+
+class AutocompleteSnapshot:
+    def __init__(
+        self,
+        items: dict[tuple[str, str], tuple[str, int]],
+        keys: list[tuple[str, str, str]],
+        top: dict[str, list[tuple[str, str]]],
+    ):
+        self.items = items
+        self.keys = keys
+        self.top = top
+
+    def get_weight(self, item: tuple[str, str]) -> int:
+        return self.items[item][1]
+
+    def scan(self, prefix: str) -> set[tuple[str, str]]:
+        matches = set()
+        position = bisect_left(self.keys, (prefix,))
+        while position < len(self.keys) and self.keys[position][0].startswith(prefix):
+            matches.add(self.keys[position][1:])
+            position += 1
+        return matches
+
+    def rank(self, items, limit: int) -> list[tuple[str, str]]:
+        return nlargest(limit, items, key=lambda item: (self.get_weight(item), item))
+
+
+class AutocompleteIndex:
+    def __init__(self, max_entries: int, cached_prefix_length: int, top_size: int):
+        self.max_entries = max_entries
+        self.cached_prefix_length = cached_prefix_length
+        self.top_size = top_size
+        self.snapshot = AutocompleteSnapshot({}, [], {})
+        self.lock = threading.Lock()
+        self.rebuild_lock = threading.Lock()
+        self.pending_edits: Optional[list[tuple[Callable, tuple]]] = None
+
+    def get_prefixes(self, key: str) -> list[str]:
+        return [key[:length] for length in range(1, self.cached_prefix_length + 1)]
+
+    def build_snapshot(
+        self, items: list[tuple[str, str, str, int]]
+    ) -> AutocompleteSnapshot:
+        indexed_items = {
+            (kind, item_id): (name, weight)
+            for kind, item_id, name, weight in items[: self.max_entries]
+        }
+        keys, top = [], {}
+        for item in sorted(
+            indexed_items,
+            key=lambda item: (indexed_items[item][1], item),
+            reverse=True,
+        ):
+            for key in get_index_keys(indexed_items[item][0]):
+                keys.append((key, *item))
+                for prefix in self.get_prefixes(key):
+                    top_items = top.setdefault(prefix, [])
+                    if len(top_items) < self.top_size and item not in top_items:
+                        top_items.append(item)
+        keys.sort()
+        return AutocompleteSnapshot(indexed_items, keys, top)
+
+    def rebuild(self, items: list[tuple[str, str, str, int]]) -> None:
+        # built aside and swapped in as one reference, so lookups served while a
+        # refresh runs in a worker thread always see a consistent index; edits
+        # made meanwhile are recorded and replayed onto the new snapshot
+        with self.rebuild_lock:
+            with self.lock:
+                self.pending_edits = []
+            snapshot = self.build_snapshot(items)
+            with self.lock:
+                for apply_edit, args in self.pending_edits:
+                    apply_edit(snapshot, *args)
+                self.snapshot, self.pending_edits = snapshot, None
+
+    def edit(self, apply_edit: Callable, *args) -> None:
+        with self.lock:
+            apply_edit(self.snapshot, *args)
+            if self.pending_edits is not None:
+                self.pending_edits.append((apply_edit, args))
+
+    def refresh_top(self, snapshot: AutocompleteSnapshot, prefix: str) -> None:
+        if top_items := snapshot.rank(snapshot.scan(prefix), self.top_size):
+            snapshot.top[prefix] = top_items
+        else:
+            snapshot.top.pop(prefix, None)
+
+    def add_item(
+        self,
+        snapshot: AutocompleteSnapshot,
+        kind: str,
+        item_id: str,
+        name: str,
+        weight: Optional[int],
+    ) -> None:
+        item = (kind, item_id)
+        if weight is None:
+            weight = snapshot.items[item][1] if item in snapshot.items else 0
+        self.remove_item(snapshot, kind, item_id)
+        if len(snapshot.items) >= self.max_entries:
+            return
+
+        snapshot.items[item] = (name, weight)
+        for key in get_index_keys(name):
+            insort(snapshot.keys, (key, kind, item_id))
+            for prefix in self.get_prefixes(key):
+                top_items = snapshot.top.setdefault(prefix, [])
+                if item not in top_items:
+                    top_items.append(item)
+                snapshot.top[prefix] = snapshot.rank(top_items, self.top_size)
+
+    def remove_item(
+        self, snapshot: AutocompleteSnapshot, kind: str, item_id: str
+    ) -> None:
+        if (entry := snapshot.items.pop((kind, item_id), None)) is None:
+            return
+
+        stale_prefixes = set()
+        for key in get_index_keys(entry[0]):
+            del snapshot.keys[bisect_left(snapshot.keys, (key, kind, item_id))]
+            stale_prefixes.update(self.get_prefixes(key))
+        for prefix in stale_prefixes:
+            if (kind, item_id) in snapshot.top.get(prefix, []):
+                self.refresh_top(snapshot, prefix)
+
+    def add(self, kind: str, item_id: str, name: str, weight: Optional[int] = None):
+        self.edit(self.add_item, kind, item_id, name, weight)
+
+    def remove(self, kind: str, item_id: str) -> None:
+        self.edit(self.remove_item, kind, item_id)
+
+    def lookup(self, query: str, limit: int) -> list[AutocompleteSuggestionSchema]:
+        if not (prefix := normalize_name(query)):
+            return []
+        snapshot = self.snapshot
+        if len(prefix) <= self.cached_prefix_length:
+            items = snapshot.top.get(prefix, [])[:limit]
+        else:
+            items = snapshot.rank(snapshot.scan(prefix), limit)
+        return [
+            AutocompleteSuggestionSchema(
+                kind=kind, id=item_id, name=snapshot.items[(kind, item_id)][0]
+            )
+            for kind, item_id in items
+        ]
+
+
+autocomplete_index = AutocompleteIndex(
+    settings.AUTOCOMPLETE_MAX_ENTRIES,
+    settings.AUTOCOMPLETE_CACHED_PREFIX_LENGTH,
+    settings.AUTOCOMPLETE_MAX_RESULTS,
+)
+
+
+async def build_autocomplete_index(session: AsyncSession) -> None:
+    products = await session.execute(
+        select(Product.id, Product.name, func.coalesce(ProductInventory.sold, 0))
+        .outerjoin(ProductInventory, ProductInventory.product_id == Product.id)
+        .filter(Product.removed_from_store == False)
+        .order_by(func.coalesce(ProductInventory.sold, 0).desc(), Product.id)
+        .limit(settings.AUTOCOMPLETE_MAX_ENTRIES)
+    )
+    categories = await session.execute(
+        select(
+            Category.id,
+            Category.name,
+            func.count(category_product_association_table.c.product_id),
+        )
+        .outerjoin(
+            category_product_association_table,
+            category_product_association_table.c.category_id == Category.id,
+        )
+        .group_by(Category.id)
+    )
+    await asyncio.to_thread(
+        autocomplete_index.rebuild,
+        [(CATEGORY_KIND, *category) for category in categories]
+        + [(PRODUCT_KIND, *product) for product in products],
+    )
+
+
+def get_autocomplete_suggestions(
+    query: str, limit: int
+) -> list[AutocompleteSuggestionSchema]:
+    return autocomplete_index.lookup(query, limit)
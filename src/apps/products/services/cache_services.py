@@ -0,0 +1,31 @@
+from src.core.cache import cache
+
+PRODUCT_LIST_VERSION = "product-list"
+CATEGORY_LIST_VERSION = "category-list"
+CATEGORY_VERSION = "category"
+
+
+def get_product_version(product_id: str) -> str:
+    return f"product:{product_id}"
+
+
+def get_product_entity_versions(product_id: str) -> list[str]:
+    return [get_product_version(product_id), CATEGORY_VERSION]
+
+
+async def invalidate_product(product_id: str) -> None:
+    await cache.invalidate(PRODUCT_LIST_VERSION, get_product_version(product_id))
+
+
+async def invalidate_product_list() -> None:
+    await cache.invalidate(PRODUCT_LIST_VERSION)
+
+
+async def invalidate_category_list() -> None:
+    await cache.invalidate(CATEGORY_LIST_VERSION)
+
+
+async def invalidate_categories() -> None:
+    await cache.invalidate(
+        CATEGORY_LIST_VERSION, CATEGORY_VERSION, PRODUCT_LIST_VERSION
+    )
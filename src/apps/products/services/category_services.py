@@ -1,26 +1,38 @@
 from sqlalchemy import delete, select, update
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.apps.products.models import Category
+from src.apps.products.models import Category, CategoryProductCount
 from src.apps.products.schemas import (
     CategoryInputSchema,
     CategoryOutputSchema,
     CategoryUpdateSchema,
 )
+from src.apps.products.services.autocomplete_services import (
+    CATEGORY_KIND,
+    autocomplete_index,
+)
+from src.apps.products.services.cache_services import (
+    CATEGORY_LIST_VERSION,
+    invalidate_categories,
+    invalidate_category_list,
+)
+from src.core.cache import cache, get_params_digest
+from src.core.conditional import Validators, get_validators
 from src.core.exceptions import AlreadyExists, DoesNotExist, IsOccupied
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
-from src.core.pagination.services import paginate
-from src.core.utils.utils import filter_and_sort_instances, if_exists
+from src.core.pagination.services import is_listing_cacheable, paginate
+from src.core.utils.utils import filter_and_sort_instances, if_exists, is_valid_uuid
+from src.settings.cache import settings as cache_settings
 
 
-def create_category(
-    session: Session, category: CategoryInputSchema
+async def create_category(
+    session: AsyncSession, category: CategoryInputSchema
 ) -> CategoryOutputSchema:
     category_data = category.dict()
 
     if category_data:
-        category_name_check = session.scalar(
+        category_name_check = await session.scalar(
             select(Category).filter(Category.name == category_data["name"]).limit(1)
         )
         if category_name_check:
@@ -28,45 +40,78 @@ def create_category(
 
     new_category = Category(**category_data)
     session.add(new_category)
-    session.commit()
+    await session.flush()
+    session.add(CategoryProductCount(category_id=new_category.id, product_count=0))
+    await session.commit()
+    autocomplete_index.add(CATEGORY_KIND, new_category.id, new_category.name, 0)
+    await invalidate_category_list()
 
     return CategoryOutputSchema.from_orm(new_category)
 
 
-def get_single_category(session: Session, category_id: int) -> CategoryOutputSchema:
-    if not (category_object := if_exists(Category, "id", category_id, session)):
+async def get_single_category(
+    session: AsyncSession, category_id: int
+) -> CategoryOutputSchema:
+    if not (category_object := await if_exists(Category, "id", category_id, session)):
         raise DoesNotExist(Category.__name__, "id", category_id)
 
     return CategoryOutputSchema.from_orm(category_object)
 
 
-def get_all_categories(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_category_validators(
+    session: AsyncSession, category_id: str
+) -> Validators:
+    if not is_valid_uuid(category_id):
+        raise DoesNotExist(Category.__name__, "id", category_id)
+    updated_at = await session.scalar(
+        select(Category.updated_at).filter(Category.id == category_id)
+    )
+    if updated_at is None:
+        raise DoesNotExist(Category.__name__, "id", category_id)
+    return get_validators(Category.__name__, category_id, updated_at)
+
+
+async def get_all_categories(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema[CategoryOutputSchema]:
+    cache_key = ""
+    if is_listing_cacheable(page_params):
+        cache_key = await cache.get_key(
+            "categories",
+            get_params_digest(sorted(query_params or []), page_params),
+            [CATEGORY_LIST_VERSION],
+        )
+        if page := await cache.get(
+            cache_key, PagedResponseSchema[CategoryOutputSchema]
+        ):
+            return page
+
     query = select(Category)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, Category)
 
-    return paginate(
+    page = await paginate(
         query=query,
         response_schema=CategoryOutputSchema,
         table=Category,
         page_params=page_params,
         session=session,
     )
+    await cache.set(cache_key, page, cache_settings.CACHE_LISTING_TTL)
+    return page
 
 
-def update_single_category(
-    session: Session, category_input: CategoryUpdateSchema, category_id: int
+async def update_single_category(
+    session: AsyncSession, category_input: CategoryUpdateSchema, category_id: int
 ) -> CategoryOutputSchema:
-    if not if_exists(Category, "id", category_id, session):
+    if not await if_exists(Category, "id", category_id, session):
         raise DoesNotExist(Category.__name__, "id", category_id)
 
     category_data = category_input.dict(exclude_unset=True)
 
     if category_data:
-        category_name_check = session.scalar(
+        category_name_check = await session.scalar(
             select(Category).filter(Category.name == category_input.name).limit(1)
         )
         if category_name_check:
@@ -76,18 +121,23 @@ def update_single_category(
             update(Category).filter(Category.id == category_id).values(**category_data)
         )
 
-        session.execute(statement)
-        session.commit()
+        await session.execute(statement)
+        await session.commit()
+        if category_name := category_data.get("name"):
+            autocomplete_index.add(CATEGORY_KIND, category_id, category_name)
+        await invalidate_categories()
 
-    return get_single_category(session, category_id=category_id)
+    return await get_single_category(session, category_id=category_id)
 
 
-def delete_single_category(session: Session, category_id: str):
-    if not if_exists(Category, "id", category_id, session):
+async def delete_single_category(session: AsyncSession, category_id: str):
+    if not await if_exists(Category, "id", category_id, session):
         raise DoesNotExist(Category.__name__, "id", category_id)
 
     statement = delete(Category).filter(Category.id == category_id)
-    result = session.execute(statement)
-    session.commit()
+    result = await session.execute(statement)
+    await session.commit()
+    autocomplete_index.remove(CATEGORY_KIND, category_id)
+    await invalidate_categories()
 
     return result
@@ -0,0 +1,78 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from src.apps.products.models import (
+    Category,
+    CategoryProductCount,
+    Product,
+    category_product_association_table,
+)
+from src.core.pagination.schemas import FacetCountSchema
+
+
+async def adjust_category_product_counts(
+    session: AsyncSession, category_ids: Iterable[str], delta: int
+) -> None:
+    if not (category_ids := set(category_ids)):
+        return
+
+    statement = insert(CategoryProductCount).values(
+        [
+            {"category_id": category_id, "product_count": delta}
+            for category_id in category_ids
+        ]
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[CategoryProductCount.category_id],
+        set_={
+            "product_count": CategoryProductCount.product_count
+            + statement.excluded.product_count
+        },
+    )
+    await session.execute(statement)
+
+
+async def get_product_category_ids(session: AsyncSession, product_id: str) -> list[str]:
+    return (
+        await session.scalars(
+            select(category_product_association_table.c.category_id).filter(
+                category_product_association_table.c.product_id == product_id
+            )
+        )
+    ).all()
+
+
+async def get_category_facets(
+    session: AsyncSession, query: Optional[Select] = None
+) -> list[FacetCountSchema]:
+    if query is None:
+        count = CategoryProductCount.product_count
+        facets_query = (
+            select(Category.id, Category.name, count)
+            .join(CategoryProductCount, CategoryProductCount.category_id == Category.id)
+            .filter(count > 0)
+        )
+    else:
+        # filtered listings cannot use the summary table, so the matching
+        # products are counted exactly per category
+        product_ids = query.with_only_columns(Product.id).order_by(None)
+        count = func.count(category_product_association_table.c.product_id)
+        facets_query = (
+            select(Category.id, Category.name, count)
+            .join(
+                category_product_association_table,
+                category_product_association_table.c.category_id == Category.id,
+            )
+            .filter(category_product_association_table.c.product_id.in_(product_ids))
+            .group_by(Category.id)
+        )
+
+    facets = await session.execute(facets_query.order_by(count.desc(), Category.name))
+    return [
+        FacetCountSchema(id=category_id, name=name, count=product_count)
+        for category_id, name, product_count in facets
+    ]
@@ -1,78 +1,532 @@
-from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+import random
+from typing import Any, Optional
 
-from src.apps.products.models import ProductInventory
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.products.models import ProductInventory, ProductInventoryShard
 from src.apps.products.schemas import (
     InventoryInputSchema,
     InventoryOutputSchema,
     InventoryUpdateSchema,
 )
+from src.apps.products.services.cache_services import invalidate_product
 from src.core.exceptions import (
     DoesNotExist,
     NegativeQuantityException,
     QuantityLowerThanAmountOfProductItemsInCartsException,
 )
+from src.core.fieldsets import get_fieldset_schema, parse_fieldset
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
-from src.core.pagination.services import paginate
+from src.core.pagination.services import get_page_schema, paginate
 from src.core.utils.utils import filter_and_sort_instances, if_exists
 
+SHARD_KEY_FIELDS = ("id", "shard_count")
+# serialization_failure and deadlock_detected
+CONFLICT_SQLSTATES = {"40001", "40P01"}
+# (inventory id, shard count) of sharded products seen by this process
+sharded_inventories: dict[str, tuple[str, int]] = {}
+
+
+def get_shard_reservation(inventory_id: str, quantity: int, *criteria: Any):
+    return (
+        update(ProductInventoryShard)
+        .filter(
+            ProductInventoryShard.inventory_id == inventory_id,
+            ProductInventoryShard.quantity_for_cart_items >= quantity,
+            *criteria,
+        )
+        .values(
+            quantity_for_cart_items=ProductInventoryShard.quantity_for_cart_items
+            - quantity
+        )
+        .returning(ProductInventoryShard.quantity_for_cart_items)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def get_available_quantity():
+    # the inventory row of sharded products is not kept up to date, their
+    # quantity for cart items is the sum of the shards
+    return case(
+        (
+            ProductInventory.shard_count > 0,
+            select(
+                func.coalesce(
+                    func.sum(ProductInventoryShard.quantity_for_cart_items), 0
+                )
+            )
+            .filter(ProductInventoryShard.inventory_id == ProductInventory.id)
+            .scalar_subquery(),
+        ),
+        else_=ProductInventory.quantity_for_cart_items,
+    )
+
+
+async def get_sharded_inventory(session: AsyncSession, product_id: str):
+    inventory = (
+        await session.execute(
+            select(ProductInventory.id, ProductInventory.shard_count).filter(
+                ProductInventory.product_id == product_id,
+                ProductInventory.shard_count > 0,
+            )
+        )
+    ).first()
+    if inventory:
+        sharded_inventories[product_id] = tuple(inventory)
+    else:
+        sharded_inventories.pop(product_id, None)
+    return inventory
+
+
+async def reserve_across_shards(
+    session: AsyncSession, inventory_id: str, quantity: int
+) -> Optional[int]:
+    # no single shard holds enough, so all of them are locked (in shard order,
+    # like the rebalancing) and the quantity is collected from several
+    shards = (
+        await session.execute(
+            select(
+                ProductInventoryShard.id, ProductInventoryShard.quantity_for_cart_items
+            )
+            .filter(ProductInventoryShard.inventory_id == inventory_id)
+            .order_by(ProductInventoryShard.shard)
+            .with_for_update()
+        )
+    ).all()
+    if (available_quantity := sum(shard[1] for shard in shards)) < quantity:
+        return None
+
+    missing_quantity = quantity
+    for shard_id, shard_quantity in sorted(shards, key=lambda shard: -shard[1]):
+        if missing_quantity <= 0:
+            break
+        taken_quantity = min(shard_quantity, missing_quantity)
+        await session.execute(
+            get_shard_reservation(
+                inventory_id, taken_quantity, ProductInventoryShard.id == shard_id
+            )
+        )
+        missing_quantity -= taken_quantity
+    return available_quantity - quantity
+
+
+def get_free_shard(inventory_id: str, quantity: int, shard: int):
+    return (
+        select(ProductInventoryShard.id)
+        .filter(
+            ProductInventoryShard.inventory_id == inventory_id,
+            ProductInventoryShard.quantity_for_cart_items >= quantity,
+        )
+        .order_by(
+            (ProductInventoryShard.shard == shard).desc(),
+            ProductInventoryShard.quantity_for_cart_items.desc(),
+        )
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+
+
+async def reserve_from_shards(
+    session: AsyncSession, inventory_id: str, shard_count: int, quantity: int
+) -> Optional[int]:
+    shard = random.randrange(shard_count)
+    if quantity <= 0:
+        return await session.scalar(
+            get_shard_reservation(
+                inventory_id, quantity, ProductInventoryShard.shard == shard
+            )
+        )
+
+    # the random shard, or else the fullest one, is taken only if no other
+    # transaction is reserving from it, so nothing is locked when this fails
+    remaining_quantity = await session.scalar(
+        get_shard_reservation(
+            inventory_id,
+            quantity,
+            ProductInventoryShard.id == get_free_shard(inventory_id, quantity, shard),
+        )
+    )
+    if remaining_quantity is not None:
+        return remaining_quantity
+
+    # every shard is busy: waiting on one keeps its row locked even when it
+    # runs out meanwhile, so the attempt is made in a savepoint that releases
+    # the lock before all shards are locked in order
+    savepoint = await session.begin_nested()
+    remaining_quantity = await session.scalar(
+        get_shard_reservation(
+            inventory_id, quantity, ProductInventoryShard.shard == shard
+        )
+    )
+    if remaining_quantity is not None:
+        await savepoint.commit()
+        return remaining_quantity
+    await savepoint.rollback()
+    return await reserve_across_shards(session, inventory_id, quantity)
+
+
+async def reserve_quantity_for_cart_items(
+    session: AsyncSession, product_id: str, quantity: int
+) -> Optional[int]:
+    # products known to be sharded go straight to their shards; the known
+    # shard state may be stale, so a failed attempt only counts once the
+    # state is read again and found unchanged
+    if inventory := sharded_inventories.get(product_id):
+        remaining_quantity = await reserve_from_shards(session, *inventory, quantity)
+        if remaining_quantity is not None:
+            return remaining_quantity
+        if (current_inventory := await get_sharded_inventory(session, product_id)) and (
+            tuple(current_inventory) == inventory
+        ):
+            return None
 
-def get_single_inventory(session: Session, inventory_id: int) -> InventoryOutputSchema:
+    # checked and decremented in one statement, so concurrent reservations of
+    # the same product queue on its row lock instead of overselling it;
+    # negative quantities release items and always succeed
+    remaining_quantity = await session.scalar(
+        update(ProductInventory)
+        .filter(
+            ProductInventory.product_id == product_id,
+            ProductInventory.shard_count == 0,
+            ProductInventory.quantity_for_cart_items >= quantity,
+        )
+        .values(
+            quantity_for_cart_items=ProductInventory.quantity_for_cart_items - quantity
+        )
+        .returning(ProductInventory.quantity_for_cart_items)
+        .execution_options(synchronize_session=False)
+    )
+    if remaining_quantity is not None:
+        return remaining_quantity
+
+    if inventory := await get_sharded_inventory(session, product_id):
+        return await reserve_from_shards(session, *inventory, quantity)
+    return None
+
+
+async def reserve_quantities_for_cart_items(
+    session: AsyncSession, quantities: dict[str, int]
+) -> dict[str, Optional[int]]:
+    if not quantities:
+        return {}
+
+    # rows are locked in id order before they are updated, so batches sharing
+    # products cannot deadlock each other; products whose quantity is not
+    # available are left untouched and missing from the result
+    quantity = case(
+        *(
+            (ProductInventory.product_id == product_id, product_quantity)
+            for product_id, product_quantity in quantities.items()
+        )
+    )
+    locked_inventories = (
+        select(ProductInventory.id)
+        .filter(
+            ProductInventory.product_id.in_(quantities),
+            ProductInventory.shard_count == 0,
+        )
+        .order_by(ProductInventory.id)
+        .with_for_update()
+    )
+    remaining_quantities = dict(
+        (
+            await session.execute(
+                update(ProductInventory)
+                .filter(
+                    ProductInventory.id.in_(locked_inventories),
+                    ProductInventory.quantity_for_cart_items >= quantity,
+                )
+                .values(
+                    quantity_for_cart_items=ProductInventory.quantity_for_cart_items
+                    - quantity
+                )
+                .returning(
+                    ProductInventory.product_id,
+                    ProductInventory.quantity_for_cart_items,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        ).all()
+    )
+    # sharded products are reserved one by one in id order as well, each in
+    # a savepoint, so a deadlock or serialization failure on one of them is
+    # reported as None for that product without aborting the whole batch
+    for product_id in sorted(quantities.keys() - remaining_quantities.keys()):
+        if not (
+            inventory := sharded_inventories.get(product_id)
+            or await get_sharded_inventory(session, product_id)
+        ):
+            continue
+        savepoint = await session.begin_nested()
+        try:
+            remaining_quantity = await reserve_from_shards(
+                session, *inventory, quantities[product_id]
+            )
+        except DBAPIError as error:
+            await savepoint.rollback()
+            if getattr(error.orig, "sqlstate", None) not in CONFLICT_SQLSTATES:
+                raise
+            remaining_quantities[product_id] = None
+            continue
+        await savepoint.commit()
+        if remaining_quantity is not None:
+            remaining_quantities[product_id] = remaining_quantity
+    return remaining_quantities
+
+
+async def record_sold_quantity(
+    session: AsyncSession, product_id: str, quantity: int
+) -> None:
+    result = await session.execute(
+        update(ProductInventory)
+        .filter(
+            ProductInventory.product_id == product_id,
+            ProductInventory.shard_count == 0,
+        )
+        .values(
+            quantity=ProductInventory.quantity - quantity,
+            sold=ProductInventory.sold + quantity,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        return
+
+    # sharded sales are kept on a shard and folded into the inventory row by
+    # the rebalancing
+    if inventory := await get_sharded_inventory(session, product_id):
+        inventory_id, shard_count = inventory
+        await session.execute(
+            update(ProductInventoryShard)
+            .filter(
+                ProductInventoryShard.inventory_id == inventory_id,
+                ProductInventoryShard.shard == random.randrange(shard_count),
+            )
+            .values(sold=ProductInventoryShard.sold + quantity)
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def apply_inventory_shards(session: AsyncSession, inventories: list) -> list:
     if not (
-        inventory_object := if_exists(ProductInventory, "id", inventory_id, session)
+        inventory_ids := [
+            inventory.id
+            for inventory in inventories
+            if getattr(inventory, "shard_count", 1)
+        ]
+    ):
+        return inventories
+
+    totals = {
+        inventory_id: (quantity_for_cart_items, sold)
+        for inventory_id, quantity_for_cart_items, sold in await session.execute(
+            select(
+                ProductInventoryShard.inventory_id,
+                func.sum(ProductInventoryShard.quantity_for_cart_items),
+                func.sum(ProductInventoryShard.sold),
+            )
+            .filter(ProductInventoryShard.inventory_id.in_(inventory_ids))
+            .group_by(ProductInventoryShard.inventory_id)
+        )
+    }
+    for inventory in inventories:
+        if inventory.id not in totals:
+            continue
+        quantity_for_cart_items, sold = totals[inventory.id]
+        if hasattr(inventory, "quantity_for_cart_items"):
+            inventory.quantity_for_cart_items = quantity_for_cart_items
+        if hasattr(inventory, "quantity"):
+            inventory.quantity -= sold
+        if hasattr(inventory, "sold"):
+            inventory.sold += sold
+    return inventories
+
+
+async def rebalance_inventory(
+    session: AsyncSession,
+    inventory_id: str,
+    shard_count: Optional[int] = None,
+    quantity_change: int = 0,
+) -> None:
+    inventory = (
+        await session.execute(
+            select(
+                ProductInventory.quantity_for_cart_items, ProductInventory.shard_count
+            )
+            .filter(ProductInventory.id == inventory_id)
+            .with_for_update()
+        )
+    ).first()
+    shards = (
+        await session.execute(
+            select(
+                ProductInventoryShard.quantity_for_cart_items,
+                ProductInventoryShard.sold,
+            )
+            .filter(ProductInventoryShard.inventory_id == inventory_id)
+            .order_by(ProductInventoryShard.shard)
+            .with_for_update()
+        )
+    ).all()
+
+    # sales recorded on the shards are folded into the inventory row and the
+    # available quantity is split evenly again; while an inventory is sharded
+    # its own quantity_for_cart_items is only a snapshot of the shards
+    sold = sum(shard.sold for shard in shards)
+    if inventory.shard_count:
+        available_quantity = sum(shard.quantity_for_cart_items for shard in shards)
+    else:
+        available_quantity = inventory.quantity_for_cart_items
+    available_quantity += quantity_change
+    if shard_count is None:
+        shard_count = inventory.shard_count
+
+    await session.execute(
+        delete(ProductInventoryShard).filter(
+            ProductInventoryShard.inventory_id == inventory_id
+        )
+    )
+    if shard_count:
+        shard_quantity, remainder = divmod(available_quantity, shard_count)
+        await session.execute(
+            insert(ProductInventoryShard),
+            [
+                {
+                    "inventory_id": inventory_id,
+                    "shard": shard,
+                    "quantity_for_cart_items": shard_quantity + (shard < remainder),
+                    "sold": 0,
+                }
+                for shard in range(shard_count)
+            ],
+        )
+    await session.execute(
+        update(ProductInventory)
+        .filter(ProductInventory.id == inventory_id)
+        .values(
+            quantity=ProductInventory.quantity + quantity_change - sold,
+            sold=ProductInventory.sold + sold,
+            quantity_for_cart_items=available_quantity,
+            shard_count=shard_count,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rebalance_sharded_inventories(session: AsyncSession) -> None:
+    inventory_ids = (
+        await session.scalars(
+            select(ProductInventory.id).filter(ProductInventory.shard_count > 0)
+        )
+    ).all()
+    for inventory_id in inventory_ids:
+        await rebalance_inventory(session, inventory_id)
+        await session.commit()
+
+
+async def get_single_inventory(
+    session: AsyncSession, inventory_id: int
+) -> InventoryOutputSchema:
+    if not (
+        inventory_object := await if_exists(
+            ProductInventory, "id", inventory_id, session
+        )
     ):
         raise DoesNotExist(ProductInventory.__name__, "id", inventory_id)
 
-    return InventoryOutputSchema.from_orm(inventory_object)
+    inventory = InventoryOutputSchema.from_orm(inventory_object)
+    await apply_inventory_shards(session, [inventory])
+    return inventory
 
 
-def get_all_inventories(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_all_inventories(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema[InventoryOutputSchema]:
     query = select(ProductInventory)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, ProductInventory)
 
-    return paginate(
+    fields = parse_fieldset(page_params.fields)
+    exclude = parse_fieldset(page_params.exclude)
+    response_schema = get_fieldset_schema(InventoryOutputSchema, fields, exclude)
+    if response_schema is not InventoryOutputSchema:
+        # shard totals are matched on these fields, so they are selected even
+        # when the fieldset leaves them out and stripped again afterwards
+        page_params = page_params.copy(
+            update={
+                "fields": ",".join(fields + SHARD_KEY_FIELDS) if fields else None,
+                "exclude": ",".join(set(exclude) - set(SHARD_KEY_FIELDS)) or None,
+            }
+        )
+
+    page = await paginate(
         query=query,
         response_schema=InventoryOutputSchema,
         table=ProductInventory,
         page_params=page_params,
         session=session,
     )
+    await apply_inventory_shards(session, page.results)
+    if response_schema is InventoryOutputSchema:
+        return page
 
+    results = [
+        response_schema.construct(
+            **{name: getattr(inventory, name) for name in response_schema.__fields__}
+        )
+        for inventory in page.results
+    ]
+    return get_page_schema(response_schema)(**{**dict(page), "results": results})
 
-def update_single_inventory(
-    session: Session, inventory_input: InventoryUpdateSchema, inventory_id: int
+
+async def update_single_inventory(
+    session: AsyncSession, inventory_input: InventoryUpdateSchema, inventory_id: int
 ) -> InventoryOutputSchema:
     if not (
-        inventory_object := if_exists(ProductInventory, "id", inventory_id, session)
+        inventory_object := await if_exists(
+            ProductInventory, "id", inventory_id, session
+        )
     ):
         raise DoesNotExist(ProductInventory.__name__, "id", inventory_id)
 
+    inventory = await get_single_inventory(session, inventory_id)
     inventory_data = inventory_input.dict(exclude_unset=True)
-    items_in_carts = (
-        inventory_object.quantity - inventory_object.quantity_for_cart_items
-    )
+    quantity = inventory_data.get("quantity")
+    if quantity is None:
+        quantity = inventory.quantity
+    shard_count = inventory_data.get("shard_count")
+    if shard_count is None:
+        shard_count = inventory.shard_count
 
-    if inventory_data.get("quantity") < items_in_carts:
+    items_in_carts = inventory.quantity - inventory.quantity_for_cart_items
+    if quantity < items_in_carts:
         raise QuantityLowerThanAmountOfProductItemsInCartsException
 
-    if inventory_object.quantity != inventory_data.get("quantity"):
-        quantity_difference = inventory_object.quantity - inventory_data.get("quantity")
-        inventory_data["quantity_for_cart_items"] = (
-            inventory_object.quantity_for_cart_items - quantity_difference
-        )
-
-        statement = (
-            update(ProductInventory)
-            .filter(ProductInventory.id == inventory_id)
-            .values(**inventory_data)
-        )
+    if inventory.quantity != quantity or inventory.shard_count != shard_count:
+        quantity_change = quantity - inventory.quantity
+        if inventory.shard_count or shard_count:
+            await rebalance_inventory(
+                session, inventory_id, shard_count, quantity_change
+            )
+        else:
+            statement = (
+                update(ProductInventory)
+                .filter(ProductInventory.id == inventory_id)
+                .values(
+                    quantity=quantity,
+                    quantity_for_cart_items=ProductInventory.quantity_for_cart_items
+                    + quantity_change,
+                )
+            )
+            await session.execute(statement)
 
-        session.execute(statement)
-        session.commit()
+        await session.commit()
+        sharded_inventories.pop(inventory_object.product_id, None)
+        await invalidate_product(inventory_object.product_id)
 
-    return get_single_inventory(session, inventory_id=inventory_id)
+    return await get_single_inventory(session, inventory_id=inventory_id)
@@ -1,7 +1,11 @@
-from typing import Union
+import datetime
+import re
+from typing import Optional, Union
 
-from sqlalchemy import delete, insert, select, update
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, func, insert, literal_column, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
 from src.apps.orders.models import Cart, CartItem
 from src.apps.orders.services.cart_items_services import (
@@ -22,41 +26,78 @@ from src.apps.products.schemas import (
     ProductWithoutInventoryOutputSchema,
     RemovedProductOutputSchema,
 )
-from src.apps.products.services.inventory_services import update_single_inventory
+from src.apps.products.services.autocomplete_services import (
+    PRODUCT_KIND,
+    autocomplete_index,
+)
+from src.apps.products.services.cache_services import (
+    PRODUCT_LIST_VERSION,
+    get_product_entity_versions,
+    invalidate_product,
+    invalidate_product_list,
+)
+from src.apps.products.services.facet_services import (
+    adjust_category_product_counts,
+    get_category_facets,
+    get_product_category_ids,
+)
+from src.apps.products.services.inventory_services import (
+    apply_inventory_shards,
+    update_single_inventory,
+)
+from src.core.cache import cache, get_params_digest
+from src.core.conditional import Validators, get_validators
+from src.core.eager_loading import get_eager_load_options
 from src.core.exceptions import (
     AlreadyExists,
     DoesNotExist,
+    InvalidSearchQueryException,
     IsOccupied,
     ProductAlreadyRemovedFromStoreException,
     ProductRemovedFromStoreException,
     ServiceException,
 )
 from src.core.pagination.models import PageParams
-from src.core.pagination.schemas import PagedResponseSchema
-from src.core.pagination.services import paginate
-from src.core.utils.utils import filter_and_sort_instances, if_exists
+from src.core.pagination.schemas import FacetCountSchema, PagedResponseSchema
+from src.core.pagination.services import is_listing_cacheable, paginate
+from src.core.utils.constants import SEARCH_CONFIG, SORT_PARAMS_HEADER
+from src.core.utils.utils import (
+    filter_and_sort_instances,
+    get_filter_params,
+    if_exists,
+    get_current_time,
+    is_valid_uuid,
+    serialize_instance,
+)
+from src.settings.cache import settings as cache_settings
 
+# updated_at of the product, of its latest category and the linked category ids
+ProductVersions = tuple[
+    datetime.datetime, Optional[datetime.datetime], list[Optional[str]]
+]
 
-def create_product(
-    session: Session, product: ProductInputSchema
+
+async def create_product(
+    session: AsyncSession, product: ProductInputSchema
 ) -> ProductOutputSchema:
     product_data = product.dict()
 
     if product_data.get("name"):
-        name_check = session.scalar(
+        name_check = await session.scalar(
             select(Product).filter(Product.name == product_data["name"]).limit(1)
         )
         if name_check:
             raise AlreadyExists(Product.__name__, "name", product.name)
 
     if category_ids := product_data.pop("category_ids"):
-        categories = session.scalars(
-            select(Category).where(Category.id.in_(category_ids))
+        categories = (
+            await session.scalars(select(Category).where(Category.id.in_(category_ids)))
         ).all()
         if not len(set(category_ids)) == len(categories):
             raise ServiceException("Wrong categories!")
 
         product_data["categories"] = categories
+        await adjust_category_product_counts(session, category_ids, 1)
 
     if product_data.get("inventory"):
         inventory_data = product_data.pop("inventory")
@@ -64,7 +105,7 @@ def create_product(
     new_product = Product(**product_data)
 
     session.add(new_product)
-    session.commit()
+    await session.commit()
 
     new_inventory = ProductInventory(
         quantity=inventory_data["quantity"],
@@ -72,85 +113,249 @@ def create_product(
         product_id=new_product.id,
     )
     session.add(new_inventory)
-    session.commit()
+    await session.commit()
+    autocomplete_index.add(PRODUCT_KIND, new_product.id, new_product.name, 0)
+    await invalidate_product_list()
 
-    return ProductOutputSchema.from_orm(new_product)
+    return await serialize_instance(session, ProductOutputSchema, new_product)
 
 
-def get_available_single_product(
-    session: Session, product_id: str
+async def get_available_single_product(
+    session: AsyncSession, product_id: str
 ) -> Union[ProductWithoutInventoryOutputSchema, RemovedProductOutputSchema]:
-    if not (product_object := if_exists(Product, "id", product_id, session)):
+    cache_key = await cache.get_key(
+        "product", product_id, get_product_entity_versions(product_id)
+    )
+    if product := await cache.get(cache_key, ProductWithoutInventoryOutputSchema):
+        return product
+
+    if not (product_object := await if_exists(Product, "id", product_id, session)):
         raise DoesNotExist(Product.__name__, "id", product_id)
 
     if product_object.removed_from_store:
         return RemovedProductOutputSchema.from_orm(product_object)
-    return ProductWithoutInventoryOutputSchema.from_orm(product_object)
+    product = await serialize_instance(
+        session, ProductWithoutInventoryOutputSchema, product_object
+    )
+    await cache.set(cache_key, product, cache_settings.CACHE_PRODUCT_TTL)
+    return product
 
 
-def get_single_product_or_inventory(
-    session: Session, product_id: str, get_inventory=False
-) -> Union[ProductOutputSchema, InventoryOutputSchema]:
-    if not (product_object := if_exists(Product, "id", product_id, session)):
+async def get_available_product_validators(
+    session: AsyncSession, product_id: str
+) -> Validators:
+    if not is_valid_uuid(product_id):
+        raise DoesNotExist(Product.__name__, "id", product_id)
+
+    # cached under the same versions as the product itself, so conditional
+    # requests are answered without touching the database until a write
+    cache_key = await cache.get_key(
+        "product-validators", product_id, get_product_entity_versions(product_id)
+    )
+    if versions := await cache.get(cache_key, ProductVersions):
+        return get_validators(Product.__name__, product_id, *versions)
+
+    row = (
+        await session.execute(
+            select(
+                Product.updated_at,
+                func.max(Category.updated_at),
+                func.array_agg(aggregate_order_by(Category.id.distinct(), Category.id)),
+            )
+            .outerjoin(
+                category_product_association_table,
+                category_product_association_table.c.product_id == Product.id,
+            )
+            .outerjoin(
+                Category,
+                Category.id == category_product_association_table.c.category_id,
+            )
+            .filter(Product.id == product_id)
+            .group_by(Product.id)
+        )
+    ).first()
+    if row is None:
         raise DoesNotExist(Product.__name__, "id", product_id)
+    await cache.set(cache_key, tuple(row), cache_settings.CACHE_PRODUCT_TTL)
+    return get_validators(Product.__name__, product_id, *row)
 
+
+async def get_product_inventory(
+    session: AsyncSession, product_id: str
+) -> InventoryOutputSchema:
+    if not is_valid_uuid(product_id):
+        raise DoesNotExist(Product.__name__, "id", product_id)
+    if not (
+        inventory_object := await session.scalar(
+            select(ProductInventory)
+            .filter(ProductInventory.product_id == product_id)
+            .limit(1)
+        )
+    ):
+        raise DoesNotExist(Product.__name__, "id", product_id)
+
+    inventory = InventoryOutputSchema.from_orm(inventory_object)
+    await apply_inventory_shards(session, [inventory])
+    return inventory
+
+
+async def get_single_product_or_inventory(
+    session: AsyncSession, product_id: str, get_inventory=False
+) -> Union[ProductOutputSchema, InventoryOutputSchema]:
+    # stock levels change with every cart and order, so the inventory is
+    # always read from the database and only the product itself is cached
     if get_inventory:
-        return InventoryOutputSchema.from_orm(product_object.inventory)
+        return await get_product_inventory(session, product_id)
+
+    cache_key = await cache.get_key(
+        "product-detail", product_id, get_product_entity_versions(product_id)
+    )
+    if product := await cache.get(cache_key, ProductOutputSchema):
+        product.inventory = await get_product_inventory(session, product_id)
+        return product
+
+    if not (
+        product_object := await if_exists(
+            Product,
+            "id",
+            product_id,
+            session,
+            options=get_eager_load_options(Product, ProductOutputSchema),
+        )
+    ):
+        raise DoesNotExist(Product.__name__, "id", product_id)
 
-    return ProductOutputSchema.from_orm(product_object)
+    product = await serialize_instance(session, ProductOutputSchema, product_object)
+    await cache.set(cache_key, product, cache_settings.CACHE_PRODUCT_TTL)
+    if product.inventory:
+        await apply_inventory_shards(session, [product.inventory])
+    return product
 
 
-def get_all_available_products(
-    session: Session,
-    page_params: PageParams,
+def get_ts_query(search_query: str):
+    words = re.findall(r"\w+", search_query)
+    if not words:
+        raise InvalidSearchQueryException
+    return func.to_tsquery(
+        literal_column(f"'{SEARCH_CONFIG}'"), " & ".join(f"{word}:*" for word in words)
+    )
+
+
+def get_products_query(
     get_removed: bool = False,
     query_params: list[tuple] = None,
-) -> Union[
-    PagedResponseSchema[ProductWithoutInventoryOutputSchema],
-    PagedResponseSchema[ProductOutputSchema],
-]:
-    schema = ProductOutputSchema
+    search_query: Optional[str] = None,
+):
     query = select(Product)
     if not get_removed:
-        schema = ProductWithoutInventoryOutputSchema
-        query = select(Product).filter(Product.removed_from_store == False)
-
-    query = query.join(
-        category_product_association_table,
-        Product.id == category_product_association_table.c.product_id,
-        isouter=True,
-    ).join(
-        Category,
-        category_product_association_table.c.category_id == Category.id,
-        isouter=True,
-    )
+        query = query.filter(Product.removed_from_store == False)
+
+    if search_query is not None:
+        ts_query = get_ts_query(search_query)
+        query = query.filter(Product.search_vector.op("@@")(ts_query))
+        if not any(key == SORT_PARAMS_HEADER for key, _ in query_params or []):
+            query = query.order_by(
+                func.ts_rank(Product.search_vector, ts_query).desc(), Product.id
+            )
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, Product)
+    return query
+
 
-    return paginate(
-        query=query,
+async def get_product_facets(
+    session: AsyncSession,
+    get_removed: bool = False,
+    query_params: list[tuple] = None,
+    search_query: Optional[str] = None,
+) -> list[FacetCountSchema]:
+    if get_removed or search_query is not None or get_filter_params(query_params or []):
+        return await get_category_facets(
+            session, get_products_query(get_removed, query_params, search_query)
+        )
+    return await get_category_facets(session)
+
+
+async def get_all_available_products(
+    session: AsyncSession,
+    page_params: PageParams,
+    get_removed: bool = False,
+    query_params: list[tuple] = None,
+    search_query: Optional[str] = None,
+    with_facets: bool = False,
+) -> Union[
+    PagedResponseSchema[ProductWithoutInventoryOutputSchema],
+    PagedResponseSchema[ProductOutputSchema],
+]:
+    schema = ProductOutputSchema if get_removed else ProductWithoutInventoryOutputSchema
+    cache_key = ""
+    if is_listing_cacheable(page_params) and not get_removed:
+        cache_key = await cache.get_key(
+            "products",
+            get_params_digest(
+                sorted(query_params or []), page_params, search_query, with_facets
+            ),
+            [PRODUCT_LIST_VERSION],
+        )
+        if page := await cache.get(cache_key, PagedResponseSchema[schema]):
+            return page
+
+    page = await paginate(
+        query=get_products_query(get_removed, query_params, search_query),
         response_schema=schema,
         table=Product,
         page_params=page_params,
         session=session,
     )
+    if with_facets:
+        page.facets = await get_product_facets(
+            session, get_removed, query_params, search_query
+        )
+    await cache.set(cache_key, page, cache_settings.CACHE_LISTING_TTL)
+    return page
+
+
+async def search_available_products(
+    session: AsyncSession,
+    search_query: str,
+    page_params: PageParams,
+    query_params: list[tuple] = None,
+    with_facets: bool = False,
+) -> PagedResponseSchema[ProductWithoutInventoryOutputSchema]:
+    return await get_all_available_products(
+        session,
+        page_params,
+        query_params=query_params,
+        search_query=search_query,
+        with_facets=with_facets,
+    )
 
 
-def get_all_products(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_all_products(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema[ProductOutputSchema]:
-    return get_all_available_products(
+    return await get_all_available_products(
         session, page_params, get_removed=True, query_params=query_params
     )
 
 
-def update_single_product(
-    session: Session, product_input: ProductUpdateSchema, product_id: str
+async def update_single_product(
+    session: AsyncSession, product_input: ProductUpdateSchema, product_id: str
 ) -> ProductOutputSchema:
     product_was_updated = 0
 
-    if not (product_object := if_exists(Product, "id", product_id, session)):
+    if not (
+        product_object := await if_exists(
+            Product,
+            "id",
+            product_id,
+            session,
+            options=[
+                selectinload(Product.categories),
+                selectinload(Product.inventory),
+            ],
+        )
+    ):
         raise DoesNotExist(Product.__name__, "id", product_id)
 
     if product_object.removed_from_store:
@@ -159,7 +364,7 @@ def update_single_product(
     product_data = product_input.dict(exclude_none=True)
 
     if product_data.get("name"):
-        product_name_check = session.scalar(
+        product_name_check = await session.scalar(
             select(Product).filter(Product.name == product_input.name).limit(1)
         )
         if product_name_check and (product_name_check.id != product_id):
@@ -168,11 +373,11 @@ def update_single_product(
     if (new_product_price := product_data.get("price")) and (
         product_data.get("price") != product_object.price
     ):
-        cart_items = session.scalars(
+        cart_items = await session.scalars(
             select(CartItem).filter(CartItem.product_id == product_object.id)
         )
         for cart_item in cart_items:
-            cart = session.scalar(
+            cart = await session.scalar(
                 select(Cart).filter(Cart.id == cart_item.cart_id).limit(1)
             )
             new_cart_item_price = new_product_price * cart_item.quantity
@@ -185,16 +390,20 @@ def update_single_product(
             cart_item.cart_item_price = new_cart_item_price
             session.add(cart_item)
 
+    categories_were_updated = False
     if (product_data.get("category_ids")) or ("category_ids" in product_data.keys()):
         incoming_categories = set(product_data["category_ids"])
         current_categories = set(category.id for category in product_object.categories)
 
         if to_delete := (current_categories - incoming_categories):
-            session.execute(
+            await session.execute(
                 delete(category_product_association_table).where(
-                    Category.id.in_(to_delete)
+                    category_product_association_table.c.product_id == product_id,
+                    category_product_association_table.c.category_id.in_(to_delete),
                 )
             )
+            await adjust_category_product_counts(session, to_delete, -1)
+            categories_were_updated = True
             product_was_updated += 1
 
         if to_insert := (incoming_categories - current_categories):
@@ -202,7 +411,11 @@ def update_single_product(
                 {"product_id": product_id, "category_id": category_id}
                 for category_id in to_insert
             ]
-            session.execute(insert(category_product_association_table).values(rows))
+            await session.execute(
+                insert(category_product_association_table).values(rows)
+            )
+            await adjust_category_product_counts(session, to_insert, 1)
+            categories_were_updated = True
             product_was_updated += 1
 
         product_data.pop("category_ids")
@@ -210,7 +423,7 @@ def update_single_product(
     if "inventory" in product_data.keys():
         if product_data.get("inventory"):
             inventory_data = product_data.pop("inventory")
-            update_single_inventory(
+            await update_single_inventory(
                 session,
                 InventoryUpdateSchema(**inventory_data),
                 product_object.inventory.id,
@@ -220,34 +433,43 @@ def update_single_product(
         else:
             product_data.pop("inventory")
 
-    if product_data:
+    if product_data or categories_were_updated:
         statement = (
-            update(Product).filter(Product.id == product_id).values(**product_data)
+            update(Product)
+            .filter(Product.id == product_id)
+            .values(**product_data, updated_at=get_current_time())
         )
 
-        session.execute(statement)
+        await session.execute(statement)
         product_was_updated += 1
 
     if product_was_updated:
-        session.commit()
-        session.refresh(product_object)
+        await session.commit()
+        await session.refresh(product_object)
+        autocomplete_index.add(PRODUCT_KIND, product_id, product_object.name)
+        await invalidate_product(product_id)
 
-    return get_single_product_or_inventory(session, product_id=product_id)
+    return await get_single_product_or_inventory(session, product_id=product_id)
 
 
-def remove_single_product_from_store(
-    session: Session, product_id: str
+async def remove_single_product_from_store(
+    session: AsyncSession, product_id: str
 ) -> dict[str, str]:
-    if not (product_object := if_exists(Product, "id", product_id, session)):
+    if not (product_object := await if_exists(Product, "id", product_id, session)):
         raise DoesNotExist(Product.__name__, "id", product_id)
 
     if product_object.removed_from_store:
         raise ProductAlreadyRemovedFromStoreException
 
-    delete_cart_items_with_product_removed_from_store(session, product_id)
+    await delete_cart_items_with_product_removed_from_store(session, product_id)
+    await adjust_category_product_counts(
+        session, await get_product_category_ids(session, product_id), -1
+    )
 
     product_object.removed_from_store = True
     session.add(product_object)
-    session.commit()
+    await session.commit()
+    autocomplete_index.remove(PRODUCT_KIND, product_id)
+    await invalidate_product(product_id)
 
     return {"message": "Product has been removed from the store"}
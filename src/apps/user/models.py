@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Date, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -8,9 +8,14 @@ from src.database.db_connection import Base
 
 class User(Base):
     __tablename__ = "user"
+    __table_args__ = (Index("ix_user_last_name_email_id", "last_name", "email", "id"),)
 
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     first_name = Column(String(length=50), nullable=False)
     last_name = Column(String(length=75), nullable=False)
@@ -30,7 +35,11 @@ class User(Base):
 class UserAddress(Base):
     __tablename__ = "user_address"
     id = Column(
-        String, primary_key=True, unique=True, nullable=False, default=generate_uuid
+        UUID(as_uuid=False),
+        primary_key=True,
+        unique=True,
+        nullable=False,
+        default=generate_uuid,
     )
     country = Column(String(length=80), nullable=False)
     state = Column(String(length=100), nullable=False)
@@ -40,8 +49,9 @@ class UserAddress(Base):
     house_number = Column(String(length=50), nullable=False)
     apartment_number = Column(String(length=50), nullable=True)
     user_id = Column(
-        String,
+        UUID(as_uuid=False),
         ForeignKey("user.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
+        index=True,
     )
     user = relationship("User", back_populates="address")
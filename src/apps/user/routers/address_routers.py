@@ -1,6 +1,6 @@
 from fastapi import Depends, Request, Response, status
 from fastapi.routing import APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.user.models import User
 from src.apps.user.schemas import AddressOutputSchema, AddressUpdateSchema
@@ -12,10 +12,13 @@ from src.apps.user.services.address_services import (
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.permissions import check_if_staff
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_db, get_read_db
 from src.dependencies.user import authenticate_user
 
-address_router = APIRouter(prefix="/addresses", tags=["address"])
+address_router = APIRouter(
+    prefix="/addresses", tags=["address"], route_class=SchemaResponseRoute
+)
 
 
 @address_router.get(
@@ -23,14 +26,14 @@ address_router = APIRouter(prefix="/addresses", tags=["address"])
     response_model=PagedResponseSchema[AddressOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_addresses(
+async def get_addresses(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[AddressOutputSchema]:
     check_if_staff(request_user)
-    return get_all_addresses(db, page_params, request.query_params.multi_items())
+    return await get_all_addresses(db, page_params, request.query_params.multi_items())
 
 
 @address_router.get(
@@ -38,13 +41,13 @@ def get_addresses(
     response_model=AddressOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def get_address(
+async def get_address(
     address_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> AddressOutputSchema:
     check_if_staff(request_user)
-    return get_single_address(db, address_id)
+    return await get_single_address(db, address_id)
 
 
 @address_router.patch(
@@ -52,11 +55,11 @@ def get_address(
     response_model=AddressOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def update_address(
+async def update_address(
     address_id: str,
     address: AddressUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> AddressOutputSchema:
     check_if_staff(request_user)
-    return update_single_address(db, address, address_id)
+    return await update_single_address(db, address, address_id)
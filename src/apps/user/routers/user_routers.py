@@ -3,7 +3,7 @@ from typing import Union
 from fastapi import BackgroundTasks, Depends, Request, Response, status
 from fastapi.routing import APIRouter
 from fastapi_jwt_auth import AuthJWT
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.jwt.schemas import AccessTokenOutputSchema
 from src.apps.orders.schemas import OrderOutputSchema
@@ -27,44 +27,47 @@ from src.apps.user.services.user_services import (
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.permissions import check_if_staff, check_if_staff_or_owner
-from src.dependencies.get_db import get_db
+from src.core.responses import SchemaResponseRoute
+from src.dependencies.get_db import get_db, get_read_db
 from src.dependencies.user import authenticate_user
 
-user_router = APIRouter(prefix="/users", tags=["users"])
+user_router = APIRouter(
+    prefix="/users", tags=["users"], route_class=SchemaResponseRoute
+)
 
 
 @user_router.post(
     "/register", response_model=UserOutputSchema, status_code=status.HTTP_201_CREATED
 )
-def create_user(
+async def create_user(
     user: UserRegisterSchema,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> UserOutputSchema:
-    return register_user(db, user, background_tasks)
+    return await register_user(db, user, background_tasks)
 
 
 @user_router.post(
     "/login", status_code=status.HTTP_200_OK, response_model=AccessTokenOutputSchema
 )
-def login_user(
+async def login_user(
     user_login_schema: UserLoginInputSchema,
     auth_jwt: AuthJWT = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> AccessTokenOutputSchema:
-    return get_access_token_schema(user_login_schema, db, auth_jwt)
+    return await get_access_token_schema(user_login_schema, db, auth_jwt)
 
 
 @user_router.get(
     "/me",
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(authenticate_user)],
     response_model=UserOutputSchema,
 )
-def get_logged_user(
+async def get_logged_user(
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> UserOutputSchema:
-    return UserOutputSchema.from_orm(request_user)
+    return await get_single_user(db, request_user.id)
 
 
 @user_router.get(
@@ -72,28 +75,28 @@ def get_logged_user(
     response_model=PagedResponseSchema[UserOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_users(
+async def get_users(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[UserOutputSchema]:
     check_if_staff(request_user)
-    return get_all_users(db, page_params, request.query_params.multi_items())
+    return await get_all_users(db, page_params, request.query_params.multi_items())
 
 
 @user_router.get(
     "/{user_id}",
     status_code=status.HTTP_200_OK,
 )
-def get_user(
+async def get_user(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     request_user: User = Depends(authenticate_user),
 ) -> Union[UserInfoOutputSchema, UserOutputSchema]:
     if request_user.is_staff:
-        return get_single_user(db, user_id)
-    return get_single_user(db, user_id, output_schema=UserInfoOutputSchema)
+        return await get_single_user(db, user_id)
+    return await get_single_user(db, user_id, output_schema=UserInfoOutputSchema)
 
 
 @user_router.get(
@@ -101,16 +104,16 @@ def get_user(
     response_model=PagedResponseSchema[OrderOutputSchema],
     status_code=status.HTTP_200_OK,
 )
-def get_user_orders(
+async def get_user_orders(
     request: Request,
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page_params: PageParams = Depends(),
     request_user: User = Depends(authenticate_user),
 ) -> PagedResponseSchema[OrderOutputSchema]:
     check_if_staff(request_user)
-    return get_all_user_orders(
-        db, user_id, page_params, request.query_params.multi_items()
+    return await get_all_user_orders(
+        db, user_id, page_params, request.query_params.multi_items(), as_staff=True
     )
 
 
@@ -119,25 +122,25 @@ def get_user_orders(
     response_model=UserOutputSchema,
     status_code=status.HTTP_200_OK,
 )
-def update_user(
+async def update_user(
     user_id: str,
     user: UserUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> UserOutputSchema:
     check_if_staff_or_owner(request_user, "id", user_id)
-    return update_single_user(db, user, user_id)
+    return await update_single_user(db, user, user_id)
 
 
 @user_router.delete(
     "/{user_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_user(
+async def delete_user(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     request_user: User = Depends(authenticate_user),
 ) -> Response:
     check_if_staff(request_user)
-    delete_single_user(db, user_id)
+    await delete_single_user(db, user_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
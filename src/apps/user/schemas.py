@@ -101,3 +101,14 @@ class UserOutputSchema(UserBaseSchema):
 
     class Config:
         orm_mode = True
+
+
+class UserPrincipalSchema(BaseModel):
+    id: str
+    email: str
+    is_active: bool
+    is_superuser: bool
+    is_staff: bool
+
+    class Config:
+        orm_mode = True
@@ -1,5 +1,5 @@
 from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.user.models import UserAddress
 from src.apps.user.schemas import AddressOutputSchema, AddressUpdateSchema
@@ -10,22 +10,24 @@ from src.core.pagination.services import paginate
 from src.core.utils.utils import filter_and_sort_instances, if_exists
 
 
-def get_single_address(session: Session, address_id: int) -> AddressOutputSchema:
-    if not (address_object := if_exists(UserAddress, "id", address_id, session)):
+async def get_single_address(
+    session: AsyncSession, address_id: int
+) -> AddressOutputSchema:
+    if not (address_object := await if_exists(UserAddress, "id", address_id, session)):
         raise DoesNotExist(UserAddress.__name__, "id", address_id)
 
     return AddressOutputSchema.from_orm(address_object)
 
 
-def get_all_addresses(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_all_addresses(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema[AddressOutputSchema]:
     query = select(UserAddress)
 
     if query_params:
         query = filter_and_sort_instances(query_params, query, UserAddress)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=AddressOutputSchema,
         table=UserAddress,
@@ -34,10 +36,10 @@ def get_all_addresses(
     )
 
 
-def update_single_address(
-    session: Session, address_input: AddressUpdateSchema, address_id: int
+async def update_single_address(
+    session: AsyncSession, address_input: AddressUpdateSchema, address_id: int
 ) -> AddressOutputSchema:
-    if not if_exists(UserAddress, "id", address_id, session):
+    if not await if_exists(UserAddress, "id", address_id, session):
         raise DoesNotExist(UserAddress.__name__, "id", address_id)
 
     address_data = address_input.dict(exclude_unset=True)
@@ -49,7 +51,7 @@ def update_single_address(
             .values(**address_data)
         )
 
-        session.execute(statement)
-        session.commit()
+        await session.execute(statement)
+        await session.commit()
 
-    return get_single_address(session, address_id=address_id)
+    return await get_single_address(session, address_id=address_id)
@@ -0,0 +1,108 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.user.models import User
+from src.apps.user.schemas import UserPrincipalSchema
+from src.core.cache import cache
+from src.settings.cache import settings
+
+PRINCIPAL_NAMESPACE = "principal"
+
+
+def get_principal_version(subject: str) -> str:
+    return f"principal:{subject}"
+
+
+class PrincipalCache:
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.entries: OrderedDict[
+            str, tuple[float, UserPrincipalSchema]
+        ] = OrderedDict()
+        self.generation = 0
+
+    def get(self, subject: str) -> Optional[UserPrincipalSchema]:
+        if (entry := self.entries.get(subject)) is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            del self.entries[subject]
+            return None
+        self.entries.move_to_end(subject)
+        return principal
+
+    def set(
+        self, subject: str, principal: UserPrincipalSchema, generation: int
+    ) -> None:
+        # a lookup that started before an invalidation may have read the old
+        # row, so it is only stored when nothing was invalidated in between
+        if generation != self.generation or self.max_size <= 0:
+            return
+        self.entries[subject] = (time.monotonic() + self.ttl, principal)
+        self.entries.move_to_end(subject)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, *subjects: str) -> None:
+        self.generation += 1
+        for subject in subjects:
+            self.entries.pop(subject, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self.entries.clear()
+
+
+principal_cache = PrincipalCache(
+    settings.PRINCIPAL_CACHE_TTL, settings.PRINCIPAL_CACHE_MAX_SIZE
+)
+
+
+async def load_principal(
+    session: AsyncSession, subject: str
+) -> Optional[UserPrincipalSchema]:
+    principal = await session.execute(
+        select(
+            User.id, User.email, User.is_active, User.is_superuser, User.is_staff
+        ).filter(User.email == subject)
+    )
+    if (row := principal.first()) is None:
+        return None
+    return UserPrincipalSchema(**row._mapping)
+
+
+async def get_principal(
+    session: AsyncSession, subject: str
+) -> Optional[UserPrincipalSchema]:
+    if not settings.PRINCIPAL_CACHE_ENABLED:
+        return await load_principal(session, subject)
+
+    if settings.PRINCIPAL_CACHE_SHARED:
+        key = await cache.get_key(
+            PRINCIPAL_NAMESPACE, subject, [get_principal_version(subject)]
+        )
+        if principal := await cache.get(key, UserPrincipalSchema):
+            return principal
+        if principal := await load_principal(session, subject):
+            await cache.set(key, principal, settings.PRINCIPAL_CACHE_TTL)
+        return principal
+
+    if principal := principal_cache.get(subject):
+        return principal
+    generation = principal_cache.generation
+    if principal := await load_principal(session, subject):
+        principal_cache.set(subject, principal, generation)
+    return principal
+
+
+async def invalidate_principal(*subjects: str) -> None:
+    principal_cache.invalidate(*subjects)
+    if settings.PRINCIPAL_CACHE_SHARED:
+        await cache.invalidate(
+            *(get_principal_version(subject) for subject in subjects)
+        )
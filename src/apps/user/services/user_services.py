@@ -4,18 +4,21 @@ from fastapi import BackgroundTasks
 from fastapi_jwt_auth import AuthJWT
 from pydantic import BaseModel
 from sqlalchemy import delete, select, update
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.emails.services import send_activation_email
 from src.apps.jwt.schemas import AccessTokenOutputSchema
+from src.apps.jwt.services import get_principal_claims, revoke_subjects
 from src.apps.user.models import User, UserAddress
 from src.apps.user.schemas import (
     UserLoginInputSchema,
     UserOutputSchema,
+    UserPrincipalSchema,
     UserRegisterSchema,
     UserUpdateSchema,
 )
-from src.apps.user.utils import passwd_context
+from src.apps.user.services.principal_services import invalidate_principal
+from src.core.eager_loading import get_eager_load_options
 from src.core.exceptions import (
     AccountNotActivatedException,
     AlreadyExists,
@@ -24,25 +27,36 @@ from src.core.exceptions import (
     IsOccupied,
     ServiceException,
 )
+from src.core.hashing import password_hasher
 from src.core.pagination.models import PageParams
 from src.core.pagination.schemas import PagedResponseSchema
 from src.core.pagination.services import paginate
-from src.core.utils.utils import confirm_token, filter_and_sort_instances, if_exists
+from src.core.utils.utils import (
+    confirm_token,
+    filter_and_sort_instances,
+    if_exists,
+    serialize_instance,
+)
+from src.settings.jwt_settings import settings as token_settings
 
 
-def hash_user_password(password: str) -> str:
-    return passwd_context.hash(password)
+async def hash_user_password(password: str) -> str:
+    return await password_hasher.hash(password)
 
 
-def register_user_base(session: Session, user: UserRegisterSchema) -> tuple[Any]:
+async def register_user_base(
+    session: AsyncSession, user: UserRegisterSchema
+) -> tuple[Any]:
     user_data = user.dict()
     if user_data.pop("password_repeat"):
-        user_data["password"] = hash_user_password(password=user_data.pop("password"))
+        user_data["password"] = await hash_user_password(
+            password=user_data.pop("password")
+        )
 
-    username_check = session.scalar(
+    username_check = await session.scalar(
         select(User).filter(User.username == user_data["username"]).limit(1)
     )
-    email_check = session.scalar(
+    email_check = await session.scalar(
         select(User).filter(User.email == user_data["email"]).limit(1)
     )
 
@@ -60,25 +74,25 @@ def register_user_base(session: Session, user: UserRegisterSchema) -> tuple[Any]
     return new_user, new_address
 
 
-def register_user(
-    session: Session, user: UserRegisterSchema, background_tasks: BackgroundTasks
+async def register_user(
+    session: AsyncSession, user: UserRegisterSchema, background_tasks: BackgroundTasks
 ) -> UserOutputSchema:
-    new_user, new_address = register_user_base(session, user)
+    new_user, new_address = await register_user_base(session, user)
 
     session.add(new_user)
-    session.commit()
+    await session.commit()
 
     new_address.user_id = new_user.id
     session.add(new_address)
-    session.commit()
+    await session.commit()
 
     send_activation_email(new_user.email, session, background_tasks)
 
-    return UserOutputSchema.from_orm(new_user)
+    return await serialize_instance(session, UserOutputSchema, new_user)
 
 
-def activate_account(session: Session, email: str) -> None:
-    user = if_exists(User, "email", email, session)
+async def activate_account(session: AsyncSession, email: str) -> None:
+    user = await if_exists(User, "email", email, session)
 
     if user is None:
         raise DoesNotExist(User.__name__, "email", email)
@@ -87,55 +101,87 @@ def activate_account(session: Session, email: str) -> None:
         raise ServiceException("This account was already activated!")
 
     statement = update(User).filter(User.email == email).values(is_active=True)
-    session.execute(statement)
-    session.commit()
+    await session.execute(statement)
+    await session.commit()
+    await invalidate_principal(email)
 
 
-def activate_account_service(session: Session, token: str) -> None:
+async def activate_account_service(session: AsyncSession, token: str) -> None:
     emails = confirm_token(token)
     current_email = emails[0]
-    activate_account(session, current_email)
+    await activate_account(session, current_email)
 
 
-def authenticate(user_login_schema: UserLoginInputSchema, session: Session) -> User:
+async def authenticate(
+    user_login_schema: UserLoginInputSchema, session: AsyncSession
+) -> User:
     login_data = user_login_schema.dict()
-    user = session.scalar(
+    user = await session.scalar(
         select(User).filter(User.email == login_data["email"]).limit(1)
     )
-    if not (user or passwd_context.verify(login_data["password"], user.password)):
+    # the connection goes back to the pool while the password is checked
+    await session.commit()
+
+    is_valid, new_password_hash = await password_hasher.verify(
+        login_data["password"], user.password if user else None
+    )
+    if not is_valid:
         raise AuthenticationException("Invalid Credentials")
     if not user.is_active:
         raise AccountNotActivatedException("email", login_data["email"])
+
+    if new_password_hash:
+        statement = (
+            update(User).filter(User.id == user.id).values(password=new_password_hash)
+        )
+        await session.execute(statement)
+        await session.commit()
     return user
 
 
-def get_access_token_schema(
-    user_login_schema: UserLoginInputSchema, session: Session, auth_jwt: AuthJWT
+async def get_access_token_schema(
+    user_login_schema: UserLoginInputSchema, session: AsyncSession, auth_jwt: AuthJWT
 ) -> str:
-    user = authenticate(user_login_schema, session=session)
+    user = await authenticate(user_login_schema, session=session)
     email = user.email
-    access_token = auth_jwt.create_access_token(subject=email, algorithm="HS256")
+    if user_claims := get_principal_claims(UserPrincipalSchema.from_orm(user)):
+        access_token = auth_jwt.create_access_token(
+            subject=email,
+            algorithm="HS256",
+            expires_time=token_settings.STATELESS_TOKEN_TTL,
+            user_claims=user_claims,
+        )
+    else:
+        access_token = auth_jwt.create_access_token(subject=email, algorithm="HS256")
 
     return AccessTokenOutputSchema(access_token=access_token)
 
 
-def get_single_user(
-    session: Session, user_id: str, output_schema: BaseModel = UserOutputSchema
+async def get_single_user(
+    session: AsyncSession, user_id: str, output_schema: BaseModel = UserOutputSchema
 ) -> BaseModel:
-    if not (user_object := if_exists(User, "id", user_id, session)):
+    if not (
+        user_object := await if_exists(
+            User,
+            "id",
+            user_id,
+            session,
+            options=get_eager_load_options(User, output_schema),
+        )
+    ):
         raise DoesNotExist(User.__name__, "id", user_id)
 
-    return output_schema.from_orm(user_object)
+    return await serialize_instance(session, output_schema, user_object)
 
 
-def get_all_users(
-    session: Session, page_params: PageParams, query_params: list[tuple] = None
+async def get_all_users(
+    session: AsyncSession, page_params: PageParams, query_params: list[tuple] = None
 ) -> PagedResponseSchema:
     query = select(User)
     if query_params:
         query = filter_and_sort_instances(query_params, query, User)
 
-    return paginate(
+    return await paginate(
         query=query,
         response_schema=UserOutputSchema,
         table=User,
@@ -144,15 +190,15 @@ def get_all_users(
     )
 
 
-def update_single_user(
-    session: Session, user: UserUpdateSchema, user_id: int
+async def update_single_user(
+    session: AsyncSession, user: UserUpdateSchema, user_id: int
 ) -> UserOutputSchema:
-    if not if_exists(User, "id", user_id, session):
+    if not (user_object := await if_exists(User, "id", user_id, session)):
         raise DoesNotExist(User.__name__, "id", user_id)
 
     user_data = user.dict(exclude_unset=True, exclude_none=True)
     if user_data.get("username"):
-        username_check = session.scalar(
+        username_check = await session.scalar(
             select(User).filter(User.username == user.username).limit(1)
         )
 
@@ -169,8 +215,8 @@ def update_single_user(
                 .values(**address_data)
             )
 
-            session.execute(statement)
-            session.commit()
+            await session.execute(statement)
+            await session.commit()
 
         else:
             user_data.pop("address")
@@ -178,18 +224,21 @@ def update_single_user(
     if user_data:
         statement = update(User).filter(User.id == user_id).values(**user_data)
 
-        session.execute(statement)
-        session.commit()
+        await session.execute(statement)
+        await session.commit()
+    await invalidate_principal(user_object.email)
 
-    return get_single_user(session, user_id=user_id)
+    return await get_single_user(session, user_id=user_id)
 
 
-def delete_single_user(session: Session, user_id: int):
-    if not if_exists(User, "id", user_id, session):
+async def delete_single_user(session: AsyncSession, user_id: int):
+    if not (user_object := await if_exists(User, "id", user_id, session)):
         raise DoesNotExist(User.__name__, "id", user_id)
 
     statement = delete(User).filter(User.id == user_id)
-    result = session.execute(statement)
-    session.commit()
+    result = await session.execute(statement)
+    await revoke_subjects(session, user_object.email)
+    await session.commit()
+    await invalidate_principal(user_object.email)
 
     return result
@@ -1,3 +0,0 @@
-from passlib.context import CryptContext
-
-passwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -0,0 +1,26 @@
+import hashlib
+
+
+class BloomFilter:
+    def __init__(self, size: int, hash_count: int):
+        self.size = max(size, 8)
+        self.hash_count = hash_count
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def get_positions(self, value: str) -> list[int]:
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [
+            (first + index * second) % self.size for index in range(self.hash_count)
+        ]
+
+    def add(self, value: str) -> None:
+        for position in self.get_positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.get_positions(value)
+        )
@@ -0,0 +1,98 @@
+import hashlib
+import logging
+from typing import Any, Optional, TypeVar
+
+import orjson
+from pydantic import parse_raw_as
+from pydantic.json import pydantic_encoder
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.settings.cache import settings
+
+logger = logging.getLogger("src.cache")
+
+T = TypeVar("T")
+
+
+def get_params_digest(*params: Any) -> str:
+    return hashlib.sha1(
+        orjson.dumps(params, default=pydantic_encoder, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+
+
+class RedisCache:
+    def __init__(self, url: str, prefix: str, enabled: bool = True):
+        self.url = url
+        self.prefix = prefix
+        self.enabled = enabled
+        self.client: Optional[Redis] = None
+
+    def get_client(self) -> Redis:
+        if self.client is None:
+            self.client = Redis.from_url(
+                self.url,
+                socket_timeout=settings.CACHE_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.CACHE_SOCKET_TIMEOUT,
+            )
+        return self.client
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+
+    def get_version_key(self, name: str) -> str:
+        return f"{self.prefix}:version:{name}"
+
+    async def get_key(self, namespace: str, key: str, versions: list[str]) -> str:
+        # every key embeds the current version of the data it was built from,
+        # so a write only has to bump those versions to make old entries
+        # unreachable, including ones stored by reads racing with the write
+        stamps = []
+        if self.enabled and versions:
+            try:
+                stamps = await self.get_client().mget(
+                    [self.get_version_key(name) for name in versions]
+                )
+            except RedisError as error:
+                logger.warning("cache version lookup failed: %s", error)
+                return ""
+        version = ".".join((stamp or b"0").decode() for stamp in stamps)
+        return f"{self.prefix}:{namespace}:{key}:{version}"
+
+    async def get(self, key: str, schema: type[T]) -> Optional[T]:
+        if not self.enabled or not key:
+            return None
+        try:
+            payload = await self.get_client().get(key)
+        except RedisError as error:
+            logger.warning("cache read failed: %s", error)
+            return None
+        return None if payload is None else parse_raw_as(schema, payload)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        if not self.enabled or not key:
+            return
+        try:
+            await self.get_client().set(
+                key, orjson.dumps(value, default=pydantic_encoder), ex=ttl
+            )
+        except RedisError as error:
+            logger.warning("cache write failed: %s", error)
+
+    async def invalidate(self, *versions: str) -> None:
+        if not self.enabled or not versions:
+            return
+        try:
+            async with self.get_client().pipeline(transaction=False) as pipeline:
+                for name in versions:
+                    pipeline.incr(self.get_version_key(name))
+                await pipeline.execute()
+        except RedisError as error:
+            logger.warning("cache invalidation failed: %s", error)
+
+
+cache = RedisCache(
+    settings.REDIS_URL, settings.CACHE_KEY_PREFIX, settings.CACHE_ENABLED
+)
@@ -0,0 +1,66 @@
+import datetime
+import hashlib
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+class Validators:
+    def __init__(self, etag: str, last_modified: Optional[datetime.datetime]):
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+def to_utc(moment: datetime.datetime) -> datetime.datetime:
+    # naive timestamps are written with datetime.now() in the server time zone
+    return moment.astimezone(datetime.timezone.utc).replace(microsecond=0)
+
+
+def get_validators(*versions: Any) -> Validators:
+    digest = hashlib.sha1(repr(versions).encode()).hexdigest()
+    timestamps = [
+        to_utc(version)
+        for version in versions
+        if isinstance(version, datetime.datetime)
+    ]
+    return Validators(f'W/"{digest}"', max(timestamps, default=None))
+
+
+def parse_entity_tags(header: str) -> set[str]:
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    if (if_none_match := request.headers.get("if-none-match")) is not None:
+        tags = parse_entity_tags(if_none_match)
+        return "*" in tags or validators.etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        modified_since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if modified_since.tzinfo is None:
+        modified_since = modified_since.replace(tzinfo=datetime.timezone.utc)
+    return validators.last_modified <= modified_since
+
+
+def get_conditional_response(
+    request: Request, response: Response, validators: Validators
+) -> Optional[Response]:
+    if is_not_modified(request, validators):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers
+        )
+    response.headers.update(validators.headers)
+    return None
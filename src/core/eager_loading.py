@@ -0,0 +1,33 @@
+from functools import lru_cache
+
+from pydantic import BaseModel
+from sqlalchemy import Table
+from sqlalchemy.orm import class_mapper, joinedload, selectinload
+
+
+def get_nested_schema(field) -> type[BaseModel]:
+    if isinstance(field.type_, type) and issubclass(field.type_, BaseModel):
+        return field.type_
+
+
+@lru_cache(maxsize=256)
+def get_eager_load_options(model: Table, schema: type[BaseModel]) -> tuple:
+    relationships = class_mapper(model).relationships
+    options = []
+    for field in schema.__fields__.values():
+        if field.alias not in relationships or not (
+            nested_schema := get_nested_schema(field)
+        ):
+            continue
+
+        relationship = relationships[field.alias]
+        attribute = getattr(model, relationship.key)
+        loader = (
+            selectinload(attribute) if relationship.uselist else joinedload(attribute)
+        )
+        if nested_options := get_eager_load_options(
+            relationship.mapper.class_, nested_schema
+        ):
+            loader = loader.options(*nested_options)
+        options.append(loader)
+    return tuple(options)
@@ -73,6 +73,18 @@ class EmptyCartException(ServiceException):
         super().__init__("You have no items in the cart!")
 
 
+class DuplicatedCartItemException(ServiceException):
+    def __init__(self) -> None:
+        super().__init__("The product was already requested earlier in this batch!")
+
+
+class ReservationConflictException(ServiceException):
+    def __init__(self) -> None:
+        super().__init__(
+            "The product is being reserved by other requests, try again shortly!"
+        )
+
+
 class NoSuchItemInCartException(ServiceException):
     def __init__(self) -> None:
         super().__init__("No such item in the cart!")
@@ -121,3 +133,44 @@ class PaymentAlreadyAccepted(ServiceException):
             "Payment for your order is already accepted!"
         )
 
+
+class InvalidCursorException(ServiceException):
+    def __init__(self) -> None:
+        super().__init__(
+            "The pagination cursor is invalid or does not match the sorting!"
+        )
+
+
+class InvalidFieldsetException(ServiceException):
+    def __init__(self, field_paths: list[str]) -> None:
+        super().__init__(
+            f"Unknown fields requested: {', '.join(field_paths)}"
+        )
+
+
+class UnknownQueryParameterException(ServiceException):
+    def __init__(self, key: str) -> None:
+        super().__init__(f"Unknown filter or sort parameter: {key}")
+
+
+class InvalidFilterValueException(ServiceException):
+    def __init__(self, key: str, value: str) -> None:
+        super().__init__(f"Invalid value for {key}: {value}")
+
+
+class UnindexedSortException(ServiceException):
+    def __init__(self, max_rows: int) -> None:
+        super().__init__(
+            f"This sort order is only available for the first {max_rows} results "
+            "of offset pagination!"
+        )
+
+
+class InvalidSearchQueryException(ServiceException):
+    def __init__(self) -> None:
+        super().__init__("Search query must contain at least one word!")
+
+
+class PasswordHashingUnavailableException(ServiceException):
+    def __init__(self) -> None:
+        super().__init__("Too many sign-in attempts in progress, try again shortly!")
@@ -119,8 +119,9 @@ class InventoryUpdateSchemaFactory(SchemaFactory):
     def generate(
         self,
         quantity: Optional[int] = None,
+        shard_count: Optional[int] = None,
     ):
-        return self.schema_class(quantity=quantity)
+        return self.schema_class(quantity=quantity, shard_count=shard_count)
 
 
 class ProductInputSchemaFactory(SchemaFactory):
@@ -0,0 +1,74 @@
+from functools import lru_cache
+from typing import List, Optional
+
+from pydantic import BaseModel, create_model
+from pydantic.fields import SHAPE_LIST
+
+from src.core.eager_loading import get_nested_schema
+from src.core.exceptions import InvalidFieldsetException
+
+
+def parse_fieldset(value: Optional[str]) -> tuple[str, ...]:
+    if not value:
+        return ()
+    return tuple(sorted({path.strip() for path in value.split(",") if path.strip()}))
+
+
+def get_fieldset_tree(field_paths: tuple[str, ...]) -> dict:
+    tree = {}
+    for field_path in field_paths:
+        node = tree
+        for field_name in field_path.split("."):
+            node = node.setdefault(field_name, {})
+    return tree
+
+
+def trim_schema(
+    schema: type[BaseModel], included: Optional[dict], excluded: dict, path: str = ""
+) -> type[BaseModel]:
+    unknown_fields = (set(included or {}) | set(excluded)) - set(schema.__fields__)
+    if unknown_fields:
+        raise InvalidFieldsetException(
+            sorted(f"{path}{field_name}" for field_name in unknown_fields)
+        )
+
+    fields = {}
+    for name, field in schema.__fields__.items():
+        if included is not None and name not in included:
+            continue
+        nested_included = (included.get(name) or None) if included is not None else None
+        nested_excluded = excluded.get(name)
+        if nested_excluded == {}:
+            continue
+
+        annotation = field.outer_type_
+        if nested_included or nested_excluded:
+            if not (nested_schema := get_nested_schema(field)):
+                raise InvalidFieldsetException([f"{path}{name}.*"])
+            annotation = trim_schema(
+                nested_schema, nested_included, nested_excluded or {}, f"{path}{name}."
+            )
+            if field.shape == SHAPE_LIST:
+                annotation = List[annotation]
+        if field.allow_none:
+            annotation = Optional[annotation]
+        fields[name] = (annotation, ... if field.required else field.default)
+
+    fieldset_schema = create_model(
+        f"{schema.__name__}Fieldset", __config__=schema.__config__, **fields
+    )
+    fieldset_schema.__fieldset_of__ = getattr(schema, "__fieldset_of__", schema)
+    return fieldset_schema
+
+
+@lru_cache(maxsize=256)
+def get_fieldset_schema(
+    schema: type[BaseModel], fields: tuple[str, ...], exclude: tuple[str, ...]
+) -> type[BaseModel]:
+    if not fields and not exclude:
+        return schema
+    return trim_schema(
+        schema,
+        get_fieldset_tree(fields) if fields else None,
+        get_fieldset_tree(exclude),
+    )
@@ -1,59 +1,96 @@
 import operator
-
-from sqlalchemy.sql.expression import Select
-
-
-class Lookup(Select):
-    def __init__(self, model, inst, current_model=None):
-        self.main_model = model
-        self.inst = inst
-        self.current_model = current_model
-        self.field = None
-        self.filter_params = None
-
-    def __lt__(self, other):
-        return self.inst.filter(getattr(self.current_model, self.field) < other)
-
-    def __gt__(self, other):
-        return self.inst.filter(getattr(self.current_model, self.field) > other)
-
-    def __ge__(self, other):
-        return self.inst.filter(getattr(self.current_model, self.field) >= other)
-
-    def __le__(self, other):
-        return self.inst.filter(getattr(self.current_model, self.field) <= other)
-
-    def __eq__(self, other):
-        values = other.split(",")
-        if len(values) > 1:
-            return self.inst.filter(getattr(self.current_model, self.field).in_(values))
-        return self.inst.filter(getattr(self.current_model, self.field) == other)
-
-    def __ne__(self, other):
-        return self.inst.filter(getattr(self.current_model, self.field) != other)
-
-    def __setattr__(self, key, value):
-        super().__setattr__(key, value)
-
-    def set_filter_params(self, query_params: list[tuple]) -> None:
-        from src.core.utils.utils import filter_query_param_values_extractor
-
-        self.filter_params = filter_query_param_values_extractor(query_params)
-
-    def perform_lookup(self, field, operation, value):
-        from src.core.utils.utils import get_model_from_key_name
-
-        if len(field.split("__")) == 1:
-            self.field = field
-            self.current_model = self.main_model
+from functools import lru_cache
+from typing import Any, Callable
+
+from sqlalchemy import Table, and_
+
+from src.core.exceptions import (
+    InvalidFilterValueException,
+    UnknownQueryParameterException,
+)
+from src.core.registry import resolve_path
+
+OPERATIONS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "le": operator.le,
+    "ge": operator.ge,
+}
+
+
+class Lookup:
+    def __init__(
+        self,
+        key: str,
+        relationships: list[Any],
+        column: Any,
+        operation: str,
+        coercer: Callable[[str], Any],
+    ):
+        self.key = key
+        self.relationships = relationships
+        self.column = column
+        self.operation = operation
+        self.coercer = coercer
+
+    def coerce(self, value: str) -> Any:
+        try:
+            return self.coercer(value)
+        except ValueError:
+            raise InvalidFilterValueException(self.key, value)
+
+    def get_condition(self, value: str):
+        values = value.split(",")
+        if self.operation == "eq" and len(values) > 1:
+            return self.column.in_([self.coerce(value) for value in values])
+        return OPERATIONS[self.operation](self.column, self.coerce(value))
+
+
+def get_semi_join(relationships: list[Any], conditions: list[Any]):
+    condition = and_(*conditions)
+    for relationship in reversed(relationships):
+        if relationship.property.uselist:
+            condition = relationship.any(condition)
         else:
-            key, self.field = field.split("__")
-            self.current_model = get_model_from_key_name(self.main_model, key)
-
-        res = getattr(operator, operation)(self, value)
-        return Lookup(self.main_model, res, self.current_model)
-
-    def get_filtered_instances(self):
-        for param in self.filter_params:
-            self.inst = self.perform_lookup(*param).inst
-        return self.inst
+            condition = relationship.has(condition)
+    return condition
+
+
+class FilterPlan:
+    def __init__(self, lookups: list[Lookup]):
+        self.lookups = lookups
+
+    def apply(self, query, values: list[str]):
+        conditions, related_conditions = [], {}
+        for lookup, value in zip(self.lookups, values):
+            if not lookup.relationships:
+                conditions.append(lookup.get_condition(value))
+                continue
+            related_conditions.setdefault(tuple(lookup.relationships), []).append(
+                lookup.get_condition(value)
+            )
+
+        conditions.extend(
+            get_semi_join(list(relationships), relationship_conditions)
+            for relationships, relationship_conditions in related_conditions.items()
+        )
+        return query.filter(*conditions)
+
+
+def compile_lookup(model: Table, key: str) -> Lookup:
+    field_path, operation = key, "eq"
+    if "__" in key and (split_key := key.rsplit("__", 1))[1] in OPERATIONS:
+        field_path, operation = split_key
+
+    try:
+        relationships, column, coercer = resolve_path(model, field_path)
+    except KeyError:
+        raise UnknownQueryParameterException(key)
+    return Lookup(key, relationships, column, operation, coercer)
+
+
+@lru_cache(maxsize=256)
+def compile_filter_plan(model: Table, keys: tuple[str, ...]) -> FilterPlan:
+    return FilterPlan([compile_lookup(model, key) for key in keys])
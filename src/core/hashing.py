@@ -0,0 +1,85 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from passlib.context import CryptContext
+
+from src.core.exceptions import PasswordHashingUnavailableException
+from src.settings.password import settings
+
+passwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS
+)
+
+
+@lru_cache(maxsize=None)
+def get_dummy_password_hash() -> str:
+    return passwd_context.hash("dummy-password")
+
+
+def hash_password(password: str) -> str:
+    return passwd_context.hash(password)
+
+
+def verify_and_update_password(
+    password: str, password_hash: Optional[str]
+) -> tuple[bool, Optional[str]]:
+    # unknown users are checked against a dummy hash, so that they take as
+    # long to reject as wrong passwords
+    if password_hash is None:
+        passwd_context.verify(password, get_dummy_password_hash())
+        return False, None
+    try:
+        return passwd_context.verify_and_update(password, password_hash)
+    except ValueError:
+        return False, None
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self.executor
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        # bcrypt is deliberately slow, so a burst of logins is turned away
+        # instead of queueing up behind the pool and holding requests open
+        if self.pending >= self.max_pending:
+            raise PasswordHashingUnavailableException()
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.get_executor(), function, *args
+            )
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self.run(hash_password, password)
+
+    async def verify(
+        self, password: str, password_hash: Optional[str]
+    ) -> tuple[bool, Optional[str]]:
+        return await self.run(verify_and_update_password, password, password_hash)
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING
+)
@@ -0,0 +1,108 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.settings.db_settings import settings
+
+logger = logging.getLogger("src.sql")
+
+BIND_PARAMS_LIST_PATTERN = re.compile(r"(%s|\$\d+|\?)(\s*,\s*(%s|\$\d+|\?))*")
+NUMERIC_LITERAL_PATTERN = re.compile(r"\b\d+\b")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def get_statement_shape(statement: str) -> str:
+    shape = BIND_PARAMS_LIST_PATTERN.sub("?", statement)
+    shape = NUMERIC_LITERAL_PATTERN.sub("?", shape)
+    return WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+class QueryStats:
+    def __init__(self, n_plus_one_threshold: int):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[get_statement_shape(statement)] += 1
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 2)
+
+    @property
+    def n_plus_one_suspects(self) -> dict[str, int]:
+        return {
+            shape: count
+            for shape, count in self.shapes.items()
+            if count > self.n_plus_one_threshold
+        }
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration_ms};desc="{self.count} queries"'
+
+
+request_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def record_query(conn, cursor, statement, parameters, context, executemany):
+    start_time = conn.info["query_start_time"].pop()
+    if stats := request_query_stats.get():
+        stats.record(statement, time.perf_counter() - start_time)
+
+
+@event.listens_for(Engine, "handle_error")
+def discard_query_timer(exception_context):
+    if (connection := exception_context.connection) is None:
+        return
+    if start_times := connection.info.get("query_start_time"):
+        start_times.pop()
+
+
+async def instrument_sql_queries(request: Request, call_next) -> Response:
+    if not settings.SQL_INSTRUMENTATION:
+        return await call_next(request)
+
+    stats = QueryStats(settings.SQL_N_PLUS_ONE_THRESHOLD)
+    token = request_query_stats.set(stats)
+    request_start_time = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        request_query_stats.reset(token)
+
+    response.headers["Server-Timing"] = stats.server_timing()
+    log_record = {
+        "method": request.method,
+        "path": request.url.path,
+        "status_code": response.status_code,
+        "duration_ms": round((time.perf_counter() - request_start_time) * 1000, 2),
+        "db_queries": stats.count,
+        "db_duration_ms": stats.duration_ms,
+    }
+    if suspects := stats.n_plus_one_suspects:
+        log_record["n_plus_one"] = suspects
+        logger.warning(json.dumps(log_record))
+    else:
+        logger.info(json.dumps(log_record))
+
+    return response
@@ -1,6 +1,19 @@
+from enum import Enum
+from typing import Optional
+
 from pydantic import BaseModel, conint
 
 
+class CountStrategy(str, Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+
+
 class PageParams(BaseModel):
     page: conint(ge=1) = 1
     size: conint(ge=1, le=100) = 10
+    cursor: Optional[str] = None
+    count: CountStrategy = CountStrategy.EXACT
+    fields: Optional[str] = None
+    exclude: Optional[str] = None
@@ -1,13 +1,25 @@
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
+from pydantic import BaseModel
 from pydantic.generics import GenericModel
 
+from src.core.pagination.models import CountStrategy
+
 T = TypeVar("T")
 
 
+class FacetCountSchema(BaseModel):
+    id: str
+    name: str
+    count: int
+
+
 class PagedResponseSchema(GenericModel, Generic[T]):
     total: int
     page: int
     size: int
     results: List[T]
     has_next_page: bool
+    next_cursor: Optional[str] = None
+    total_strategy: CountStrategy = CountStrategy.EXACT
+    facets: Optional[List[FacetCountSchema]] = None
@@ -1,37 +1,375 @@
-from sqlalchemy import Table
-from sqlalchemy.orm import Session
+import base64
+import binascii
+import json
+import time
+from typing import Any, Optional
 
-from src.core.pagination.models import BaseModel, PageParams
+from sqlalchemy import Table, and_, cast, false, func, literal, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.sql.selectable import Join
+from sqlalchemy.sql.visitors import iterate
+
+from src.core.eager_loading import get_eager_load_options
+from src.core.exceptions import InvalidCursorException, UnindexedSortException
+from src.core.fieldsets import get_fieldset_schema, parse_fieldset
+from src.core.pagination.models import BaseModel, CountStrategy, PageParams
 from src.core.pagination.schemas import PagedResponseSchema, T
+from src.core.projection import Projection, get_projection
+from src.core.registry import get_value_coercer
+from src.core.sort import is_sort_indexed
+from src.core.utils.utils import serialize_instances
+from src.settings.pagination import settings
+
+
+class CountCache:
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.entries: dict[tuple, tuple[float, int]] = {}
+
+    def get(self, key: tuple) -> Optional[int]:
+        if (entry := self.entries.get(key)) is None:
+            return None
+        expires_at, total = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        return total
+
+    def set(self, key: tuple, total: int) -> None:
+        now = time.monotonic()
+        if len(self.entries) >= self.max_size:
+            self.entries = {
+                entry_key: entry
+                for entry_key, entry in self.entries.items()
+                if entry[0] >= now
+            }
+            if len(self.entries) >= self.max_size:
+                self.entries.pop(next(iter(self.entries)))
+        self.entries[key] = (now + self.ttl, total)
+
+
+count_cache = CountCache(settings.COUNT_CACHE_TTL, settings.COUNT_CACHE_MAX_SIZE)
+
+
+def get_query_shape_key(query) -> tuple:
+    compiled = query.compile()
+    return (
+        compiled.string,
+        tuple(sorted((name, str(value)) for name, value in compiled.params.items())),
+    )
+
+
+def get_joins(query) -> list[Join]:
+    joins = []
+    for from_ in query.get_final_froms():
+        while isinstance(from_, Join):
+            joins.append(from_)
+            from_ = from_.left
+    return joins
+
+
+def may_repeat_rows(query, table: Table) -> bool:
+    primary_key = set(table.__table__.primary_key.columns)
+    return any(
+        any(element in primary_key for element in iterate(join.onclause))
+        for join in get_joins(query)
+    )
+
+
+def get_window_count(query, table: Table):
+    if not may_repeat_rows(query, table):
+        return func.count().over()
+    return (
+        func.dense_rank().over(order_by=table.id.desc())
+        + func.dense_rank().over(order_by=table.id.asc())
+        - 1
+    )
+
+
+def get_ids_query(query, table: Table):
+    ids_query = query.order_by(None).with_only_columns(table.id)
+    if may_repeat_rows(query, table):
+        ids_query = ids_query.distinct()
+    return ids_query
+
+
+def get_count_query(query, table: Table):
+    return select(func.count()).select_from(get_ids_query(query, table).subquery())
+
+
+async def count_exactly(query, table: Table, session: AsyncSession) -> int:
+    return await session.scalar(get_count_query(query, table))
+
+
+async def count_from_cache(query, table: Table, session: AsyncSession) -> int:
+    key = get_query_shape_key(get_count_query(query, table))
+    if (total := count_cache.get(key)) is None:
+        total = await count_exactly(query, table, session)
+        count_cache.set(key, total)
+    return total
+
+
+def explain_row_estimate(sync_session, query) -> int:
+    connection = sync_session.connection()
+    compiled = query.compile(dialect=connection.dialect)
+    parameters = compiled.construct_params()
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled.string}",
+        tuple(parameters[name] for name in compiled.positiontup),
+    ).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_by_estimate(query, table: Table, session: AsyncSession) -> int:
+    if query.whereclause is None and not get_joins(query):
+        reltuples = await session.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = CAST(:name AS regclass)"),
+            {"name": f'"{table.__tablename__}"'},
+        )
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    query = get_ids_query(query, table)
+    return await session.run_sync(
+        lambda sync_session: explain_row_estimate(sync_session, query)
+    )
+
+
+async def get_total(
+    query, table: Table, count_strategy: CountStrategy, session: AsyncSession
+) -> int:
+    if count_strategy == CountStrategy.CACHED:
+        return await count_from_cache(query, table, session)
+    if count_strategy == CountStrategy.ESTIMATED:
+        return await count_by_estimate(query, table, session)
+    return await count_exactly(query, table, session)
+
+
+def get_order_by_columns(query, table: Table) -> list[tuple[Any, bool]]:
+    order_by_columns = []
+    for clause in query._order_by_clauses:
+        if isinstance(clause, UnaryExpression):
+            order_by_columns.append(
+                (clause.element, clause.modifier is operators.desc_op)
+            )
+        else:
+            order_by_columns.append((clause, False))
+
+    id_column = table.id.expression
+    if not any(column.compare(id_column) for column, _ in order_by_columns):
+        order_by_columns.append((id_column, False))
+    return order_by_columns
+
+
+def check_sort_is_indexed(query, table: Table, page_params: PageParams) -> None:
+    if is_sort_indexed(table, get_order_by_columns(query, table)):
+        return
+    if (
+        page_params.cursor is not None
+        or page_params.page * page_params.size > settings.UNINDEXED_SORT_MAX_ROWS
+    ):
+        raise UnindexedSortException(settings.UNINDEXED_SORT_MAX_ROWS)
+
+
+def is_listing_cacheable(page_params: PageParams) -> bool:
+    return (
+        page_params.page == 1
+        and page_params.cursor is None
+        and page_params.fields is None
+        and page_params.exclude is None
+    )
+
 
+def encode_cursor(values: list[Any]) -> str:
+    raw_values = [None if value is None else str(value) for value in values]
+    return base64.urlsafe_b64encode(json.dumps(raw_values).encode()).decode()
 
-def paginate(
+
+def decode_cursor(cursor: str, columns: list[Any]) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise InvalidCursorException
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursorException
+    # cursors come from clients, so every value is coerced to the type of its
+    # sort column before it is compared with the column in the query
+    if not all(value is None or isinstance(value, str) for value in values):
+        raise InvalidCursorException
+    try:
+        return [
+            None if value is None else get_value_coercer(column.type)(value)
+            for column, value in zip(columns, values)
+        ]
+    except ValueError:
+        raise InvalidCursorException
+
+
+def is_nullable(column: Any) -> bool:
+    return getattr(column, "nullable", True)
+
+
+def get_page_order(order_by_columns: list[tuple[Any, bool]]) -> list[Any]:
+    order = []
+    for column, descending in order_by_columns:
+        clause = column.desc() if descending else column.asc()
+        order.append(clause.nulls_last() if is_nullable(column) else clause)
+    return order
+
+
+def get_keyset_comparisons(column: Any, descending: bool, value: Any, raw_value):
+    # rows are ordered with NULLS LAST, so nothing but other NULLs follows a
+    # NULL value and every NULL follows a non-NULL one
+    if raw_value is None:
+        return false(), column.is_(None)
+
+    following = column < value if descending else column > value
+    if is_nullable(column):
+        following = or_(following, column.is_(None))
+    return following, column == value
+
+
+def get_keyset_condition(order_by_columns: list[tuple[Any, bool]], cursor: str):
+    values = decode_cursor(cursor, [column for column, _ in order_by_columns])
+    comparisons = [
+        get_keyset_comparisons(
+            column, descending, cast(literal(value), column.type), value
+        )
+        for (column, descending), value in zip(order_by_columns, values)
+    ]
+
+    conditions = []
+    for index, (following, _) in enumerate(comparisons):
+        preceding_equal = [equal for _, equal in comparisons[:index]]
+        conditions.append(and_(*preceding_equal, following))
+    return or_(*conditions)
+
+
+def get_page_schema(response_schema: BaseModel) -> type[PagedResponseSchema]:
+    page_schema = PagedResponseSchema[response_schema]
+    if source_schema := getattr(response_schema, "__fieldset_of__", None):
+        page_schema.__fieldset_of__ = PagedResponseSchema[source_schema]
+    return page_schema
+
+
+def select_page_columns(
+    query, table: Table, response_schema: BaseModel
+) -> tuple[Any, Optional[Projection]]:
+    # the primary key follows the projected values, so rows are only collapsed
+    # when joins repeat the same row and never because their values are equal
+    if projection := get_projection(table, response_schema):
+        return projection.select(query).add_columns(table.id), projection
+    return query.options(*get_eager_load_options(table, response_schema)), None
+
+
+async def build_page_results(
+    rows: list, response_schema: BaseModel, projection: Optional[Projection], session
+) -> list[BaseModel]:
+    if projection:
+        return [projection.build(iter(row)) for row in rows]
+    return await serialize_instances(session, response_schema, [row[0] for row in rows])
+
+
+async def paginate_by_cursor(
     query,
     response_schema: BaseModel,
     table: Table,
     page_params: PageParams,
-    session: Session,
+    session: AsyncSession,
 ) -> PagedResponseSchema[T]:
-    instances = (
-        session.scalars(
-            query.offset((page_params.page - 1) * page_params.size).limit(
-                page_params.size + 1
+    total = await get_total(query, table, page_params.count, session)
+    order_by_columns = get_order_by_columns(query, table)
+    page_query, projection = select_page_columns(query, table, response_schema)
+    page_query = page_query.order_by(None).order_by(*get_page_order(order_by_columns))
+    if page_params.cursor:
+        page_query = page_query.filter(
+            get_keyset_condition(order_by_columns, page_params.cursor)
+        )
+
+    rows = (
+        (
+            await session.execute(
+                page_query.add_columns(*[column for column, _ in order_by_columns])
+                .limit(page_params.size + 1)
+                .execution_options(populate_existing=True)
             )
         )
         .unique()
         .all()
     )
-    total_amount = len(instances)
-    next_page_check = (
-        total_amount - ((page_params.page - 1) * page_params.size)
-    ) > page_params.size
+    next_page_check = len(rows) > page_params.size
+    rows = rows[: page_params.size]
+    cursor_values_start = -len(order_by_columns)
+
+    return get_page_schema(response_schema)(
+        total=total,
+        page=page_params.page,
+        size=page_params.size,
+        results=await build_page_results(rows, response_schema, projection, session),
+        has_next_page=next_page_check,
+        next_cursor=(
+            encode_cursor(list(rows[-1][cursor_values_start:]))
+            if next_page_check
+            else None
+        ),
+        total_strategy=page_params.count,
+    )
+
+
+async def paginate(
+    query,
+    response_schema: BaseModel,
+    table: Table,
+    page_params: PageParams,
+    session: AsyncSession,
+) -> PagedResponseSchema[T]:
+    response_schema = get_fieldset_schema(
+        response_schema,
+        parse_fieldset(page_params.fields),
+        parse_fieldset(page_params.exclude),
+    )
+    check_sort_is_indexed(query, table, page_params)
+    if page_params.cursor is not None:
+        return await paginate_by_cursor(
+            query, response_schema, table, page_params, session
+        )
+
+    page_query, projection = select_page_columns(query, table, response_schema)
+    if not query._order_by_clauses:
+        # without an ORDER BY consecutive offset pages may repeat or skip rows
+        page_query = page_query.order_by(table.id)
+    count_in_query = page_params.count == CountStrategy.EXACT
+    if count_in_query:
+        page_query = page_query.add_columns(get_window_count(query, table))
+
+    rows = (
+        (
+            await session.execute(
+                page_query.offset((page_params.page - 1) * page_params.size)
+                .limit(page_params.size + 1)
+                .execution_options(populate_existing=True)
+            )
+        )
+        .unique()
+        .all()
+    )
+    next_page_check = len(rows) > page_params.size
+    rows = rows[: page_params.size]
+
+    if count_in_query and rows:
+        total = rows[0][-1]
+    else:
+        total = await get_total(query, table, page_params.count, session)
 
-    return PagedResponseSchema(
-        total=total_amount,
+    return get_page_schema(response_schema)(
+        total=total,
         page=page_params.page,
         size=page_params.size,
-        results=[
-            response_schema.from_orm(item) for item in instances[: page_params.size]
-        ],
+        results=await build_page_results(rows, response_schema, projection, session),
         has_next_page=next_page_check,
+        total_strategy=page_params.count,
     )
@@ -0,0 +1,77 @@
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import Table, inspect
+from sqlalchemy.orm import aliased
+
+from src.core.eager_loading import get_nested_schema
+
+
+class Projection:
+    def __init__(
+        self,
+        schema: type[BaseModel],
+        columns: list[tuple[str, Any]],
+        nested: list[tuple[str, Any, "Projection"]],
+    ):
+        self.schema = schema
+        self.columns = columns
+        self.nested = nested
+
+    def get_columns(self) -> list[Any]:
+        columns = [column for _, column in self.columns]
+        for _, _, projection in self.nested:
+            columns.extend(projection.get_columns())
+        return columns
+
+    def get_joins(self) -> list[Any]:
+        joins = []
+        for _, join, projection in self.nested:
+            joins.append(join)
+            joins.extend(projection.get_joins())
+        return joins
+
+    def select(self, query):
+        query = query.with_only_columns(*self.get_columns())
+        for join in self.get_joins():
+            query = query.outerjoin(join)
+        return query
+
+    def build(self, values: Iterator[Any]) -> BaseModel:
+        fields = {name: next(values) for name, _ in self.columns}
+        for name, _, projection in self.nested:
+            fields[name] = projection.build_nested(values)
+        return self.schema.construct(**fields)
+
+    def build_nested(self, values: Iterator[Any]) -> Optional[BaseModel]:
+        instance = self.build(values)
+        if all(value is None for value in instance.__dict__.values()):
+            return None
+        return instance
+
+
+def get_projection_for(entity: Any, schema: type[BaseModel]) -> Optional[Projection]:
+    mapper = inspect(entity).mapper
+    column_names = set(mapper.column_attrs.keys())
+    columns, nested = [], []
+    for name, field in schema.__fields__.items():
+        if name in column_names and not get_nested_schema(field):
+            columns.append((name, getattr(entity, name)))
+            continue
+
+        relationship = mapper.relationships.get(name)
+        nested_schema = get_nested_schema(field)
+        if relationship is None or relationship.uselist or nested_schema is None:
+            return None
+
+        target = aliased(relationship.mapper.class_)
+        if not (nested_projection := get_projection_for(target, nested_schema)):
+            return None
+        nested.append((name, getattr(entity, name).of_type(target), nested_projection))
+    return Projection(schema, columns, nested)
+
+
+@lru_cache(maxsize=256)
+def get_projection(model: Table, schema: type[BaseModel]) -> Optional[Projection]:
+    return get_projection_for(model, schema)
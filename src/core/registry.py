@@ -0,0 +1,161 @@
+import datetime
+import uuid
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any, Callable
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Integer,
+    Numeric,
+    PrimaryKeyConstraint,
+    SmallInteger,
+    Table,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import configure_mappers
+
+from src.database.db_connection import Base
+
+TRUE_VALUES = {"true", "t", "yes", "y", "on", "1"}
+FALSE_VALUES = {"false", "f", "no", "n", "off", "0"}
+
+
+def coerce_boolean(value: str) -> bool:
+    if value.lower() in TRUE_VALUES:
+        return True
+    if value.lower() in FALSE_VALUES:
+        return False
+    raise ValueError(value)
+
+
+def coerce_decimal(value: str) -> Decimal:
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(value)
+    if not number.is_finite():
+        raise ValueError(value)
+    return number
+
+
+def get_integer_coercer(column_type: Integer) -> Callable[[str], int]:
+    if isinstance(column_type, BigInteger):
+        limit = 2**63
+    elif isinstance(column_type, SmallInteger):
+        limit = 2**15
+    else:
+        limit = 2**31
+
+    def coerce_integer(value: str) -> int:
+        number = int(value)
+        if not -limit <= number < limit:
+            raise ValueError(value)
+        return number
+
+    return coerce_integer
+
+
+def coerce_uuid(value: str) -> str:
+    return str(uuid.UUID(value))
+
+
+def get_datetime_coercer(timezone: bool) -> Callable[[str], datetime.datetime]:
+    def coerce_datetime(value: str) -> datetime.datetime:
+        moment = datetime.datetime.fromisoformat(value)
+        if not timezone and moment.tzinfo is not None:
+            moment = moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return moment
+
+    return coerce_datetime
+
+
+def get_value_coercer(column_type: Any) -> Callable[[str], Any]:
+    if isinstance(column_type, Boolean):
+        return coerce_boolean
+    if isinstance(column_type, Integer):
+        return get_integer_coercer(column_type)
+    if isinstance(column_type, Numeric):
+        return coerce_decimal
+    if isinstance(column_type, DateTime):
+        return get_datetime_coercer(column_type.timezone)
+    if isinstance(column_type, Date):
+        return datetime.date.fromisoformat
+    if isinstance(column_type, UUID):
+        return coerce_uuid
+    return str
+
+
+class ModelEntry:
+    def __init__(
+        self,
+        columns: dict[str, tuple[Any, Callable[[str], Any]]],
+        relationships: dict[str, Table],
+        indexes: list[tuple[tuple[str, ...], bool]],
+    ):
+        self.columns = columns
+        self.relationships = relationships
+        self.indexes = indexes
+
+
+def get_table_indexes(table) -> list[tuple[tuple[str, ...], bool]]:
+    indexes = [
+        (tuple(column.name for column in constraint.columns), True)
+        for constraint in table.constraints
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+    ]
+    indexes.extend(
+        (tuple(column.name for column in index.columns), index.unique)
+        for index in table.indexes
+        if index.dialect_options["postgresql"].get("where") is None
+    )
+    return indexes
+
+
+@lru_cache(maxsize=None)
+def get_model_registry() -> dict[Table, ModelEntry]:
+    configure_mappers()
+    registry = {}
+    for mapper in Base.registry.mappers:
+        model = mapper.class_
+        registry[model] = ModelEntry(
+            columns={
+                name: (
+                    getattr(model, name),
+                    get_value_coercer(attribute.columns[0].type),
+                )
+                for name, attribute in mapper.column_attrs.items()
+                if not attribute.deferred
+            },
+            relationships={
+                name: relationship.mapper.class_
+                for name, relationship in mapper.relationships.items()
+            },
+            indexes=get_table_indexes(mapper.local_table),
+        )
+    return registry
+
+
+def get_model_entry(model: Table) -> ModelEntry:
+    registry = get_model_registry()
+    if model not in registry:
+        get_model_registry.cache_clear()
+        registry = get_model_registry()
+    return registry[model]
+
+
+def resolve_path(
+    model: Table, field_path: str
+) -> tuple[list[Any], Any, Callable[[str], Any]]:
+    *relationship_names, column_name = field_path.split("__")
+    relationships = []
+    for relationship_name in relationship_names:
+        target = get_model_entry(model).relationships[relationship_name]
+        relationships.append(getattr(model, relationship_name))
+        model = target
+    column, coercer = get_model_entry(model).columns[column_name]
+    return relationships, column, coercer
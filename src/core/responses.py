@@ -0,0 +1,102 @@
+import asyncio
+from typing import Any, Callable, Union, get_args, get_origin
+
+import orjson
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+
+
+class SchemaJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=pydantic_encoder, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+def is_schema(annotation: Any) -> bool:
+    return (
+        get_origin(annotation) is None
+        and isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+    )
+
+
+def may_accept_fields_of(schema: Any, other_schema: type[BaseModel]) -> bool:
+    if not is_schema(schema):
+        return True
+    required_fields = {
+        name for name, field in schema.__fields__.items() if field.required
+    }
+    return required_fields <= set(other_schema.__fields__)
+
+
+def get_response_types(response_model: Any) -> tuple[type[BaseModel], ...]:
+    if is_schema(response_model):
+        return (response_model,)
+    if get_origin(response_model) is not Union:
+        return ()
+    return tuple(member for member in get_args(response_model) if is_schema(member))
+
+
+def get_trusted_response_types(response_model: Any) -> tuple[type[BaseModel], ...]:
+    if is_schema(response_model):
+        return (response_model,)
+    if get_origin(response_model) is not Union:
+        return ()
+
+    members = get_args(response_model)
+    return tuple(
+        member
+        for index, member in enumerate(members)
+        if is_schema(member)
+        and not any(
+            may_accept_fields_of(preceding_member, member)
+            for preceding_member in members[:index]
+        )
+    )
+
+
+class SchemaResponseRoute(APIRoute):
+    def get_route_handler(self) -> Callable:
+        endpoint = self.dependant.call
+        response_types = get_response_types(self.response_model)
+        trusted_types = get_trusted_response_types(self.response_model)
+        response_filters = (
+            self.response_model_include,
+            self.response_model_exclude,
+            self.response_model_exclude_unset,
+            self.response_model_exclude_defaults,
+            self.response_model_exclude_none,
+        )
+        if (
+            not response_types
+            or any(response_filters)
+            or not asyncio.iscoroutinefunction(endpoint)
+        ):
+            return super().get_route_handler()
+
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        response_args = {"status_code": self.status_code} if self.status_code else {}
+        by_alias = self.response_model_by_alias
+        response_param_name = self.dependant.response_param_name
+
+        async def call_endpoint(*args, **kwargs) -> Any:
+            content = await endpoint(*args, **kwargs)
+            content_type = type(content)
+            if (
+                content_type not in trusted_types
+                and getattr(content_type, "__fieldset_of__", None) not in response_types
+            ):
+                return content
+            response = response_class(content.dict(by_alias=by_alias), **response_args)
+            if response_param_name:
+                response.headers.raw.extend(kwargs[response_param_name].headers.raw)
+            return response
+
+        self.dependant.call = call_endpoint
+        return super().get_route_handler()
@@ -1,29 +1,74 @@
-class Sort:
-    def __init__(self, main_model, inst, current_model=None):
-        self.main_model = main_model
-        self.inst = inst
-        self.current_model = current_model
-        self.sort_params = None
-
-    def set_sort_params(self, query_params: list[tuple]) -> None:
-        from src.core.utils.utils import sort_query_param_values_extractor
-
-        self.sort_params = sort_query_param_values_extractor(
-            query_params, self.current_model
-        )
-
-    def get_sorted_instances(self):
-        from src.core.utils.utils import get_model_from_key_name
-
-        if self.sort_params:
-            for field, sort_order in self.sort_params.items():
-                if len(field.split("__")) == 1:
-                    self.current_model = self.main_model
-                else:
-                    key, field = field.split("__")
-                    self.current_model = get_model_from_key_name(self.main_model, key)
-
-            field = getattr(self.current_model, field)
-            statement = field.asc() if sort_order == "asc" else field.desc()
-            self.inst = self.inst.order_by(statement)
-        return self.inst
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Table, func, select
+from sqlalchemy.orm import aliased
+
+from src.core.exceptions import UnknownQueryParameterException
+from src.core.registry import get_model_entry, resolve_path
+
+SORT_ORDERS = {"asc", "desc"}
+
+
+def compile_sort_criterion(model: Table, criterion: str):
+    field_path, _, sort_order = criterion.rpartition("__")
+    if sort_order not in SORT_ORDERS:
+        raise UnknownQueryParameterException(criterion)
+
+    try:
+        relationships, column, _ = resolve_path(model, field_path)
+    except KeyError:
+        raise UnknownQueryParameterException(criterion)
+    if relationships:
+        column = get_related_sort_value(model, relationships, column, sort_order)
+    return column.asc() if sort_order == "asc" else column.desc()
+
+
+def get_related_sort_value(
+    model: Table, relationships: list[Any], column: Any, sort_order: str
+):
+    # sorting on a joined collection would repeat the root row once per related
+    # row, so each root row is ranked by the first related value in sort order
+    aggregate = func.min if sort_order == "asc" else func.max
+    root = aliased(model)
+    query = select(aggregate(column)).select_from(root)
+    query = query.join(getattr(root, relationships[0].key))
+    for relationship in relationships[1:]:
+        query = query.join(relationship)
+    return query.where(root.id == model.id).scalar_subquery()
+
+
+@lru_cache(maxsize=256)
+def compile_sort_plan(model: Table, criteria: str) -> tuple:
+    criteria = criteria.split(",")
+    order_by = [compile_sort_criterion(model, criterion) for criterion in criteria]
+    if not any(criterion.rpartition("__")[0] == "id" for criterion in criteria):
+        descending = criteria[-1].endswith("__desc")
+        order_by.append(model.id.desc() if descending else model.id.asc())
+    return tuple(order_by)
+
+
+def is_served_by_index(
+    index_columns: tuple[str, ...], unique: bool, sort_columns: list[tuple[str, bool]]
+) -> bool:
+    prefix_length = min(len(index_columns), len(sort_columns))
+    if tuple(name for name, _ in sort_columns[:prefix_length]) != (
+        index_columns[:prefix_length]
+    ):
+        return False
+    if len(sort_columns) > len(index_columns) and not unique:
+        return False
+    return len({descending for _, descending in sort_columns[:prefix_length]}) == 1
+
+
+def is_sort_indexed(table: Table, order_by_columns: list[tuple[Any, bool]]) -> bool:
+    sort_columns = []
+    for column, descending in order_by_columns:
+        if getattr(column, "table", None) is not table.__table__:
+            return False
+        sort_columns.append((column.name, descending))
+
+    return any(
+        is_served_by_index(index_columns, unique, sort_columns)
+        for index_columns, unique in get_model_entry(table).indexes
+    )
@@ -1,29 +1,62 @@
-from datetime import datetime
-
-from apscheduler.schedulers.background import BackgroundScheduler
-from fastapi import Depends, FastAPI, status
-from sqlalchemy.orm import Session
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+from src.apps.jwt.services import sync_revocation_filter
 from src.apps.orders.services.cart_items_services import delete_invalid_cart_items
 from src.apps.orders.services.order_services import (
     cancel_orders_with_exceeded_payment_deadline,
 )
-from src.apps.products.routers.category_routers import category_router
-from src.apps.user.models import User
-from src.dependencies.get_db import get_db
-from src.dependencies.user import authenticate_user
-from src.settings.db_settings import settings
+from src.apps.products.services.autocomplete_services import (
+    build_autocomplete_index,
+)
+from src.apps.products.services.inventory_services import (
+    rebalance_sharded_inventories,
+)
+from src.database.db_connection import AsyncSessionLocal
+from src.settings.autocomplete import settings as autocomplete_settings
+from src.settings.inventory import settings as inventory_settings
+from src.settings.jwt_settings import settings as token_settings
+
+
+async def _delete_invalid_cart_items():
+    async with AsyncSessionLocal() as session:
+        await delete_invalid_cart_items(session)
+
 
+async def _cancel_orders_with_exceeded_payment_deadline():
+    async with AsyncSessionLocal() as session:
+        await cancel_orders_with_exceeded_payment_deadline(session)
 
-def _delete_invalid_cart_items():
-    delete_invalid_cart_items(next(get_db()))
 
+async def refresh_revocation_filter():
+    async with AsyncSessionLocal() as session:
+        await sync_revocation_filter(session)
 
-def _cancel_orders_with_exceeded_payment_deadline():
-    cancel_orders_with_exceeded_payment_deadline(next(get_db()))
 
+async def _rebalance_sharded_inventories():
+    async with AsyncSessionLocal() as session:
+        await rebalance_sharded_inventories(session)
 
-scheduler = BackgroundScheduler()
+
+async def refresh_autocomplete_index():
+    async with AsyncSessionLocal() as session:
+        await build_autocomplete_index(session)
+
+
+scheduler = AsyncIOScheduler()
 scheduler.add_job(_delete_invalid_cart_items, "interval", seconds=60)
 scheduler.add_job(_cancel_orders_with_exceeded_payment_deadline, "interval", seconds=60)
-scheduler.start()
+scheduler.add_job(
+    refresh_autocomplete_index,
+    "interval",
+    seconds=autocomplete_settings.AUTOCOMPLETE_REFRESH_SECONDS,
+)
+scheduler.add_job(
+    refresh_revocation_filter,
+    "interval",
+    seconds=token_settings.REVOCATION_SYNC_SECONDS,
+)
+scheduler.add_job(
+    _rebalance_sharded_inventories,
+    "interval",
+    seconds=inventory_settings.INVENTORY_REBALANCE_SECONDS,
+)
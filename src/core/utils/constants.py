@@ -1,7 +1,14 @@
 from copy import copy
 
-PAGINATION_PARAMS_HEADERS = ["page", "size"]
+PAGINATION_PARAMS_HEADERS = ["page", "size", "cursor", "count", "fields", "exclude"]
 SORT_PARAMS_HEADER = "sort"
+SEARCH_PARAMS_HEADER = "q"
+FACETS_PARAMS_HEADER = "facets"
+SEARCH_CONFIG = "english"
 
 PAGINATION_PARAMS_HEADERS_COPY = copy(PAGINATION_PARAMS_HEADERS)
-PARAM_HEADERS_WITHOUT_FILTERS = PAGINATION_PARAMS_HEADERS_COPY + [SORT_PARAMS_HEADER]
+PARAM_HEADERS_WITHOUT_FILTERS = PAGINATION_PARAMS_HEADERS_COPY + [
+    SORT_PARAMS_HEADER,
+    SEARCH_PARAMS_HEADER,
+    FACETS_PARAMS_HEADER,
+]
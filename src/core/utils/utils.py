@@ -1,4 +1,6 @@
 import datetime
+import os
+import time
 import uuid
 from decimal import Decimal
 from random import randint
@@ -12,24 +14,47 @@ from fastapi_mail import FastMail, MessageSchema
 from itsdangerous import URLSafeTimedSerializer
 from pydantic import BaseModel, BaseSettings
 from sqlalchemy import Table, select
-from sqlalchemy.orm import Session, class_mapper
-from sqlalchemy.orm.properties import RelationshipProperty
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import ServiceException
-from src.core.filters import Lookup
-from src.core.sort import Sort
+from src.core.filters import compile_filter_plan
+from src.core.sort import compile_sort_plan
 from src.core.utils.constants import (
-    PAGINATION_PARAMS_HEADERS,
     PARAM_HEADERS_WITHOUT_FILTERS,
     SORT_PARAMS_HEADER,
 )
-from src.database.db_connection import Base
 from src.settings.general import settings
 
 
-def if_exists(model_class: Table, field: str, value: Any, session: Session):
-    return session.scalar(
-        select(model_class).filter(getattr(model_class, field) == value)
+async def if_exists(
+    model_class: Table, field: str, value: Any, session: AsyncSession, options=()
+):
+    column = getattr(model_class, field)
+    if isinstance(column.type, UUID) and not is_valid_uuid(value):
+        return None
+
+    return await session.scalar(
+        select(model_class)
+        .filter(column == value)
+        .options(*options)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def serialize_instance(
+    session: AsyncSession, schema: BaseModel, instance: Any
+) -> BaseModel:
+    # from_orm walks relationships that may not be loaded yet; run_sync lets those
+    # lazy loads go through the async connection instead of failing outside greenlet
+    return await session.run_sync(lambda _: schema.from_orm(instance))
+
+
+async def serialize_instances(
+    session: AsyncSession, schema: BaseModel, instances: list[Any]
+) -> list[BaseModel]:
+    return await session.run_sync(
+        lambda _: [schema.from_orm(instance) for instance in instances]
     )
 
 
@@ -71,78 +96,27 @@ def check_field_values(
         raise ServiceException(message)
 
 
-def filter_query_param_values_extractor(params_list):
-    desired_params_list = [
-        param for param in params_list if param[0] not in PARAM_HEADERS_WITHOUT_FILTERS
+def get_filter_params(query_params: list[tuple]) -> list[tuple]:
+    return [
+        (key, value)
+        for key, value in query_params
+        if key not in PARAM_HEADERS_WITHOUT_FILTERS
     ]
-    for param in desired_params_list:
-        key, value = param
-        try:
-            field, oper = key.rsplit("__", 1)
-        except Exception:
-            field = key
-            oper = "eq"
-        yield field, oper, value
-
-
-def sort_query_param_values_extractor(
-    params_list: list[tuple], model_class: Table
-) -> dict[Any, str]:
-    params = [param for param in params_list if param[0] == SORT_PARAMS_HEADER]
-    criteria = dict()
-    if params:
-        for criterion in params[0][1].split(","):
-            field, sorting_order = criterion.rsplit("__", 1)
-            criteria[field] = sorting_order
-        return criteria
-
-
-def filter_instances(query_params: list[tuple], instances, model):
-    filter_class = Lookup(model, instances)
-    filter_class.set_filter_params(query_params)
-    filter_class.get_filtered_instances()
-    return filter_class.inst
-
-
-def sort_instances(query_params: list[tuple], instances, model):
-    sort_class = Sort(model, instances)
-    sort_class.set_sort_params(query_params)
-    sort_class.get_sorted_instances()
-    return sort_class.inst
 
 
 def filter_and_sort_instances(query_params: list[tuple], instances, model):
-    params_keys = [param[0] for param in query_params]
-    pagination_keys = [
-        param for param in params_keys if param in PAGINATION_PARAMS_HEADERS
-    ]
-    if pagination_keys == params_keys:
-        return instances
+    filter_params = get_filter_params(query_params)
+    if filter_params:
+        filter_plan = compile_filter_plan(model, tuple(key for key, _ in filter_params))
+        instances = filter_plan.apply(instances, [value for _, value in filter_params])
 
-    [params_keys.remove(value) for value in pagination_keys]
-    check_if_sort_key = SORT_PARAMS_HEADER in params_keys
-    filter_keys = [param for param in params_keys if param != SORT_PARAMS_HEADER]
-    if filter_keys:
-        instances = filter_instances(query_params, instances, model)
-
-    if check_if_sort_key:
-        instances = sort_instances(query_params, instances, model)
+    sort_criteria = [value for key, value in query_params if key == SORT_PARAMS_HEADER]
+    if sort_criteria:
+        instances = instances.order_by(*compile_sort_plan(model, sort_criteria[0]))
 
     return instances
 
 
-def get_model_from_key_name(model, relationship_key: str):
-    mapper = class_mapper(model)
-    for property in mapper.iterate_properties:
-        if (
-            isinstance(property, RelationshipProperty)
-            and property.key == relationship_key
-        ):
-            for klass in Base.__subclasses__():
-                if klass.__tablename__ == property.target.name:
-                    return klass
-
-
 def send_email(
     schema: BaseModel,
     body_schema: BaseModel,
@@ -162,8 +136,21 @@ def send_email(
     )
 
 
-def generate_uuid():
-    return str(uuid.uuid4())
+def generate_uuid() -> str:
+    # UUIDv7 layout: 48-bit unix timestamp in ms followed by random bits, so new
+    # keys land at the right edge of the primary key index instead of anywhere
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return str(uuid.UUID(int=value))
+
+
+def is_valid_uuid(value: Any) -> bool:
+    try:
+        uuid.UUID(str(value))
+    except ValueError:
+        return False
+    return True
 
 
 def calculate_item_price(quantity: int, product_price: Decimal) -> Decimal:
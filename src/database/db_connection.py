@@ -1,15 +1,43 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from src.settings.db_settings import settings
 
-engine = create_engine(
-    url=settings.postgres_url, echo=True, pool_size=20, max_overflow=0
+engine = create_async_engine(
+    url=settings.postgres_async_url,
+    echo=settings.POSTGRES_ECHO,
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
 )
 
-SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+replica_engines = [
+    create_async_engine(
+        url=replica_url,
+        echo=settings.POSTGRES_ECHO,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    )
+    for replica_url in settings.postgres_replica_async_urls
+]
+
+AsyncSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
 )
 
+ReplicaSessionLocals = [
+    sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    for replica_engine in replica_engines
+] or [AsyncSessionLocal]
+
 Base = declarative_base()
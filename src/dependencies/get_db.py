@@ -1,6 +1,69 @@
-from src.database.db_connection import SessionLocal
+import time
+from itertools import cycle
+from typing import AsyncGenerator, Optional
 
+from fastapi import Request
+from fastapi_jwt_auth import AuthJWT
+from fastapi_jwt_auth.exceptions import AuthJWTException
+from sqlalchemy.ext.asyncio import AsyncSession
 
-def get_db():
-    with SessionLocal() as session:
+from src.database.db_connection import AsyncSessionLocal, ReplicaSessionLocals
+from src.settings.db_settings import settings
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+replica_sessions = cycle(ReplicaSessionLocals)
+
+
+class ReadYourWritesTracker:
+    def __init__(self, window: int, max_size: int = 10000):
+        self.window = window
+        self.max_size = max_size
+        self.last_writes: dict[str, float] = {}
+
+    def record_write(self, subject: str) -> None:
+        now = time.monotonic()
+        if len(self.last_writes) >= self.max_size:
+            self.last_writes = {
+                key: written_at
+                for key, written_at in self.last_writes.items()
+                if now - written_at < self.window
+            }
+        self.last_writes[subject] = now
+
+    def has_recent_write(self, subject: str) -> bool:
+        if (written_at := self.last_writes.get(subject)) is None:
+            return False
+        return time.monotonic() - written_at < self.window
+
+
+read_your_writes_tracker = ReadYourWritesTracker(settings.READ_YOUR_WRITES_WINDOW)
+
+
+def get_request_subject(request: Request) -> Optional[str]:
+    try:
+        auth_jwt = AuthJWT(req=request)
+        auth_jwt.jwt_optional()
+        return auth_jwt.get_jwt_subject()
+    except AuthJWTException:
+        return None
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    if read_your_writes_tracker.window and request.method not in SAFE_METHODS:
+        if subject := get_request_subject(request):
+            read_your_writes_tracker.record_write(subject)
+
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    session_factory = next(replica_sessions)
+    if read_your_writes_tracker.window:
+        subject = get_request_subject(request)
+        if subject and read_your_writes_tracker.has_recent_write(subject):
+            session_factory = AsyncSessionLocal
+
+    async with session_factory() as session:
         yield session
@@ -1,26 +1,29 @@
 from fastapi import Depends
 from fastapi_jwt_auth import AuthJWT
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apps.jwt.services import get_claimed_principal
 from src.apps.user.models import User
+from src.apps.user.services.principal_services import get_principal
 from src.core.exceptions import AccountNotActivatedException, AuthenticationException
 from src.dependencies.get_db import get_db
 from src.settings.jwt_settings import AuthJWTSettings
 
 
-def authenticate_user(
-    auth_jwt: AuthJWT = Depends(), session: Session = Depends(get_db)
+async def authenticate_user(
+    auth_jwt: AuthJWT = Depends(), session: AsyncSession = Depends(get_db)
 ) -> User:
     auth_jwt.jwt_required()
     jwt_subject = auth_jwt.get_jwt_subject()
-    user = session.scalar(select(User).filter(User.email == jwt_subject).limit(1))
-    if not user:
+    principal = get_claimed_principal(auth_jwt.get_raw_jwt()) or await get_principal(
+        session, jwt_subject
+    )
+    if not principal:
         raise AuthenticationException("Cannot find user")
-    if not user.is_active:
+    if not principal.is_active:
         raise AccountNotActivatedException("email", jwt_subject)
 
-    return user
+    return User(**principal.dict())
 
 
 @AuthJWT.load_config
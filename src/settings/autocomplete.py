@@ -0,0 +1,14 @@
+from pydantic import BaseSettings
+
+
+class AutocompleteSettings(BaseSettings):
+    AUTOCOMPLETE_MAX_ENTRIES: int = 100_000
+    AUTOCOMPLETE_CACHED_PREFIX_LENGTH: int = 2
+    AUTOCOMPLETE_MAX_RESULTS: int = 20
+    AUTOCOMPLETE_REFRESH_SECONDS: int = 300
+
+    class Config:
+        env_file = ".env"
+
+
+settings = AutocompleteSettings()
@@ -0,0 +1,20 @@
+from pydantic import BaseSettings
+
+
+class CacheSettings(BaseSettings):
+    CACHE_ENABLED: bool = True
+    REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "ecommerce:v1"
+    CACHE_PRODUCT_TTL: int = 300
+    CACHE_LISTING_TTL: int = 60
+    CACHE_SOCKET_TIMEOUT: float = 0.25
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_SHARED: bool = False
+    PRINCIPAL_CACHE_TTL: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+
+    class Config:
+        env_file = ".env"
+
+
+settings = CacheSettings()
@@ -8,6 +8,13 @@ class DatabaseSettings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_PORT: int
     TEST_POSTGRES_DB: str
+    POSTGRES_POOL_SIZE: int = 20
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_ECHO: bool = False
+    SQL_INSTRUMENTATION: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+    POSTGRES_REPLICA_HOSTS: str = ""
+    READ_YOUR_WRITES_WINDOW: int = 0
 
     class Config:
         env_file = ".env"
@@ -28,5 +35,24 @@ class DatabaseSettings(BaseSettings):
         )
         return TEST_DATABASE_URL
 
+    @property
+    def postgres_replica_async_urls(self) -> list[str]:
+        return [
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
+            f"{host}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+            for host in self.POSTGRES_REPLICA_HOSTS.split(",")
+            if host
+        ]
+
+    @property
+    def postgres_async_url(self) -> str:
+        return self.postgres_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    @property
+    def test_postgres_async_url(self) -> str:
+        return self.test_postgres_url.replace(
+            "postgresql://", "postgresql+asyncpg://", 1
+        )
+
 
 settings = DatabaseSettings()
@@ -0,0 +1,12 @@
+from pydantic import BaseSettings
+
+
+class InventorySettings(BaseSettings):
+    INVENTORY_MAX_SHARDS: int = 64
+    INVENTORY_REBALANCE_SECONDS: int = 10
+
+    class Config:
+        env_file = ".env"
+
+
+settings = InventorySettings()
@@ -10,6 +10,20 @@ class AuthJWTSettings(BaseSettings):
         env_file = ".env"
 
 
+class TokenSettings(BaseSettings):
+    STATELESS_TOKENS_ENABLED: bool = False
+    STATELESS_TOKEN_TTL: int = 300
+    REVOCATION_SYNC_SECONDS: int = 15
+    REVOCATION_FILTER_SIZE: int = 1 << 20
+    REVOCATION_FILTER_HASHES: int = 7
+
+    class Config:
+        env_file = ".env"
+
+
+settings = TokenSettings()
+
+
 @AuthJWT.load_config
 def get_config():
     return AuthJWTSettings()
@@ -0,0 +1,13 @@
+from pydantic import BaseSettings
+
+
+class PaginationSettings(BaseSettings):
+    COUNT_CACHE_TTL: int = 30
+    COUNT_CACHE_MAX_SIZE: int = 1024
+    UNINDEXED_SORT_MAX_ROWS: int = 1000
+
+    class Config:
+        env_file = ".env"
+
+
+settings = PaginationSettings()
@@ -0,0 +1,14 @@
+from pydantic import BaseSettings
+
+
+class PasswordHashingSettings(BaseSettings):
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    PASSWORD_HASH_RETRY_AFTER: int = 1
+
+    class Config:
+        env_file = ".env"
+
+
+settings = PasswordHashingSettings()
@@ -1,55 +1,74 @@
 import pytest
+from fakeredis.aioredis import FakeRedis
 from fastapi import BackgroundTasks
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from httpx import AsyncClient
 from sqlalchemy.event import listens_for
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
 from main import app
+from src.apps.user.services.principal_services import principal_cache
+from src.core.cache import cache
 from src.database.db_connection import Base
-from src.dependencies.get_db import get_db
+from src.dependencies.get_db import get_db, get_read_db
 from src.settings.db_settings import settings
 
 
 @pytest.fixture(scope="session", autouse=True)
-def sync_engine():
-    engine = create_engine(url=settings.test_postgres_url, echo=False)
+def anyio_backend():
+    return "asyncio"
 
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
+
+@pytest.fixture(scope="session", autouse=True)
+async def async_engine():
+    engine = create_async_engine(url=settings.test_postgres_async_url, echo=False)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
 
     yield engine
-    Base.metadata.drop_all(bind=engine)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
 
 
 @pytest.fixture
-def sync_session(sync_engine: Engine):
-    connection = sync_engine.connect()
-    transaction = connection.begin()
-    sync_session = Session(bind=connection)
+async def async_session(async_engine: AsyncEngine):
+    connection = await async_engine.connect()
+    transaction = await connection.begin()
+    async_session = AsyncSession(bind=connection, expire_on_commit=False)
 
-    connection.begin_nested()
+    await connection.begin_nested()
 
-    @listens_for(sync_session, "after_transaction_end")
-    def restart_savepoint(session=sync_session, transaction=transaction):
+    @listens_for(async_session.sync_session, "after_transaction_end")
+    def restart_savepoint(session, transaction):
         if transaction.nested and not transaction._parent.nested:
             session.begin_nested()
 
-    yield sync_session
+    yield async_session
 
-    sync_session.close()
-    transaction.rollback()
-    connection.close()
+    await async_session.close()
+    await transaction.rollback()
+    await connection.close()
 
 
 @pytest.fixture
-def sync_client():
-    with TestClient(app=app, base_url="http://localhost:8000/api/") as sync_client:
-        yield sync_client
+async def async_client():
+    async with AsyncClient(app=app, base_url="http://localhost:8000/api/") as client:
+        yield client
 
 
 @pytest.fixture(autouse=True)
-def override_get_sync_session(sync_session: Session):
-    app.dependency_overrides[get_db] = lambda: sync_session
+def override_get_async_session(async_session: AsyncSession):
+    app.dependency_overrides[get_db] = lambda: async_session
+    app.dependency_overrides[get_read_db] = lambda: async_session
     yield
+
+
+@pytest.fixture(autouse=True)
+async def fake_cache():
+    cache.client = FakeRedis()
+    principal_cache.clear()
+    yield cache
+    await cache.client.flushall()
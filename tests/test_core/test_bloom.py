@@ -0,0 +1,12 @@
+from src.core.bloom import BloomFilter
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(size=1 << 12, hash_count=5)
+    values = [f"user{index}@example.com" for index in range(200)]
+    for value in values:
+        bloom.add(value)
+
+    assert all(value in bloom for value in values)
+    false_positives = sum(f"other{index}@example.com" in bloom for index in range(1000))
+    assert false_positives < 50
@@ -0,0 +1,30 @@
+from redis.asyncio import Redis
+
+from src.apps.products.schemas import CategoryOutputSchema
+from src.core.cache import RedisCache, cache
+
+
+async def test_invalidating_a_version_changes_dependent_keys(fake_cache: RedisCache):
+    key = await cache.get_key("category", "1", ["category-list"])
+    await cache.set(key, CategoryOutputSchema(id="1", name="Lamps"), 60)
+
+    assert await cache.get(key, CategoryOutputSchema) == CategoryOutputSchema(
+        id="1", name="Lamps"
+    )
+    assert await cache.get_key("category", "1", ["category-list"]) == key
+
+    await cache.invalidate("category-list")
+    new_key = await cache.get_key("category", "1", ["category-list"])
+    assert new_key != key
+    assert await cache.get(new_key, CategoryOutputSchema) is None
+
+
+async def test_unavailable_redis_is_treated_as_a_cache_miss():
+    unavailable_cache = RedisCache("redis://localhost:1/0", "test")
+    unavailable_cache.client = Redis(port=1, socket_connect_timeout=0.1)
+
+    key = await unavailable_cache.get_key("category", "1", ["category-list"])
+    await unavailable_cache.set(key, CategoryOutputSchema(id="1", name="Lamps"), 60)
+    await unavailable_cache.invalidate("category-list")
+
+    assert await unavailable_cache.get(key, CategoryOutputSchema) is None
@@ -0,0 +1,129 @@
+import datetime
+
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.orders.schemas import CartItemUpdateSchema, CartOutputSchema
+from src.apps.orders.services.cart_items_services import update_cart_item
+from src.apps.products.schemas import CategoryOutputSchema, ProductOutputSchema
+from src.apps.products.services.category_services import delete_single_category
+from src.apps.products.services.product_services import (
+    create_product,
+    update_single_product,
+)
+from src.apps.user.schemas import UserOutputSchema
+from src.core.conditional import get_validators
+from src.core.factories import (
+    InventoryInputSchemaFactory,
+    ProductInputSchemaFactory,
+    ProductUpdateSchemaFactory,
+)
+from src.core.pagination.schemas import PagedResponseSchema
+from tests.test_core.conftest import db_categories, db_products
+from tests.test_orders.conftest import db_carts
+from tests.test_users.conftest import (
+    auth_headers,
+    db_staff_user,
+    db_user,
+    staff_auth_headers,
+)
+
+
+def test_validators_use_the_latest_timestamp():
+    created_at = datetime.datetime(2024, 1, 1, 12, 0, 0, 500)
+    validators = get_validators("Cart", "1", created_at, None, 3)
+
+    assert validators.etag.startswith('W/"')
+    assert validators.etag != get_validators("Cart", "1", created_at, None, 4).etag
+    assert validators.last_modified == created_at.astimezone(
+        datetime.timezone.utc
+    ).replace(microsecond=0)
+
+
+async def test_unchanged_products_are_not_sent_again(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    db_products: list[ProductOutputSchema],
+):
+    url = f"products/{db_products[0].id}"
+    response = await async_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await async_client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await update_single_product(
+        async_session,
+        ProductUpdateSchemaFactory().generate(description="Updated description"),
+        db_products[0].id,
+    )
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+    assert response.json()["description"] == "Updated description"
+
+
+async def test_products_are_revalidated_after_a_linked_category_is_deleted(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    db_categories: list[CategoryOutputSchema],
+):
+    product = await create_product(
+        async_session,
+        ProductInputSchemaFactory().generate(
+            inventory=InventoryInputSchemaFactory().generate(),
+            category_ids=[category.id for category in db_categories[:2]],
+        ),
+    )
+    url = f"products/{product.id}"
+    response = await async_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+
+    # the most recently updated category is kept, so only the set of linked
+    # categories tells the two versions apart
+    await delete_single_category(async_session, db_categories[0].id)
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+async def test_carts_are_revalidated_after_their_items_change(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    auth_headers: dict[str, str],
+    db_carts: PagedResponseSchema[CartOutputSchema],
+    db_user: UserOutputSchema,
+):
+    cart = next(cart for cart in db_carts.results if cart.user_id == db_user.id)
+    url = f"carts/{cart.id}"
+    response = await async_client.get(url, headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+
+    response = await async_client.get(
+        url, headers={**auth_headers, "If-None-Match": f'{etag}, W/"other"'}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    cart_item = cart.cart_items[0]
+    new_quantity = 1 if cart_item.quantity > 1 else 2
+    await update_cart_item(
+        async_session,
+        CartItemUpdateSchema(quantity=new_quantity),
+        cart_item.id,
+        cart.id,
+    )
+    response = await async_client.get(
+        url, headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["cart_items"][0]["quantity"] == new_quantity
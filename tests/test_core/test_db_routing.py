@@ -0,0 +1,79 @@
+from itertools import cycle
+
+import pytest
+from fastapi import Request
+from fastapi_jwt_auth import AuthJWT
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.database.db_connection import AsyncSessionLocal
+from src.dependencies.get_db import (
+    ReadYourWritesTracker,
+    get_read_db,
+    get_request_subject,
+    read_your_writes_tracker,
+)
+
+
+def build_request(method: str, access_token: str = None) -> Request:
+    headers = []
+    if access_token:
+        headers.append((b"authorization", f"Bearer {access_token}".encode()))
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+def test_tracker_reports_write_only_within_window():
+    tracker = ReadYourWritesTracker(window=60)
+    tracker.record_write("user@mail.com")
+
+    assert tracker.has_recent_write("user@mail.com")
+    assert not tracker.has_recent_write("other@mail.com")
+    assert not ReadYourWritesTracker(window=0).has_recent_write("user@mail.com")
+
+
+def test_request_subject_is_taken_from_access_token():
+    access_token = AuthJWT().create_access_token("user@mail.com")
+
+    assert get_request_subject(build_request("GET", access_token)) == "user@mail.com"
+    assert get_request_subject(build_request("GET")) is None
+    assert get_request_subject(build_request("GET", "invalid-token")) is None
+
+
+@pytest.fixture
+def replica_session_factory(async_engine: AsyncEngine, monkeypatch):
+    replica_session_factory = sessionmaker(bind=async_engine, class_=AsyncSession)
+    monkeypatch.setattr(
+        "src.dependencies.get_db.replica_sessions", cycle([replica_session_factory])
+    )
+    monkeypatch.setattr(read_your_writes_tracker, "window", 60)
+    monkeypatch.setattr(read_your_writes_tracker, "last_writes", {})
+    return replica_session_factory
+
+
+async def get_read_db_bind(request: Request):
+    read_db = get_read_db(request)
+    session = await read_db.__anext__()
+    await read_db.aclose()
+    return session.bind
+
+
+async def test_read_db_uses_replica_by_default(replica_session_factory: sessionmaker):
+    access_token = AuthJWT().create_access_token("reader@mail.com")
+
+    assert await get_read_db_bind(build_request("GET", access_token)) is (
+        replica_session_factory.kw["bind"]
+    )
+    assert await get_read_db_bind(build_request("GET")) is (
+        replica_session_factory.kw["bind"]
+    )
+
+
+async def test_read_db_uses_primary_for_user_with_recent_write(
+    replica_session_factory: sessionmaker,
+):
+    access_token = AuthJWT().create_access_token("writer@mail.com")
+    read_your_writes_tracker.record_write("writer@mail.com")
+
+    assert await get_read_db_bind(build_request("GET", access_token)) is (
+        AsyncSessionLocal.kw["bind"]
+    )
@@ -0,0 +1,66 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.orders.models import Cart, Order
+from src.apps.orders.schemas import (
+    CartOutputSchema,
+    OrderOutputSchema,
+    UserCartOutputSchema,
+)
+from src.apps.orders.services.order_services import get_all_orders
+from src.core.eager_loading import get_eager_load_options
+from src.core.instrumentation import QueryStats, request_query_stats
+from src.core.pagination.models import PageParams
+from src.core.pagination.schemas import PagedResponseSchema
+from tests.test_orders.conftest import db_carts, db_orders
+from tests.test_products.conftest import db_categories, db_products
+from tests.test_users.conftest import db_staff_user, db_user
+
+
+async def count_queries(coroutine) -> int:
+    stats = QueryStats(n_plus_one_threshold=1)
+    token = request_query_stats.set(stats)
+    try:
+        await coroutine
+    finally:
+        request_query_stats.reset(token)
+    return stats.count
+
+
+def test_eager_load_options_follow_nested_schema_fields():
+    assert len(get_eager_load_options(Cart, CartOutputSchema)) == 2
+    assert get_eager_load_options(Cart, CartOutputSchema) is get_eager_load_options(
+        Cart, CartOutputSchema
+    )
+    assert get_eager_load_options(Cart, UserCartOutputSchema) != (
+        get_eager_load_options(Cart, CartOutputSchema)
+    )
+
+
+async def test_planned_options_load_everything_the_schema_needs(
+    async_session: AsyncSession, db_orders: PagedResponseSchema[OrderOutputSchema]
+):
+    orders = (
+        await async_session.scalars(
+            select(Order)
+            .options(*get_eager_load_options(Order, OrderOutputSchema))
+            .execution_options(populate_existing=True)
+        )
+    ).all()
+
+    serialized_orders = [OrderOutputSchema.from_orm(order) for order in orders]
+
+    assert len(serialized_orders) == len(db_orders.results)
+
+
+async def test_list_queries_do_not_grow_with_page_size(
+    async_session: AsyncSession, db_orders: PagedResponseSchema[OrderOutputSchema]
+):
+    single_order_page_queries = await count_queries(
+        get_all_orders(async_session, PageParams(size=1))
+    )
+    all_orders_page_queries = await count_queries(
+        get_all_orders(async_session, PageParams(size=len(db_orders.results)))
+    )
+
+    assert single_order_page_queries == all_orders_page_queries
@@ -0,0 +1,74 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from src.apps.orders.schemas import OrderOutputSchema
+from src.apps.products.models import Product
+from src.apps.products.schemas import ProductOutputSchema
+from src.core.exceptions import InvalidFieldsetException
+from src.core.fieldsets import get_fieldset_schema, parse_fieldset
+from src.core.projection import get_projection
+from tests.test_core.conftest import db_categories, db_products, staff_auth_headers
+from tests.test_orders.conftest import db_carts, db_orders
+from tests.test_users.conftest import db_staff_user, db_user
+
+
+def test_fieldset_schemas_are_cached_per_field_set():
+    schema = get_fieldset_schema(
+        ProductOutputSchema, parse_fieldset("name,id"), parse_fieldset("")
+    )
+
+    assert set(schema.__fields__) == {"id", "name"}
+    assert schema is get_fieldset_schema(
+        ProductOutputSchema, parse_fieldset("id, name"), ()
+    )
+    assert get_projection(Product, schema)
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(InvalidFieldsetException):
+        get_fieldset_schema(ProductOutputSchema, ("categories.price",), ())
+
+
+async def test_products_can_be_listed_with_selected_fields(
+    async_client: AsyncClient, db_products: list[ProductOutputSchema]
+):
+    response = await async_client.get("products/?fields=id,name,categories.name")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] == len(db_products)
+    for product in response.json()["results"]:
+        assert set(product) == {"id", "name", "categories"}
+        assert all(set(category) == {"name"} for category in product["categories"])
+
+
+async def test_products_can_be_listed_without_excluded_fields(
+    async_client: AsyncClient, db_products: list[ProductOutputSchema]
+):
+    response = await async_client.get("products/?exclude=categories,description")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()["results"][0]) == {"id", "name", "price"}
+
+
+async def test_orders_can_be_listed_with_selected_nested_fields(
+    async_client: AsyncClient,
+    staff_auth_headers: dict[str, str],
+    db_orders: list[OrderOutputSchema],
+):
+    response = await async_client.get(
+        "orders/all?fields=id,order_items.quantity", headers=staff_auth_headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    for order in response.json()["results"]:
+        assert set(order) == {"id", "order_items"}
+        assert all(set(item) == {"quantity"} for item in order["order_items"])
+
+
+async def test_unknown_fields_return_bad_request(
+    async_client: AsyncClient, db_products: list[ProductOutputSchema]
+):
+    response = await async_client.get("products/?fields=id,colour")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
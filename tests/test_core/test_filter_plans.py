@@ -0,0 +1,109 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.orders.models import Order
+from src.apps.products.models import Category, Product
+from src.apps.products.schemas import CategoryOutputSchema, ProductOutputSchema
+from src.apps.products.services.product_services import create_product
+from src.apps.user.models import User
+from src.core.exceptions import (
+    InvalidFilterValueException,
+    UnknownQueryParameterException,
+)
+from src.core.factories import InventoryInputSchemaFactory, ProductInputSchemaFactory
+from src.core.filters import compile_filter_plan
+from src.core.registry import get_model_registry
+from src.core.sort import compile_sort_plan
+from tests.test_core.conftest import db_categories, db_products
+
+
+def test_registry_resolves_relationships_to_models():
+    registry = get_model_registry()
+
+    assert registry[Product].relationships["categories"] is Category
+    assert registry[Order].relationships["user"] is User
+
+
+def test_filter_plans_are_compiled_once_per_key_set():
+    keys = ("price__le", "categories__id", "removed_from_store")
+
+    assert compile_filter_plan(Product, keys) is compile_filter_plan(Product, keys)
+    assert [
+        lookup.operation for lookup in compile_filter_plan(Product, keys).lookups
+    ] == [
+        "le",
+        "eq",
+        "eq",
+    ]
+
+
+def test_filter_values_are_coerced_to_column_types():
+    plan = compile_filter_plan(Product, ("price__le", "name__ne"))
+    query = plan.apply(select(Product), ["10.50", "7"])
+
+    assert sorted(query.compile().params.values(), key=str) == [Decimal("10.50"), "7"]
+    assert compile_filter_plan(Order, ("created_at__ge",)).lookups[0].coerce(
+        "2024-01-02T03:04:05+01:00"
+    ) == datetime.datetime(2024, 1, 2, 2, 4, 5)
+
+
+def test_invalid_filter_and_sort_keys_are_rejected():
+    with pytest.raises(UnknownQueryParameterException):
+        compile_filter_plan(Product, ("colour__eq",))
+    with pytest.raises(UnknownQueryParameterException):
+        compile_sort_plan(Product, "name__sideways")
+    with pytest.raises(InvalidFilterValueException):
+        compile_filter_plan(Product, ("price__le",)).apply(select(Product), ["cheap"])
+
+
+async def test_invalid_filters_return_bad_request(
+    async_client: AsyncClient, db_products: list[ProductOutputSchema]
+):
+    response = await async_client.get("products/?price__le=cheap")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.get("products/?colour__eq=red")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_relationship_filters_become_semi_joins():
+    plan = compile_filter_plan(
+        Product, ("categories__name__ge", "categories__name__le", "name")
+    )
+    query = str(plan.apply(select(Product), ["a", "z", "x"]))
+
+    assert query.count("EXISTS") == 1
+    assert "JOIN" not in query.split("WHERE")[0]
+
+
+async def test_products_in_many_categories_are_listed_once(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    db_products: list[ProductOutputSchema],
+    db_categories: list[CategoryOutputSchema],
+):
+    product = await create_product(
+        async_session,
+        ProductInputSchemaFactory().generate(
+            category_ids=[category.id for category in db_categories],
+            inventory=InventoryInputSchemaFactory().generate(),
+        ),
+    )
+
+    for url in [
+        f"products/?size={len(db_products) + 1}",
+        f"products/?categories__id__eq={db_categories[0].id}",
+        "products/?sort=categories__name__asc",
+    ]:
+        response = await async_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+        product_ids = [result["id"] for result in response.json()["results"]]
+        assert len(product_ids) == len(set(product_ids)) == response.json()["total"]
+        assert product.id in product_ids
@@ -1,5 +1,5 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from src.apps.products.schemas import CategoryOutputSchema, ProductOutputSchema
 from src.apps.user.schemas import UserOutputSchema
@@ -13,8 +13,8 @@ from src.core.factories import (
 from tests.test_core.conftest import db_categories, db_products, db_staff_user, db_user
 
 
-def test_users_can_be_filtered_by_their_attributes(
-    sync_client: TestClient,
+async def test_users_can_be_filtered_by_their_attributes(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_user: UserOutputSchema,
 ):
@@ -22,20 +22,22 @@ def test_users_can_be_filtered_by_their_attributes(
     new_user = UserRegisterSchemaFactory().generate(
         email="supertest@mail.com", address=new_address
     )
-    response = sync_client.post("users/register", content=new_user.json())
+    response = await async_client.post("users/register", content=new_user.json())
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.get("users/?is_active__eq=True", headers=staff_auth_headers)
+    response = await async_client.get(
+        "users/?is_active__eq=True", headers=staff_auth_headers
+    )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 3
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"users/?username__eq={new_user.username}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 1
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"users/?email__ge={new_user.email}&email__le=superuser@mail.com",
         headers=staff_auth_headers,
     )
@@ -43,38 +45,38 @@ def test_users_can_be_filtered_by_their_attributes(
     assert response.json()["total"] == 2
 
 
-def test_categories_can_be_filtered_by_their_attributes(
-    sync_client: TestClient,
+async def test_categories_can_be_filtered_by_their_attributes(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
     new_category_1 = CategoryInputSchemaFactory().generate("zazzz")
     new_category_2 = CategoryInputSchemaFactory().generate(name="zbzzz")
-    response = sync_client.post(
+    response = await async_client.post(
         "categories/", content=new_category_1.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.post(
+    response = await async_client.post(
         "categories/", content=new_category_2.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"categories/?name__eq={new_category_2.name}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 1
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"categories/?name__ge={new_category_1.name}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 2
 
 
-def test_products_can_be_filtered_by_their_attributes(
-    sync_client: TestClient,
+async def test_products_can_be_filtered_by_their_attributes(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
     db_categories: list[CategoryOutputSchema],
@@ -90,31 +92,31 @@ def test_products_can_be_filtered_by_their_attributes(
         price=0.09,
         inventory=new_inventory_2,
     )
-    response = sync_client.post(
+    response = await async_client.post(
         "products/", content=new_product_1.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.post(
+    response = await async_client.post(
         "products/", content=new_product_2.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.get(f"products/?price__le={new_product_2.price}")
+    response = await async_client.get(f"products/?price__le={new_product_2.price}")
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 1
 
-    response = sync_client.get(f"products/?name__eq={new_product_1.name}")
+    response = await async_client.get(f"products/?name__eq={new_product_1.name}")
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 1
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"products/?categories__id__eq={new_product_1.category_ids[0]}"
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 2
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"products/?categories__id__eq="
         f"{new_product_2.category_ids[0]},{new_product_2.category_ids[1]}&"
         f"name__eq={new_product_2.name}"
@@ -0,0 +1,36 @@
+import pytest
+
+from src.core.exceptions import PasswordHashingUnavailableException
+from src.core.hashing import PasswordHasher, passwd_context, password_hasher
+
+
+async def test_password_is_verified_in_worker_process():
+    password_hash = await password_hasher.hash("correct-password")
+
+    assert await password_hasher.verify("correct-password", password_hash) == (
+        True,
+        None,
+    )
+    assert await password_hasher.verify("wrong-password", password_hash) == (
+        False,
+        None,
+    )
+    assert await password_hasher.verify("correct-password", None) == (False, None)
+
+
+async def test_outdated_password_hash_is_replaced_on_verification():
+    password_hash = passwd_context.handler().using(rounds=4).hash("correct-password")
+
+    is_valid, new_password_hash = await password_hasher.verify(
+        "correct-password", password_hash
+    )
+
+    assert is_valid
+    assert not passwd_context.needs_update(new_password_hash)
+
+
+async def test_saturated_hasher_rejects_work():
+    hasher = PasswordHasher(workers=1, max_pending=0)
+
+    with pytest.raises(PasswordHashingUnavailableException):
+        await hasher.hash("correct-password")
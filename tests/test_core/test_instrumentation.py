@@ -0,0 +1,41 @@
+from fastapi import status
+from httpx import AsyncClient
+
+from src.apps.products.schemas import CategoryOutputSchema
+from src.core.instrumentation import QueryStats, get_statement_shape
+from tests.test_core.conftest import auth_headers, db_categories, db_user
+
+
+async def test_response_contains_server_timing_header_with_db_stats(
+    async_client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_categories: list[CategoryOutputSchema],
+):
+    response = await async_client.get("categories/", headers=auth_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'queries"' in response.headers["Server-Timing"]
+
+
+def test_statements_differing_only_in_parameters_have_the_same_shape():
+    first_shape = get_statement_shape(
+        "SELECT * FROM product WHERE product.id IN (%s, %s, %s) LIMIT 11"
+    )
+    second_shape = get_statement_shape(
+        "SELECT * FROM product\n WHERE product.id IN (%s) LIMIT 21"
+    )
+
+    assert first_shape == second_shape
+
+
+def test_repeated_statement_shape_is_reported_as_n_plus_one():
+    stats = QueryStats(n_plus_one_threshold=2)
+    for product_id in range(3):
+        stats.record(f"SELECT * FROM product WHERE product.id = {product_id}", 0.001)
+    stats.record("SELECT * FROM category", 0.001)
+
+    assert stats.count == 4
+    assert stats.n_plus_one_suspects == {
+        "SELECT * FROM product WHERE product.id = ?": 3
+    }
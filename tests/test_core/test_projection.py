@@ -0,0 +1,101 @@
+import gc
+import weakref
+from itertools import combinations
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.apps.products.models import Category, Product, ProductInventory
+from src.apps.products.schemas import (
+    CategoryOutputSchema,
+    InventoryOutputSchema,
+    ProductOutputSchema,
+)
+from src.apps.user.models import User
+from src.apps.user.schemas import UserOutputSchema
+from src.apps.user.services.user_services import get_all_users
+from src.core.eager_loading import get_eager_load_options
+from src.core.fieldsets import get_fieldset_schema
+from src.core.pagination.models import PageParams
+from src.core.projection import get_projection
+from tests.test_users.conftest import db_staff_user, db_user
+
+
+def test_flat_schemas_and_their_scalar_relationships_are_projected():
+    assert get_projection(Category, CategoryOutputSchema)
+    assert get_projection(ProductInventory, InventoryOutputSchema)
+    assert [name for name, _, _ in get_projection(User, UserOutputSchema).nested] == [
+        "address"
+    ]
+
+
+def test_schemas_of_evicted_fieldsets_are_released():
+    field_names = list(UserOutputSchema.__fields__)
+    fieldset_schemas = []
+    for size in range(1, len(field_names) + 1):
+        for names in combinations(field_names, size):
+            for fields, exclude in [(names, ()), ((), names)]:
+                schema = get_fieldset_schema(UserOutputSchema, fields, exclude)
+                get_projection(User, schema)
+                get_eager_load_options(User, schema)
+                fieldset_schemas.append(weakref.ref(schema))
+    gc.collect()
+
+    assert len(fieldset_schemas) > 3 * 256
+    assert sum(schema() is not None for schema in fieldset_schemas) <= 3 * 256
+
+
+def test_schemas_with_collections_are_not_projected():
+    assert get_projection(Product, ProductOutputSchema) is None
+
+
+async def test_projected_page_matches_orm_serialization(
+    async_session: AsyncSession,
+    db_user: UserOutputSchema,
+    db_staff_user: UserOutputSchema,
+):
+    users = (
+        await async_session.scalars(
+            select(User).options(selectinload(User.address)).order_by(User.id)
+        )
+    ).all()
+
+    page = await get_all_users(
+        async_session, PageParams(), query_params=[("sort", "id__asc")]
+    )
+
+    assert page.total == len(users)
+    assert page.results == [UserOutputSchema.from_orm(user) for user in users]
+
+
+async def test_projected_page_can_be_paginated_by_cursor(
+    async_session: AsyncSession,
+    db_user: UserOutputSchema,
+    db_staff_user: UserOutputSchema,
+):
+    page = await get_all_users(async_session, PageParams(size=1, cursor=""))
+    user_ids = [user.id for user in page.results]
+    while page.next_cursor:
+        page = await get_all_users(
+            async_session, PageParams(size=1, cursor=page.next_cursor)
+        )
+        user_ids.extend(user.id for user in page.results)
+
+    assert len(user_ids) == page.total
+    assert len(set(user_ids)) == page.total
+
+
+async def test_projected_rows_with_equal_values_are_all_listed(
+    async_session: AsyncSession,
+    db_user: UserOutputSchema,
+    db_staff_user: UserOutputSchema,
+):
+    for page_params in [
+        PageParams(fields="is_active"),
+        PageParams(fields="is_active", cursor=""),
+    ]:
+        page = await get_all_users(async_session, page_params)
+
+        assert page.total >= 2
+        assert len(page.results) == page.total
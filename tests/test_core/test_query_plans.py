@@ -0,0 +1,136 @@
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.orders.schemas import CartOutputSchema, OrderOutputSchema
+from src.apps.orders.services.cart_items_services import (
+    delete_cart_items_with_product_removed_from_store,
+    delete_invalid_cart_items,
+    get_all_cart_items_for_single_cart,
+)
+from src.apps.orders.services.cart_services import get_all_user_carts
+from src.apps.orders.services.order_items_services import (
+    get_all_order_items_for_single_order,
+)
+from src.apps.orders.services.order_services import (
+    cancel_orders_with_exceeded_payment_deadline,
+    get_all_user_orders,
+)
+from src.apps.payments.schemas import PaymentOutputSchema
+from src.apps.payments.services import get_all_user_payments
+from src.apps.products.schemas import ProductOutputSchema
+from src.apps.products.services.product_services import (
+    get_single_product_or_inventory,
+)
+from src.apps.user.schemas import UserOutputSchema
+from src.core.pagination.models import PageParams
+from src.core.pagination.schemas import PagedResponseSchema
+from tests.test_payments.conftest import (
+    db_carts,
+    db_categories,
+    db_orders,
+    db_payments,
+    db_products,
+    db_staff_user,
+    db_user,
+    payment_intent,
+    stripe_session,
+)
+
+EXPLAINED_STATEMENT_PREFIXES = ("SELECT", "UPDATE", "DELETE")
+
+
+@contextmanager
+def capture_statements(session: AsyncSession):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(EXPLAINED_STATEMENT_PREFIXES):
+            statements.append((statement, parameters))
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def find_filtered_seq_scans(plan: dict[str, Any]) -> list[str]:
+    seq_scans = []
+    if plan["Node Type"] == "Seq Scan" and "Filter" in plan:
+        seq_scans.append(f"{plan['Relation Name']}: {plan['Filter']}")
+    for subplan in plan.get("Plans", []):
+        seq_scans.extend(find_filtered_seq_scans(subplan))
+    return seq_scans
+
+
+async def assert_no_filtered_seq_scans(
+    session: AsyncSession, statements: list[tuple]
+) -> None:
+    def explain(sync_session):
+        connection = sync_session.connection()
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        seq_scans = {}
+        for statement, parameters in statements:
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            ).scalar()
+            if found := find_filtered_seq_scans(plan[0]["Plan"]):
+                seq_scans[statement] = found
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = on")
+        return seq_scans
+
+    assert statements
+    assert await session.run_sync(explain) == {}
+
+
+async def test_user_scoped_list_queries_use_foreign_key_indexes(
+    async_session: AsyncSession,
+    db_user: UserOutputSchema,
+    db_carts: PagedResponseSchema[CartOutputSchema],
+    db_payments: PagedResponseSchema[PaymentOutputSchema],
+):
+    with capture_statements(async_session) as statements:
+        await get_all_user_carts(async_session, db_user.id, PageParams())
+        await get_all_user_orders(async_session, db_user.id, PageParams())
+        await get_all_user_payments(async_session, db_user.id, PageParams())
+
+    await assert_no_filtered_seq_scans(async_session, statements)
+
+
+async def test_item_list_queries_use_foreign_key_indexes(
+    async_session: AsyncSession,
+    db_carts: PagedResponseSchema[CartOutputSchema],
+    db_orders: PagedResponseSchema[OrderOutputSchema],
+    db_products: list[ProductOutputSchema],
+):
+    with capture_statements(async_session) as statements:
+        await get_all_cart_items_for_single_cart(
+            async_session, db_carts.results[0].id, PageParams(), as_staff=True
+        )
+        await get_all_order_items_for_single_order(
+            async_session, db_orders.results[0].id, PageParams()
+        )
+        await get_single_product_or_inventory(
+            async_session, db_products[0].id, get_inventory=True
+        )
+
+    await assert_no_filtered_seq_scans(async_session, statements)
+
+
+async def test_scheduler_queries_use_indexes(
+    async_session: AsyncSession,
+    db_orders: PagedResponseSchema[OrderOutputSchema],
+    db_products: list[ProductOutputSchema],
+):
+    with capture_statements(async_session) as statements:
+        await delete_invalid_cart_items(async_session)
+        await cancel_orders_with_exceeded_payment_deadline(async_session)
+        await delete_cart_items_with_product_removed_from_store(
+            async_session, db_products[0].id
+        )
+
+    await assert_no_filtered_seq_scans(async_session, statements)
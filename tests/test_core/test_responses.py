@@ -0,0 +1,107 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Union
+
+from fastapi import APIRouter, FastAPI, status
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+
+from src.apps.orders.schemas import OrderOutputSchema, UserOrderOutputSchema
+from src.apps.products.schemas import (
+    CategoryOutputSchema,
+    InventoryOutputSchema,
+    ProductOutputSchema,
+    ProductWithoutInventoryOutputSchema,
+    RemovedProductOutputSchema,
+)
+from src.core.pagination.schemas import PagedResponseSchema
+from src.core.responses import (
+    SchemaJSONResponse,
+    SchemaResponseRoute,
+    get_trusted_response_types,
+)
+from src.core.utils.utils import generate_uuid
+
+PRODUCT = ProductOutputSchema(
+    id=generate_uuid(),
+    name="Lamp",
+    description="Desk lamp",
+    price=Decimal("19.99"),
+    categories=[CategoryOutputSchema(id=generate_uuid(), name="Home")],
+    inventory=InventoryOutputSchema(
+        id=generate_uuid(), quantity=5, quantity_for_cart_items=5, sold=0
+    ),
+    removed_from_store=False,
+)
+
+
+def test_rendered_body_matches_jsonable_encoder_output():
+    content = {"price": Decimal("19.99"), "created_at": datetime(2023, 5, 1, 12, 30)}
+
+    body = SchemaJSONResponse(content).body
+
+    assert json.loads(body) == jsonable_encoder(content)
+
+
+def test_only_union_members_no_preceding_member_could_accept_are_trusted():
+    assert get_trusted_response_types(ProductOutputSchema) == (ProductOutputSchema,)
+    assert get_trusted_response_types(
+        Union[OrderOutputSchema, UserOrderOutputSchema]
+    ) == (OrderOutputSchema,)
+    assert get_trusted_response_types(
+        Union[ProductWithoutInventoryOutputSchema, RemovedProductOutputSchema]
+    ) == (ProductWithoutInventoryOutputSchema, RemovedProductOutputSchema)
+    assert get_trusted_response_types(list[ProductOutputSchema]) == ()
+
+
+async def test_returned_schema_is_rendered_without_second_validation():
+    router = APIRouter(route_class=SchemaResponseRoute)
+
+    @router.post(
+        "/products",
+        response_model=ProductOutputSchema,
+        status_code=status.HTTP_201_CREATED,
+    )
+    async def create_product() -> ProductOutputSchema:
+        return PRODUCT
+
+    @router.get("/products", response_model=PagedResponseSchema[ProductOutputSchema])
+    async def get_products() -> PagedResponseSchema[ProductOutputSchema]:
+        return PagedResponseSchema[ProductOutputSchema](
+            total=1, page=1, size=1, results=[PRODUCT], has_next_page=False
+        )
+
+    @router.get("/products/partial", response_model=ProductOutputSchema)
+    async def get_partial_product() -> ProductOutputSchema:
+        return ProductOutputSchema.construct(name=PRODUCT.name)
+
+    app = FastAPI(default_response_class=SchemaJSONResponse)
+    app.include_router(router)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        created_response = await client.post("/products")
+        list_response = await client.get("/products")
+        partial_response = await client.get("/products/partial")
+
+    assert created_response.status_code == status.HTTP_201_CREATED
+    assert created_response.json() == jsonable_encoder(PRODUCT)
+    assert list_response.json()["results"] == [jsonable_encoder(PRODUCT)]
+    assert partial_response.json() == {"name": PRODUCT.name}
+
+
+async def test_other_returned_schemas_are_still_validated_against_response_model():
+    router = APIRouter(route_class=SchemaResponseRoute)
+
+    @router.get("/product", response_model=ProductWithoutInventoryOutputSchema)
+    async def get_product() -> ProductOutputSchema:
+        return PRODUCT
+
+    app = FastAPI(default_response_class=SchemaJSONResponse)
+    app.include_router(router)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/product")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "inventory" not in response.json()
@@ -1,8 +1,10 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from sqlalchemy import select
 
-from src.apps.products.models import Category
+from src.apps.products.models import Category, Product
 from src.apps.products.schemas import CategoryOutputSchema, ProductOutputSchema
+from src.apps.user.models import User
 from src.apps.user.schemas import UserOutputSchema
 from src.core.factories import (
     AddressInputSchemaFactory,
@@ -11,11 +13,13 @@ from src.core.factories import (
     ProductInputSchemaFactory,
     UserRegisterSchemaFactory,
 )
+from src.core.pagination.services import get_order_by_columns
+from src.core.sort import compile_sort_plan, is_sort_indexed
 from tests.test_core.conftest import db_categories, db_products, db_staff_user, db_user
 
 
-def test_users_can_be_sorted_by_their_attributes(
-    sync_client: TestClient,
+async def test_users_can_be_sorted_by_their_attributes(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_user: UserOutputSchema,
 ):
@@ -30,42 +34,44 @@ def test_users_can_be_sorted_by_their_attributes(
     new_user_2 = UserRegisterSchemaFactory().generate(
         email="zoomer2@mail.com", last_name="zimmermann", address=new_address_2
     )
-    response = sync_client.post("users/register", content=new_user_1.json())
+    response = await async_client.post("users/register", content=new_user_1.json())
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.post("users/register", content=new_user_2.json())
+    response = await async_client.post("users/register", content=new_user_2.json())
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.get(
+    response = await async_client.get(
         "users/?sort=last_name__desc,email__desc", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["results"][0]["email"] == new_user_2.email
     assert response.json()["results"][1]["email"] == new_user_1.email
 
-    response = sync_client.get("users/?sort=username__asc", headers=staff_auth_headers)
+    response = await async_client.get(
+        "users/?sort=username__asc", headers=staff_auth_headers
+    )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["results"][0]["username"] == new_user_1.username
 
 
-def test_categories_can_be_sorted_by_their_attributes(
-    sync_client: TestClient,
+async def test_categories_can_be_sorted_by_their_attributes(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_categories: CategoryOutputSchema,
 ):
     new_category_1 = CategoryInputSchemaFactory().generate(name="aa-category")
     new_category_2 = CategoryInputSchemaFactory().generate(name="zz-category")
-    response = sync_client.post(
+    response = await async_client.post(
         "categories/", content=new_category_1.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.post(
+    response = await async_client.post(
         "categories/", content=new_category_2.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.get(
+    response = await async_client.get(
         "categories/?sort=name__desc", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
@@ -73,19 +79,19 @@ def test_categories_can_be_sorted_by_their_attributes(
     assert response.json()["results"][0]["name"] == new_category_2.name
 
 
-def test_products_can_be_sorted_by_their_attributes(
-    sync_client: TestClient,
+async def test_products_can_be_sorted_by_their_attributes(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_products: ProductOutputSchema,
     db_categories: list[CategoryOutputSchema],
 ):
     new_category = CategoryInputSchemaFactory().generate(name="zz-category")
-    response = sync_client.post(
+    response = await async_client.post(
         "categories/", content=new_category.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"categories/?name__eq={new_category.name}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
@@ -102,18 +108,84 @@ def test_products_can_be_sorted_by_their_attributes(
         price=0.09,
         inventory=new_inventory_2,
     )
-    response = sync_client.post(
+    response = await async_client.post(
         "products/", content=new_product_1.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.post(
+    response = await async_client.post(
         "products/", content=new_product_2.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.get("products/?sort=categories__name__desc")
+    response = await async_client.get("products/?sort=categories__name__desc")
     assert response.json()["results"][0]["categories"][0]["name"] == new_category.name
 
-    response = sync_client.get("products/?sort=price__asc")
+    response = await async_client.get("products/?sort=price__asc")
     assert response.json()["results"][0]["price"] == float(new_product_2.price)
+
+
+def test_sort_plans_apply_every_criterion_with_id_tie_breaker():
+    order_by = compile_sort_plan(User, "last_name__desc,email__asc")
+
+    assert [str(clause) for clause in order_by] == [
+        '"user".last_name DESC',
+        '"user".email ASC',
+        '"user".id ASC',
+    ]
+    assert str(compile_sort_plan(User, "last_name__desc")[-1]) == '"user".id DESC'
+    assert len(compile_sort_plan(User, "id__desc")) == 1
+
+
+def test_sorts_are_matched_against_indexes():
+    def indexed(model, criteria):
+        query = select(model).order_by(*compile_sort_plan(model, criteria))
+        return is_sort_indexed(model, get_order_by_columns(query, model))
+
+    assert indexed(Product, "price__asc")
+    assert indexed(Product, "price__desc")
+    assert indexed(Product, "name__desc")
+    assert indexed(User, "last_name__desc,email__desc")
+    assert not indexed(User, "last_name__desc,email__asc")
+    assert not indexed(Product, "description__asc")
+    assert not indexed(Product, "categories__name__asc")
+
+
+async def test_users_can_be_sorted_by_mixed_directions(
+    async_client: AsyncClient,
+    staff_auth_headers: dict[str, str],
+    db_user: UserOutputSchema,
+):
+    emails = ["aaa-sort@mail.com", "zzz-sort@mail.com"]
+    for email in emails:
+        new_user = UserRegisterSchemaFactory().generate(
+            email=email,
+            last_name="zzzzz",
+            address=AddressInputSchemaFactory().generate(),
+        )
+        response = await async_client.post("users/register", content=new_user.json())
+        assert response.status_code == status.HTTP_201_CREATED
+
+    response = await async_client.get(
+        "users/?sort=last_name__desc,email__asc", headers=staff_auth_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [user["email"] for user in response.json()["results"][:2]] == emails
+
+
+async def test_unindexed_sorts_are_capped(
+    async_client: AsyncClient, db_products: list[ProductOutputSchema]
+):
+    response = await async_client.get("products/?sort=description__asc")
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await async_client.get(
+        "products/?sort=description__asc&page=11&size=100"
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.get("products/?sort=description__asc&cursor=")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.get("products/?sort=price__desc&page=11&size=100")
+    assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,46 @@
+import uuid
+
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+
+from main import app
+from src.core.utils.utils import generate_uuid, is_valid_uuid
+from tests.test_users.conftest import db_staff_user, staff_auth_headers
+
+
+def test_generated_uuids_are_version_7_and_time_ordered():
+    generated_uuids = [generate_uuid() for _ in range(100)]
+
+    assert all(uuid.UUID(value).version == 7 for value in generated_uuids)
+    assert [value[:13] for value in generated_uuids] == sorted(
+        value[:13] for value in generated_uuids
+    )
+
+
+def test_invalid_uuid_is_recognized():
+    assert is_valid_uuid(generate_uuid())
+    assert not is_valid_uuid("345fedf34--345435-3452133dwe")
+
+
+async def test_malformed_path_ids_never_reach_the_database(
+    async_client: AsyncClient, staff_auth_headers: dict[str, str]
+):
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        id_names = [
+            field.name
+            for field in route.dependant.path_params
+            if field.name.endswith("_id")
+        ]
+        if not id_names:
+            continue
+
+        path = route.path_format.removeprefix("/api/")
+        for name in id_names:
+            path = path.replace(f"{{{name}}}", "not-an-id")
+        for method in route.methods:
+            response = await async_client.request(
+                method, path, headers=staff_auth_headers, json={}
+            )
+            assert response.status_code < 500, (method, route.path_format)
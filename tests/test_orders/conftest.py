@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import BackgroundTasks
 
 from src.apps.orders.models import Cart
@@ -38,38 +38,40 @@ DB_CART_ITEMS_SCHEMAS = [
 
 
 @pytest.fixture
-def db_carts(
-    sync_session: Session,
+async def db_carts(
+    async_session: AsyncSession,
     db_user: UserOutputSchema,
     db_staff_user: UserOutputSchema,
     db_categories: list[CategoryOutputSchema],
     db_products: list[ProductOutputSchema],
 ) -> PagedResponseSchema[CartOutputSchema]:
     created_carts = [
-        create_cart(sync_session, user.id) for user in [db_user, db_staff_user]
+        await create_cart(async_session, user.id) for user in [db_user, db_staff_user]
     ]
     [
         setattr(cart_item_schema, "product_id", product.id)
         for cart_item_schema, product in zip(DB_CART_ITEMS_SCHEMAS, db_products)
     ]
     [
-        create_cart_item(sync_session, cart_item_schema, cart_id)
+        await create_cart_item(async_session, cart_item_schema, cart_id)
         for cart_item_schema, cart_id in zip(
             DB_CART_ITEMS_SCHEMAS,
             [created_carts[0].id, created_carts[1].id, created_carts[0].id],
         )
     ]
-    return get_all_carts(sync_session, PageParams())
+    return await get_all_carts(async_session, PageParams())
 
 
 @pytest.fixture
-def db_cart_items(sync_session: Session) -> PagedResponseSchema[CartItemOutputSchema]:
-    return get_all_cart_items(sync_session, PageParams())
+async def db_cart_items(
+    async_session: AsyncSession,
+) -> PagedResponseSchema[CartItemOutputSchema]:
+    return await get_all_cart_items(async_session, PageParams())
 
 
 @pytest.fixture
-def db_orders(
-    sync_session: Session,
+async def db_orders(
+    async_session: AsyncSession,
     db_user: UserOutputSchema,
     db_staff_user: UserOutputSchema,
     db_categories: list[CategoryOutputSchema],
@@ -77,15 +79,17 @@ def db_orders(
     db_carts: PagedResponseSchema[CartOutputSchema],
 ) -> list[OrderOutputSchema]:
     [
-        create_order(sync_session, user.id, cart.id, BackgroundTasks())
+        await create_order(async_session, user.id, cart.id, BackgroundTasks())
         for user, cart in zip(
             [db_user, db_staff_user], [db_carts.results[0], db_carts.results[1]]
         )
     ]
 
-    return get_all_orders(sync_session, PageParams())
+    return await get_all_orders(async_session, PageParams())
 
 
 @pytest.fixture
-def db_order_items(sync_session: Session) -> PagedResponseSchema[CartItemOutputSchema]:
-    return get_all_order_items(sync_session, PageParams())
+async def db_order_items(
+    async_session: AsyncSession,
+) -> PagedResponseSchema[CartItemOutputSchema]:
+    return await get_all_order_items(async_session, PageParams())
@@ -1,5 +1,5 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from fastapi_jwt_auth import AuthJWT
 
 from src.apps.orders.schemas import CartItemOutputSchema, CartOutputSchema
@@ -16,8 +16,8 @@ from tests.test_users.conftest import (
 )
 
 
-def test_authenticated_user_can_add_item_to_their_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_can_add_item_to_their_cart(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -27,7 +27,7 @@ def test_authenticated_user_can_add_item_to_their_cart(
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
     new_cart_item = CartItemInputSchemaFactory().generate(product_id=db_products[2].id)
 
-    response = sync_client.post(
+    response = await async_client.post(
         f"carts/{cart.id}/items/", headers=auth_headers, content=new_cart_item.json()
     )
 
@@ -35,8 +35,8 @@ def test_authenticated_user_can_add_item_to_their_cart(
     assert response.json()["cart_id"] == cart.id
 
 
-def test_staff_user_can_add_item_to_any_cart(
-    sync_client: TestClient,
+async def test_staff_user_can_add_item_to_any_cart(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -46,7 +46,7 @@ def test_staff_user_can_add_item_to_any_cart(
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
     new_cart_item = CartItemInputSchemaFactory().generate(product_id=db_products[1].id)
 
-    response = sync_client.post(
+    response = await async_client.post(
         f"carts/{cart.id}/items/",
         headers=staff_auth_headers,
         content=new_cart_item.json(),
@@ -56,8 +56,35 @@ def test_staff_user_can_add_item_to_any_cart(
     assert response.json()["cart_id"] == cart.id
 
 
-def test_anonymous_user_cannot_add_item_to_the_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_can_add_many_items_to_their_cart(
+    async_client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_cart_items: list[CartItemOutputSchema],
+    db_carts: list[CartOutputSchema],
+    db_products: list[ProductOutputSchema],
+    db_user: UserOutputSchema,
+):
+    cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
+    cart_items = [
+        CartItemInputSchemaFactory().generate(product_id=product.id, quantity=1)
+        for product in [db_products[0], db_products[0]]
+    ]
+
+    response = await async_client.post(
+        f"carts/{cart.id}/items/batch",
+        headers=auth_headers,
+        json={"items": [cart_item.dict() for cart_item in cart_items]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert results[0]["cart_item"]["cart_id"] == cart.id
+    assert results[0]["cart_item"]["quantity"] == 1
+    assert results[1]["error"] is not None
+
+
+async def test_anonymous_user_cannot_add_item_to_the_cart(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -67,13 +94,15 @@ def test_anonymous_user_cannot_add_item_to_the_cart(
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
     new_cart_item = CartItemInputSchemaFactory().generate(product_id=db_products[1].id)
 
-    response = sync_client.post(f"carts/{cart.id}/items/", content=new_cart_item.json())
+    response = await async_client.post(
+        f"carts/{cart.id}/items/", content=new_cart_item.json()
+    )
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_authenticated_user_can_re_add_item_to_their_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_can_re_add_item_to_their_cart(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -90,7 +119,7 @@ def test_authenticated_user_can_re_add_item_to_their_cart(
         quantity=21, product_id=db_products[2].id
     )
 
-    response = sync_client.post(
+    response = await async_client.post(
         f"carts/{cart.id}/items/", headers=auth_headers, content=new_cart_item.json()
     )
 
@@ -98,8 +127,8 @@ def test_authenticated_user_can_re_add_item_to_their_cart(
     assert response.json()["quantity"] == new_cart_item.quantity
 
 
-def test_staff_user_can_re_add_item_to_any_cart(
-    sync_client: TestClient,
+async def test_staff_user_can_re_add_item_to_any_cart(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -111,7 +140,7 @@ def test_staff_user_can_re_add_item_to_any_cart(
         quantity=21, product_id=db_products[2].id
     )
 
-    response = sync_client.post(
+    response = await async_client.post(
         f"carts/{cart.id}/items/",
         headers=staff_auth_headers,
         content=new_cart_item.json(),
@@ -121,24 +150,27 @@ def test_staff_user_can_re_add_item_to_any_cart(
     assert response.json()["quantity"] == new_cart_item.quantity
 
 
-def test_authenticated_user_cannot_add_item_to_not_their_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_add_item_to_not_their_cart(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
     db_products: list[ProductOutputSchema],
+    db_staff_user: UserOutputSchema,
 ):
-    cart_id = db_carts.results[0].id
+    cart_id = next(
+        cart.id for cart in db_carts.results if cart.user_id == db_staff_user.id
+    )
     new_cart_item = CartItemInputSchemaFactory().generate(product_id=db_products[0].id)
-    response = sync_client.post(
+    response = await async_client.post(
         f"carts/{cart_id}/items/", headers=auth_headers, content=new_cart_item.json()
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_authenticated_user_can_get_single_cart_item(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_single_cart_item(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -148,7 +180,7 @@ def test_authenticated_user_can_get_single_cart_item(
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
     print(db_cart_items)
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}", headers=auth_headers
     )
 
@@ -156,8 +188,8 @@ def test_authenticated_user_can_get_single_cart_item(
     assert response.json()["id"] == cart.cart_items[0].id
 
 
-def test_authenticated_user_cannot_get_single_cart_item_from_not_their_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_get_single_cart_item_from_not_their_cart(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -166,15 +198,34 @@ def test_authenticated_user_cannot_get_single_cart_item_from_not_their_cart(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_staff_user.id][0]
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}", headers=auth_headers
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_single_cart_item(
-    sync_client: TestClient,
+async def test_malformed_cart_item_id_is_reported_as_not_found(
+    async_client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_cart_items: list[CartItemOutputSchema],
+    db_carts: list[CartOutputSchema],
+    db_products: list[ProductOutputSchema],
+    db_user: UserOutputSchema,
+):
+    cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
+
+    for method in ["get", "delete"]:
+        response = await getattr(async_client, method)(
+            f"carts/{cart.id}/items/not-an-id", headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == "CartItem with id=not-an-id does not exist"
+
+
+async def test_anonymous_user_cannot_get_single_cart_item(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -183,13 +234,13 @@ def test_anonymous_user_cannot_get_single_cart_item(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
 
-    response = sync_client.get(f"carts/{cart.id}/items/{cart.cart_items[0].id}")
+    response = await async_client.get(f"carts/{cart.id}/items/{cart.cart_items[0].id}")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_staff_user_can_get_cart_items_for_any_cart(
-    sync_client: TestClient,
+async def test_staff_user_can_get_cart_items_for_any_cart(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -198,14 +249,16 @@ def test_staff_user_can_get_cart_items_for_any_cart(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
 
-    response = sync_client.get(f"carts/{cart.id}/items/", headers=staff_auth_headers)
+    response = await async_client.get(
+        f"carts/{cart.id}/items/", headers=staff_auth_headers
+    )
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(cart.cart_items)
 
 
-def test_staff_user_can_get_cart_items_for_any_cart(
-    sync_client: TestClient,
+async def test_staff_user_can_get_cart_items_for_any_cart(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -214,14 +267,16 @@ def test_staff_user_can_get_cart_items_for_any_cart(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
 
-    response = sync_client.get(f"carts/{cart.id}/items/", headers=staff_auth_headers)
+    response = await async_client.get(
+        f"carts/{cart.id}/items/", headers=staff_auth_headers
+    )
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(cart.cart_items)
 
 
-def test_authenticated_user_can_get_cart_items_for_their_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_cart_items_for_their_cart(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -230,14 +285,14 @@ def test_authenticated_user_can_get_cart_items_for_their_cart(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
 
-    response = sync_client.get(f"carts/{cart.id}/items/", headers=auth_headers)
+    response = await async_client.get(f"carts/{cart.id}/items/", headers=auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(cart.cart_items)
 
 
-def test_authenticated_user_cannot_get_cart_items_for_not_their_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_get_cart_items_for_not_their_cart(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -246,13 +301,13 @@ def test_authenticated_user_cannot_get_cart_items_for_not_their_cart(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_staff_user.id][0]
 
-    response = sync_client.get(f"carts/{cart.id}/items/", headers=auth_headers)
+    response = await async_client.get(f"carts/{cart.id}/items/", headers=auth_headers)
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_cart_items(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_cart_items(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -261,13 +316,13 @@ def test_anonymous_user_cannot_get_cart_items(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
 
-    response = sync_client.get(f"carts/{cart.id}/items/")
+    response = await async_client.get(f"carts/{cart.id}/items/")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_authenticated_user_can_update_their_cart_item(
-    sync_client: TestClient,
+async def test_authenticated_user_can_update_their_cart_item(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -277,7 +332,7 @@ def test_authenticated_user_can_update_their_cart_item(
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
     update_data = CartItemUpdateSchemaFactory().generate(quantity=21)
 
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}",
         headers=auth_headers,
         content=update_data.json(),
@@ -287,8 +342,8 @@ def test_authenticated_user_can_update_their_cart_item(
     assert response.json()["quantity"] == update_data.quantity
 
 
-def test_staff_user_can_update_any_cart_item(
-    sync_client: TestClient,
+async def test_staff_user_can_update_any_cart_item(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -298,7 +353,7 @@ def test_staff_user_can_update_any_cart_item(
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
     update_data = CartItemUpdateSchemaFactory().generate(quantity=21)
 
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}",
         headers=staff_auth_headers,
         content=update_data.json(),
@@ -308,8 +363,8 @@ def test_staff_user_can_update_any_cart_item(
     assert response.json()["quantity"] == update_data.quantity
 
 
-def test_authenticated_user_cannot_update_cart_item_from_not_their_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_update_cart_item_from_not_their_cart(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -319,7 +374,7 @@ def test_authenticated_user_cannot_update_cart_item_from_not_their_cart(
     cart = [cart for cart in db_carts.results if cart.user_id == db_staff_user.id][0]
     update_data = CartItemUpdateSchemaFactory().generate(quantity=21)
 
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}",
         headers=auth_headers,
         content=update_data.json(),
@@ -328,8 +383,8 @@ def test_authenticated_user_cannot_update_cart_item_from_not_their_cart(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonnymous_user_cannot_update_cart_item(
-    sync_client: TestClient,
+async def test_anonnymous_user_cannot_update_cart_item(
+    async_client: AsyncClient,
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
     db_products: list[ProductOutputSchema],
@@ -338,15 +393,15 @@ def test_anonnymous_user_cannot_update_cart_item(
     cart = [cart for cart in db_carts.results if cart.user_id == db_staff_user.id][0]
     update_data = CartItemUpdateSchemaFactory().generate(quantity=21)
 
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}", content=update_data.json()
     )
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_authenticated_user_can_delete_cart_item(
-    sync_client: TestClient,
+async def test_authenticated_user_can_delete_cart_item(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -355,14 +410,14 @@ def test_authenticated_user_can_delete_cart_item(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
 
-    response = sync_client.delete(
+    response = await async_client.delete(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}", headers=auth_headers
     )
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
-def test_staff_user_can_delete_any_cart_item(
-    sync_client: TestClient,
+async def test_staff_user_can_delete_any_cart_item(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -371,14 +426,14 @@ def test_staff_user_can_delete_any_cart_item(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
 
-    response = sync_client.delete(
+    response = await async_client.delete(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
-def test_authenticated_user_cannot_delete_cart_item_from_not_their_cart(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_delete_cart_item_from_not_their_cart(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
@@ -387,15 +442,15 @@ def test_authenticated_user_cannot_delete_cart_item_from_not_their_cart(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_staff_user.id][0]
 
-    response = sync_client.delete(
+    response = await async_client.delete(
         f"carts/{cart.id}/items/{cart.cart_items[0].id}", headers=auth_headers
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_delete_cart_item(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_delete_cart_item(
+    async_client: AsyncClient,
     db_cart_items: list[CartItemOutputSchema],
     db_carts: list[CartOutputSchema],
     db_products: list[ProductOutputSchema],
@@ -403,6 +458,8 @@ def test_anonymous_user_cannot_delete_cart_item(
 ):
     cart = [cart for cart in db_carts.results if cart.user_id == db_user.id][0]
 
-    response = sync_client.delete(f"carts/{cart.id}/items/{cart.cart_items[0].id}")
+    response = await async_client.delete(
+        f"carts/{cart.id}/items/{cart.cart_items[0].id}"
+    )
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,8 +1,9 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from fastapi_jwt_auth import AuthJWT
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import selectinload
 
 from src.apps.orders.schemas import OrderItemOutputSchema, OrderOutputSchema
 from src.apps.user.schemas import UserOutputSchema
@@ -16,19 +17,21 @@ from tests.test_users.conftest import (
 )
 
 
-def test_staff_user_can_get_any_single_order_item(
-    sync_session: Session,
-    sync_client: TestClient,
+async def test_staff_user_can_get_any_single_order_item(
+    async_session: AsyncSession,
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
     db_order_items: list[OrderItemOutputSchema],
     db_staff_user: UserOutputSchema,
 ):
-    order = sync_session.scalar(
-        select(Order).filter(Order.id == db_orders.results[1].id)
+    order = await async_session.scalar(
+        select(Order)
+        .filter(Order.id == db_orders.results[1].id)
+        .options(selectinload(Order.order_items))
     )
     
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{order.id}/items/{order.order_items[0].id}",
         headers=staff_auth_headers,
     )
@@ -38,14 +41,14 @@ def test_staff_user_can_get_any_single_order_item(
     assert response.json()["id"] == order.order_items[0].id
 
 
-def test_authenticated_user_cannot_get_order_item_from_not_their_order(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_get_order_item_from_not_their_order(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
     db_order_items: list[OrderItemOutputSchema],
     db_user: UserOutputSchema,
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{db_orders.results[1].id}/items/{db_order_items.results[1].id}",
         headers=auth_headers,
     )
@@ -53,20 +56,20 @@ def test_authenticated_user_cannot_get_order_item_from_not_their_order(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_single_order_item(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_single_order_item(
+    async_client: AsyncClient,
     db_orders: list[OrderOutputSchema],
     db_order_items: list[OrderItemOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{db_orders.results[1].id}/items/{db_order_items.results[1].id}"
     )
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_staff_user_can_get_order_items_from_any_order(
-    sync_client: TestClient,
+async def test_staff_user_can_get_order_items_from_any_order(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
     db_order_items: list[OrderItemOutputSchema],
@@ -75,39 +78,39 @@ def test_staff_user_can_get_order_items_from_any_order(
 ):
     order = [order for order in db_orders.results if order.user_id == db_user.id][0]
 
-    response = sync_client.get(f"orders/{order.id}/items/", headers=staff_auth_headers)
+    response = await async_client.get(f"orders/{order.id}/items/", headers=staff_auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(order.order_items)
 
 
-def test_authenticated_user_can_get_order_items_only_from_their_order(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_order_items_only_from_their_order(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
     db_order_items: list[OrderItemOutputSchema],
     db_user: UserOutputSchema,
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{db_orders.results[0].id}/items/", headers=auth_headers
     )
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(db_orders.results[0].order_items)
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{db_orders.results[1].id}/items/", headers=auth_headers
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_order_items(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_order_items(
+    async_client: AsyncClient,
     db_orders: list[OrderOutputSchema],
     db_order_items: list[OrderItemOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{db_orders.results[1].id}/items/{db_order_items.results[1].id}"
     )
 
@@ -1,5 +1,5 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from fastapi_jwt_auth import AuthJWT
 
 from src.apps.orders.schemas import OrderOutputSchema
@@ -18,66 +18,89 @@ as this functionality is placed in cart_routers (POST: carts/{cart_id}/order)
 """
 
 
-def test_staff_user_can_get_all_orders(
-    sync_client: TestClient,
+async def test_staff_user_can_get_all_orders(
+    async_client: AsyncClient,
     db_staff_user: UserOutputSchema,
     staff_auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.get("orders/all", headers=staff_auth_headers)
+    response = await async_client.get("orders/all", headers=staff_auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert db_orders.total == response.json()["total"]
 
 
-def test_authenticated_user_cannot_get_all_orders(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_get_all_orders(
+    async_client: AsyncClient,
     db_user: UserOutputSchema,
     auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.get("orders/all", headers=auth_headers)
+    response = await async_client.get("orders/all", headers=auth_headers)
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_all_orders(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_all_orders(
+    async_client: AsyncClient,
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.get("orders/all")
+    response = await async_client.get("orders/all")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_authenticated_user_can_get_their_orders(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_their_orders(
+    async_client: AsyncClient,
     db_user: UserOutputSchema,
     auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.get("orders/", headers=auth_headers)
+    response = await async_client.get("orders/", headers=auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert [order["user_id"] for order in response.json()["results"]][0] == db_user.id
 
 
-def test_anonymous_user_cannot_get_their_orders(
-    sync_client: TestClient,
+async def test_order_listings_can_be_trimmed_to_requested_fields(
+    async_client: AsyncClient,
+    db_user: UserOutputSchema,
+    auth_headers: dict[str, str],
+    staff_auth_headers: dict[str, str],
+    db_orders: list[OrderOutputSchema],
+):
+    for url, headers in [
+        ("orders/", auth_headers),
+        (f"users/{db_user.id}/orders", staff_auth_headers),
+    ]:
+        response = await async_client.get(
+            url, params={"fields": "id,user_id"}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["results"]
+        assert all(
+            order.keys() == {"id", "user_id"} and order["user_id"] == db_user.id
+            for order in response.json()["results"]
+        )
+
+
+async def test_anonymous_user_cannot_get_their_orders(
+    async_client: AsyncClient,
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.get("orders/")
+    response = await async_client.get("orders/")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_authenticated_user_can_get_single_order(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_single_order(
+    async_client: AsyncClient,
     db_user: UserOutputSchema,
     auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{db_orders.results[0].id}", headers=auth_headers
     )
 
@@ -85,60 +108,60 @@ def test_authenticated_user_can_get_single_order(
     assert response.json()["id"] == db_orders.results[0].id
 
 
-def test_authenticated_user_cannot_get_not_their_order(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_get_not_their_order(
+    async_client: AsyncClient,
     db_user: UserOutputSchema,
     auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{db_orders.results[1].id}", headers=auth_headers
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_single_order(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_single_order(
+    async_client: AsyncClient,
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.get(f"orders/{db_orders.results[1].id}")
+    response = await async_client.get(f"orders/{db_orders.results[1].id}")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_staff_user_can_cancel_single_order(
-    sync_client: TestClient,
+async def test_staff_user_can_cancel_single_order(
+    async_client: AsyncClient,
     db_staff_user: UserOutputSchema,
     staff_auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"orders/{db_orders.results[0].id}/cancel", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"orders/{db_orders.results[0].id}", headers=staff_auth_headers
     )
     assert response.json()["cancelled"] == True
 
 
-def test_authenticated_user_cannot_cancel_single_order(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_cancel_single_order(
+    async_client: AsyncClient,
     db_user: UserOutputSchema,
     auth_headers: dict[str, str],
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"orders/{db_orders.results[0].id}/cancel", headers=auth_headers
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_cancel_single_order(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_cancel_single_order(
+    async_client: AsyncClient,
     db_orders: list[OrderOutputSchema],
 ):
-    response = sync_client.patch(f"orders/{db_orders.results[0].id}/cancel")
+    response = await async_client.patch(f"orders/{db_orders.results[0].id}/cancel")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
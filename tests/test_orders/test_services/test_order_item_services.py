@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 
 import pytest
 from freezegun import freeze_time
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import BackgroundTasks
 
 from src.apps.orders.schemas import (
@@ -57,32 +57,34 @@ from tests.test_products.conftest import db_products
 from tests.test_users.conftest import db_user
 
 
-def test_if_only_one_order_item_was_returned(
-    sync_session: Session,
+async def test_if_only_one_order_item_was_returned(
+    async_session: AsyncSession,
     db_orders: PagedResponseSchema[OrderOutputSchema],
     db_order_items: PagedResponseSchema[OrderItemOutputSchema],
 ):
-    order_item = get_single_order_item(sync_session, db_order_items.results[1].id)
+    order_item = await get_single_order_item(
+        async_session, db_order_items.results[1].id
+    )
     assert order_item.id == db_order_items.results[1].id
 
 
-def test_raise_exception_while_getting_nonexistent_order_item(
-    sync_session: Session,
+async def test_raise_exception_while_getting_nonexistent_order_item(
+    async_session: AsyncSession,
     db_orders: PagedResponseSchema[OrderOutputSchema],
     db_order_items: PagedResponseSchema[OrderItemOutputSchema],
 ):
     with pytest.raises(DoesNotExist):
-        get_single_order_item(sync_session, generate_uuid())
+        await get_single_order_item(async_session, generate_uuid())
 
 
-def test_all_order_items_in_the_order_belongs_to_the_same_order(
-    sync_session: Session,
+async def test_all_order_items_in_the_order_belongs_to_the_same_order(
+    async_session: AsyncSession,
     db_user: UserOutputSchema,
     db_orders: PagedResponseSchema[OrderOutputSchema],
     db_order_items: PagedResponseSchema[OrderItemOutputSchema],
 ):
-    order_items = get_all_order_items_for_single_order(
-        sync_session, db_orders.results[0].id, PageParams(page=1, size=25)
+    order_items = await get_all_order_items_for_single_order(
+        async_session, db_orders.results[0].id, PageParams(page=1, size=25)
     )
     assert [
         order_id
@@ -90,17 +92,17 @@ def test_all_order_items_in_the_order_belongs_to_the_same_order(
     ][0] == db_orders.results[0].id
 
 
-def test_if_multiple_order_items_were_returned(
-    sync_session: Session,
+async def test_if_multiple_order_items_were_returned(
+    async_session: AsyncSession,
     db_orders: PagedResponseSchema[OrderOutputSchema],
     db_order_items: PagedResponseSchema[OrderItemOutputSchema],
 ):
-    order_items = get_all_order_items(sync_session, PageParams(page=1, size=5))
+    order_items = await get_all_order_items(async_session, PageParams(page=1, size=5))
     assert order_items.total == db_order_items.total
 
 
-def test_if_order_item_price_remains_the_same_when_product_price_changes(
-    sync_session: Session,
+async def test_if_order_item_price_remains_the_same_when_product_price_changes(
+    async_session: AsyncSession,
     db_orders: PagedResponseSchema[OrderOutputSchema],
     db_order_items: PagedResponseSchema[OrderItemOutputSchema],
     db_products: list[ProductOutputSchema],
@@ -114,9 +116,11 @@ def test_if_order_item_price_remains_the_same_when_product_price_changes(
 
     product_new_price = 100
     product_update_data = ProductUpdateSchemaFactory().generate(price=product_new_price)
-    update_single_product(sync_session, product_update_data, order_item.product.id)
+    await update_single_product(
+        async_session, product_update_data, order_item.product.id
+    )
 
-    order = get_single_order(sync_session, order.id)
+    order = await get_single_order(async_session, order.id)
 
     assert order.order_items[0].order_item_price == order_item_price_before_update
     assert (
@@ -126,25 +130,25 @@ def test_if_order_item_price_remains_the_same_when_product_price_changes(
     assert order.order_items[0].product.price == product_new_price
 
 
-def test_product_removed_from_store_remains_in_the_order_details(
-    sync_session: Session,
+async def test_product_removed_from_store_remains_in_the_order_details(
+    async_session: AsyncSession,
     db_user: UserOutputSchema,
     db_products: list[ProductOutputSchema],
 ):
-    cart = create_cart(sync_session, db_user.id)
+    cart = await create_cart(async_session, db_user.id)
     cart_item_data = CartItemInputSchemaFactory().generate(product_id=db_products[0].id)
-    cart_item = create_cart_item(sync_session, cart_item_data, cart.id)
-    order = create_order(sync_session, db_user.id, cart.id, BackgroundTasks())
+    cart_item = await create_cart_item(async_session, cart_item_data, cart.id)
+    order = await create_order(async_session, db_user.id, cart.id, BackgroundTasks())
     order_item = order.order_items[0]
     assert len(order.order_items) == 1
 
-    remove_single_product_from_store(sync_session, order_item.product.id)
-    order_item_product = get_single_product_or_inventory(
-        sync_session, order_item.product.id
+    await remove_single_product_from_store(async_session, order_item.product.id)
+    order_item_product = await get_single_product_or_inventory(
+        async_session, order_item.product.id
     )
     assert order_item_product.removed_from_store == True
 
-    order = get_single_order(sync_session, order.id)
+    order = await get_single_order(async_session, order.id)
 
     assert len(order.order_items) == 1
     assert order.order_items[0].product.id == order_item.product.id
@@ -2,7 +2,7 @@ from typing import Any
 
 import pytest
 from fastapi import BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.orders.schemas import OrderOutputSchema
 from src.apps.orders.services.order_services import fulfill_order
@@ -55,15 +55,15 @@ def payment_intent() -> dict[str, Any]:
 
 
 @pytest.fixture
-def db_payments(
-    sync_session: Session,
+async def db_payments(
+    async_session: AsyncSession,
     stripe_session: dict[str, Any],
     payment_intent: dict[str, Any],
     db_orders: PagedResponseSchema[OrderOutputSchema],
 ) -> PagedResponseSchema[PaymentOutputSchema]:
     [
-        fulfill_order(
-            sync_session,
+        await fulfill_order(
+            async_session,
             stripe_session,
             payment_intent,
             BackgroundTasks(),
@@ -71,4 +71,4 @@ def db_payments(
         )
         for order in db_orders.results
     ]
-    return get_all_payments(sync_session, PageParams())
+    return await get_all_payments(async_session, PageParams())
@@ -1,5 +1,5 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from fastapi_jwt_auth import AuthJWT
 
 from src.apps.orders.schemas import OrderOutputSchema
@@ -17,58 +17,58 @@ from src.apps.payments.schemas import PaymentOutputSchema
 from src.core.pagination.schemas import PagedResponseSchema
 
 
-def test_staff_user_can_get_all_payments(
-    sync_client: TestClient,
+async def test_staff_user_can_get_all_payments(
+    async_client: AsyncClient,
     db_staff_user: UserOutputSchema,
     staff_auth_headers: dict[str, str],
     db_payments: PagedResponseSchema[PaymentOutputSchema],
 ):
-    response = sync_client.get("payments/all", headers=staff_auth_headers)
+    response = await async_client.get("payments/all", headers=staff_auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert db_payments.total == response.json()["total"]
 
 
-def test_authenticate_user_cannot_get_all_payments(
-    sync_client: TestClient,
+async def test_authenticate_user_cannot_get_all_payments(
+    async_client: AsyncClient,
     db_user: UserOutputSchema,
     auth_headers: dict[str, str],
     db_payments: PagedResponseSchema[PaymentOutputSchema],
 ):
-    response = sync_client.get("payments/all", headers=auth_headers)
+    response = await async_client.get("payments/all", headers=auth_headers)
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_all_payments(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_all_payments(
+    async_client: AsyncClient,
     db_payments: PagedResponseSchema[PaymentOutputSchema],
 ):
-    response = sync_client.get("payments/all")
+    response = await async_client.get("payments/all")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_authenticate_user_can_get_their_payments(
-    sync_client: TestClient,
+async def test_authenticate_user_can_get_their_payments(
+    async_client: AsyncClient,
     db_user: UserOutputSchema,
     auth_headers: dict[str, str],
     db_payments: PagedResponseSchema[PaymentOutputSchema],
 ):
-    response = sync_client.get("payments/", headers=auth_headers)
+    response = await async_client.get("payments/", headers=auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == 1
     assert response.json()["results"][0]["user"]["id"] == db_user.id
 
 
-def test_staff_user_can_get_any_single_payment(
-    sync_client: TestClient,
+async def test_staff_user_can_get_any_single_payment(
+    async_client: AsyncClient,
     db_staff_user: UserOutputSchema,
     staff_auth_headers: dict[str, str],
     db_payments: PagedResponseSchema[PaymentOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"payments/{db_payments.results[0].id}", headers=staff_auth_headers
     )
 
@@ -76,30 +76,30 @@ def test_staff_user_can_get_any_single_payment(
     assert response.json()["id"] == db_payments.results[0].id
 
 
-def test_authenticated_user_can_get_only_their_single_payment(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_only_their_single_payment(
+    async_client: AsyncClient,
     db_user: UserOutputSchema,
     auth_headers: dict[str, str],
     db_payments: PagedResponseSchema[PaymentOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"payments/{db_payments.results[0].id}", headers=auth_headers
     )
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["id"] == db_payments.results[0].id
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"payments/{db_payments.results[1].id}", headers=auth_headers
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_single_payment(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_single_payment(
+    async_client: AsyncClient,
     db_payments: PagedResponseSchema[PaymentOutputSchema],
 ):
-    response = sync_client.get(f"payments/{db_payments.results[0].id}")
+    response = await async_client.get(f"payments/{db_payments.results[0].id}")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
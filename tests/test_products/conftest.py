@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.products.schemas import (
     CategoryOutputSchema,
@@ -37,13 +37,16 @@ DB_PRODUCT_SCHEMAS = [
 
 
 @pytest.fixture
-def db_categories(sync_session: Session) -> list[CategoryOutputSchema]:
-    return [create_category(sync_session, category) for category in DB_CATEGORY_SCHEMAS]
+async def db_categories(async_session: AsyncSession) -> list[CategoryOutputSchema]:
+    return [
+        await create_category(async_session, category)
+        for category in DB_CATEGORY_SCHEMAS
+    ]
 
 
 @pytest.fixture
-def db_products(
-    sync_session: Session, db_categories: list[CategoryOutputSchema]
+async def db_products(
+    async_session: AsyncSession, db_categories: list[CategoryOutputSchema]
 ) -> list[ProductOutputSchema]:
     for index, product in enumerate(DB_PRODUCT_SCHEMAS):
         category_id = db_categories[
@@ -52,9 +55,11 @@ def db_products(
         product.category_ids = [
             category_id
         ]  # assign the category to the product input schema, one category per product as default
-    return [create_product(sync_session, product) for product in DB_PRODUCT_SCHEMAS]
+    return [
+        await create_product(async_session, product) for product in DB_PRODUCT_SCHEMAS
+    ]
 
 
 @pytest.fixture
-def db_inventories(sync_session) -> PagedResponseSchema[InventoryOutputSchema]:
-    return get_all_inventories(sync_session, PageParams())
+async def db_inventories(async_session) -> PagedResponseSchema[InventoryOutputSchema]:
+    return await get_all_inventories(async_session, PageParams())
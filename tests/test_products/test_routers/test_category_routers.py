@@ -1,51 +1,51 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from src.apps.products.schemas import CategoryOutputSchema
 from src.core.factories import CategoryInputSchemaFactory
 
 
-def test_staff_can_create_category(
-    sync_client: TestClient,
+async def test_staff_can_create_category(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
 ):
     create_data = CategoryInputSchemaFactory().generate()
-    response = sync_client.post(
+    response = await async_client.post(
         "categories/", content=create_data.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
 
-def test_authenticated_user_can_get_all_categories(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_all_categories(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
-    response = sync_client.get("categories/", headers=auth_headers)
+    response = await async_client.get("categories/", headers=auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(db_categories)
 
 
-def test_staff_get_single_category(
-    sync_client: TestClient,
+async def test_staff_get_single_category(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"categories/{db_categories[1].id}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["id"] == db_categories[1].id
 
 
-def test_staff_can_update_category(
-    sync_client: TestClient,
+async def test_staff_can_update_category(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
     update_data = CategoryInputSchemaFactory().generate(name="updated")
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"categories/{db_categories[0].id}",
         content=update_data.json(),
         headers=staff_auth_headers,
@@ -55,43 +55,43 @@ def test_staff_can_update_category(
     assert response.json()["name"] == update_data.name
 
 
-def test_staff_can_delete_category(
-    sync_client: TestClient,
+async def test_staff_can_delete_category(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
-    response = sync_client.delete(
+    response = await async_client.delete(
         f"categories/{db_categories[0].id}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
-def test_anonymous_user_cannot_get_categories(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_categories(
+    async_client: AsyncClient,
 ):
-    response = sync_client.get("categories/")
+    response = await async_client.get("categories/")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"] == "Missing Authorization Header"
 
 
-def test_authenticated_user_cannot_get_single_category(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_get_single_category(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"categories/{db_categories[0].id}", headers=auth_headers
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_authenticated_user_cannot_update_category(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_update_category(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
     update_data = CategoryInputSchemaFactory().generate()
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"categories/{db_categories[0].id}",
         content=update_data.json(),
         headers=auth_headers,
@@ -99,31 +99,31 @@ def test_authenticated_user_cannot_update_category(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_update_category(
-    sync_client: TestClient, db_categories: list[CategoryOutputSchema]
+async def test_anonymous_user_cannot_update_category(
+    async_client: AsyncClient, db_categories: list[CategoryOutputSchema]
 ):
     update_data = CategoryInputSchemaFactory().generate()
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"categories/{db_categories[0].id}", content=update_data.json()
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"] == "Missing Authorization Header"
 
 
-def test_authenticated_user_cannot_delete_category(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_delete_category(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
-    response = sync_client.delete(
+    response = await async_client.delete(
         f"categories/{db_categories[0].id}", headers=auth_headers
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_delete_category(
-    sync_client: TestClient, db_categories: list[CategoryOutputSchema]
+async def test_anonymous_user_cannot_delete_category(
+    async_client: AsyncClient, db_categories: list[CategoryOutputSchema]
 ):
-    response = sync_client.delete(f"categories/{db_categories[0].id}")
+    response = await async_client.delete(f"categories/{db_categories[0].id}")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"] == "Missing Authorization Header"
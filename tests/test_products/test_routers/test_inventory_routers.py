@@ -1,42 +1,96 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apps.products.models import ProductInventory
 from src.apps.products.schemas import InventoryOutputSchema, ProductOutputSchema
-from src.core.factories import InventoryInputSchemaFactory
+from src.apps.products.services.inventory_services import (
+    get_single_inventory,
+    record_sold_quantity,
+    reserve_quantity_for_cart_items,
+    update_single_inventory,
+)
+from src.core.factories import InventoryInputSchemaFactory, InventoryUpdateSchemaFactory
 
 
-def test_staff_can_get_all_inventories(
-    sync_client: TestClient,
+async def test_staff_can_get_all_inventories(
+    async_client: AsyncClient,
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
     staff_auth_headers: dict[str, str],
 ):
-    response = sync_client.get("inventories/", headers=staff_auth_headers)
+    response = await async_client.get("inventories/", headers=staff_auth_headers)
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == db_inventories.total
 
 
-def test_staff_get_single_inventory(
-    sync_client: TestClient,
+async def test_sharded_inventories_can_be_trimmed_to_requested_fields(
+    async_client: AsyncClient,
+    async_session: AsyncSession,
+    db_products: list[ProductOutputSchema],
+    db_inventories: list[InventoryOutputSchema],
+    staff_auth_headers: dict[str, str],
+):
+    inventory_id = db_inventories.results[0].id
+    product_id = (await async_session.get(ProductInventory, inventory_id)).product_id
+    await update_single_inventory(
+        async_session,
+        InventoryUpdateSchemaFactory().generate(quantity=10, shard_count=4),
+        inventory_id,
+    )
+    await reserve_quantity_for_cart_items(async_session, product_id, 9)
+    await record_sold_quantity(async_session, product_id, 2)
+    await async_session.commit()
+    inventories = [
+        await get_single_inventory(async_session, inventory.id)
+        for inventory in db_inventories.results
+    ]
+
+    for params in [
+        {"fields": "quantity,quantity_for_cart_items"},
+        {"exclude": "id,shard_count,sold"},
+    ]:
+        response = await async_client.get(
+            "inventories/", params=params, headers=staff_auth_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(
+            (inventory["quantity"], inventory["quantity_for_cart_items"])
+            for inventory in response.json()["results"]
+        ) == sorted(
+            (inventory.quantity, inventory.quantity_for_cart_items)
+            for inventory in inventories
+        )
+        assert {tuple(inventory) for inventory in response.json()["results"]} == {
+            ("quantity", "quantity_for_cart_items")
+        }
+    assert (8, 1) in {
+        (inventory.quantity, inventory.quantity_for_cart_items)
+        for inventory in inventories
+    }
+
+
+async def test_staff_get_single_inventory(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"inventories/{db_inventories.results[1].id}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["id"] == db_inventories.results[1].id
 
 
-def test_staff_can_update_inventory(
-    sync_client: TestClient,
+async def test_staff_can_update_inventory(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
     update_data = InventoryInputSchemaFactory().generate()
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"inventories/{db_inventories.results[0].id}",
         content=update_data.json(),
         headers=staff_auth_headers,
@@ -46,34 +100,34 @@ def test_staff_can_update_inventory(
     assert response.json()["quantity"] == update_data.quantity
 
 
-def test_anonymous_user_cannot_get_inventories(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_inventories(
+    async_client: AsyncClient,
 ):
-    response = sync_client.get("inventories/")
+    response = await async_client.get("inventories/")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"] == "Missing Authorization Header"
 
 
-def test_authenticated_user_cannot_get_single_inventory(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_get_single_inventory(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
-    response = sync_client.get(
+    response = await async_client.get(
         f"inventories/{db_inventories.results[0].id}", headers=auth_headers
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_authenticated_user_cannot_update_inventory(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_update_inventory(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
     update_data = InventoryInputSchemaFactory().generate()
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"inventories/{db_inventories.results[0].id}",
         content=update_data.json(),
         headers=auth_headers,
@@ -81,13 +135,13 @@ def test_authenticated_user_cannot_update_inventory(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_update_inventory(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_update_inventory(
+    async_client: AsyncClient,
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
     update_data = InventoryInputSchemaFactory().generate()
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"inventories/{db_inventories.results[0].id}", content=update_data.json()
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,5 +1,5 @@
 from fastapi import status
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from src.apps.products.schemas import (
     CategoryOutputSchema,
@@ -13,8 +13,8 @@ from src.core.factories import (
 )
 
 
-def test_staff_can_create_product(
-    sync_client: TestClient,
+async def test_staff_can_create_product(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
@@ -22,113 +22,115 @@ def test_staff_can_create_product(
     product_data = ProductInputSchemaFactory().generate(
         category_ids=[db_categories[0].id], inventory=inventory_data
     )
-    response = sync_client.post(
+    response = await async_client.post(
         "products/", content=product_data.json(), headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_201_CREATED
 
 
-def test_staff_can_get_all_products_including_removed_ones(
-    sync_client: TestClient,
+async def test_staff_can_get_all_products_including_removed_ones(
+    async_client: AsyncClient,
     db_products: list[ProductOutputSchema],
     auth_headers: dict[str, str],
     staff_auth_headers: dict[str, str],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}/remove", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
 
-    response = sync_client.get("products/all", headers=staff_auth_headers)
+    response = await async_client.get("products/all", headers=staff_auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(db_products)
 
 
-def test_authenticated_user_cannot_get_all_products(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_get_all_products(
+    async_client: AsyncClient,
     db_products: list[ProductOutputSchema],
     auth_headers: dict[str, str],
 ):
-    response = sync_client.get("products/all", headers=auth_headers)
+    response = await async_client.get("products/all", headers=auth_headers)
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_get_all_products(
-    sync_client: TestClient,
+async def test_anonymous_user_cannot_get_all_products(
+    async_client: AsyncClient,
     db_products: list[ProductOutputSchema],
 ):
-    response = sync_client.get("products/all")
+    response = await async_client.get("products/all")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_authenticated_user_can_get_available_products(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_available_products(
+    async_client: AsyncClient,
     db_products: list[ProductOutputSchema],
     auth_headers: dict[str, str],
     staff_auth_headers: dict[str, str],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}/remove", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
 
-    response = sync_client.get("products/", headers=auth_headers)
+    response = await async_client.get("products/", headers=auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(db_products) - 1
 
 
-def test_anonymous_user_can_get_available_products(
-    sync_client: TestClient,
+async def test_anonymous_user_can_get_available_products(
+    async_client: AsyncClient,
     db_products: list[ProductOutputSchema],
     auth_headers: dict[str, str],
     staff_auth_headers: dict[str, str],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}/remove", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
 
-    response = sync_client.get("products/")
+    response = await async_client.get("products/")
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["total"] == len(db_products) - 1
 
 
-def test_authenticated_user_can_get_single_product(
-    sync_client: TestClient,
+async def test_authenticated_user_can_get_single_product(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
 ):
-    response = sync_client.get(f"products/{db_products[1].id}", headers=auth_headers)
+    response = await async_client.get(
+        f"products/{db_products[1].id}", headers=auth_headers
+    )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["id"] == db_products[1].id
 
 
-def test_anonymous_user_can_get_single_product(
-    sync_client: TestClient,
+async def test_anonymous_user_can_get_single_product(
+    async_client: AsyncClient,
     db_products: list[ProductOutputSchema],
 ):
-    response = sync_client.get(f"products/{db_products[1].id}")
+    response = await async_client.get(f"products/{db_products[1].id}")
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["id"] == db_products[1].id
 
 
-def test_staff_user_gets_whole_data_about_removed_product(
-    sync_client: TestClient,
+async def test_staff_user_gets_whole_data_about_removed_product(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
     staff_auth_headers: dict[str, str],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}/remove", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"products/all/{db_products[0].id}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
@@ -136,25 +138,27 @@ def test_staff_user_gets_whole_data_about_removed_product(
     assert response.json()["price"] == db_products[0].price
 
 
-def test_authenticated_user_gets_limited_data_about_removed_product(
-    sync_client: TestClient,
+async def test_authenticated_user_gets_limited_data_about_removed_product(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
     staff_auth_headers: dict[str, str],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}/remove", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
 
-    response = sync_client.get(f"products/{db_products[0].id}", headers=auth_headers)
+    response = await async_client.get(
+        f"products/{db_products[0].id}", headers=auth_headers
+    )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["description"] == db_products[0].description
     assert response.json()["name"] == db_products[0].name
 
 
-def test_staff_can_get_product_inventory(
-    sync_client: TestClient,
+async def test_staff_can_get_product_inventory(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_categories: list[CategoryOutputSchema],
 ):
@@ -162,7 +166,7 @@ def test_staff_can_get_product_inventory(
     product_data = ProductInputSchemaFactory().generate(
         category_ids=[db_categories[1].id], inventory=inventory_data
     )
-    response = sync_client.post(
+    response = await async_client.post(
         "products/", content=product_data.json(), headers=staff_auth_headers
     )
     inventory_id = response.json()["inventory"]["id"]
@@ -170,15 +174,15 @@ def test_staff_can_get_product_inventory(
 
     assert response.status_code == status.HTTP_201_CREATED
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"products/{product_id}/inventory", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["id"] == inventory_id
 
 
-def test_staff_can_update_product(
-    sync_client: TestClient,
+async def test_staff_can_update_product(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_products: list[ProductOutputSchema],
     db_categories: list[CategoryOutputSchema],
@@ -187,7 +191,7 @@ def test_staff_can_update_product(
         category_ids=[db_categories[1].id]
     )
 
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[1].id}",
         content=update_data.json(),
         headers=staff_auth_headers,
@@ -197,30 +201,30 @@ def test_staff_can_update_product(
     assert response.json()["categories"][0]["id"] == db_categories[1].id
 
 
-def test_staff_can_remove_product_from_store(
-    sync_client: TestClient,
+async def test_staff_can_remove_product_from_store(
+    async_client: AsyncClient,
     staff_auth_headers: dict[str, str],
     db_products: list[CategoryOutputSchema],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}/remove", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
 
-    response = sync_client.get(
+    response = await async_client.get(
         f"products/all/{db_products[0].id}", headers=staff_auth_headers
     )
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["removed_from_store"] == True
 
 
-def test_authenticated_user_cannot_update_product(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_update_product(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_products: list[CategoryOutputSchema],
 ):
     update_data = ProductUpdateSchemaFactory().generate()
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}",
         headers=auth_headers,
         content=update_data.json(),
@@ -228,31 +232,135 @@ def test_authenticated_user_cannot_update_product(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_update_product(
-    sync_client: TestClient, db_products: list[CategoryOutputSchema]
+async def test_anonymous_user_cannot_update_product(
+    async_client: AsyncClient, db_products: list[CategoryOutputSchema]
 ):
     update_data = ProductUpdateSchemaFactory().generate()
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}", content=update_data.json()
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"] == "Missing Authorization Header"
 
 
-def test_authenticated_user_cannot_remove_product_from_store(
-    sync_client: TestClient,
+async def test_authenticated_user_cannot_remove_product_from_store(
+    async_client: AsyncClient,
     auth_headers: dict[str, str],
     db_products: list[CategoryOutputSchema],
 ):
-    response = sync_client.patch(
+    response = await async_client.patch(
         f"products/{db_products[0].id}/remove", headers=auth_headers
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_anonymous_user_cannot_remove_product_from_store(
-    sync_client: TestClient, db_products: list[CategoryOutputSchema]
+async def test_anonymous_user_cannot_remove_product_from_store(
+    async_client: AsyncClient, db_products: list[CategoryOutputSchema]
 ):
-    response = sync_client.patch(f"products/{db_products[0].id}/remove")
+    response = await async_client.patch(f"products/{db_products[0].id}/remove")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"] == "Missing Authorization Header"
+
+
+async def test_products_can_be_searched_by_name_and_description(
+    async_client: AsyncClient,
+    staff_auth_headers: dict[str, str],
+    db_products: list[ProductOutputSchema],
+    db_categories: list[CategoryOutputSchema],
+):
+    products_data = [
+        ProductInputSchemaFactory().generate(
+            name="Thermoses deluxe",
+            description="Keeps coffee hot",
+            category_ids=[db_categories[0].id],
+            inventory=InventoryInputSchemaFactory().generate(),
+        ),
+        ProductInputSchemaFactory().generate(
+            name="Travel mug",
+            description="Fits every thermos holder",
+            category_ids=[db_categories[1].id],
+            inventory=InventoryInputSchemaFactory().generate(),
+        ),
+    ]
+    for product_data in products_data:
+        response = await async_client.post(
+            "products/", content=product_data.json(), headers=staff_auth_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    response = await async_client.get("products/search?q=thermo")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] == 2
+    assert [product["name"] for product in response.json()["results"]] == [
+        "Thermoses deluxe",
+        "Travel mug",
+    ]
+
+    response = await async_client.get(
+        f"products/search?q=thermos&categories__id__eq={db_categories[1].id}"
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [product["name"] for product in response.json()["results"]] == ["Travel mug"]
+
+    response = await async_client.get("products/search?q=coffee hot")
+    assert response.json()["total"] == 1
+
+
+async def test_search_query_must_contain_words(
+    async_client: AsyncClient, db_products: list[ProductOutputSchema]
+):
+    response = await async_client.get("products/search?q=!!")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.get("products/search")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_autocomplete_suggests_newly_created_products(
+    async_client: AsyncClient,
+    staff_auth_headers: dict[str, str],
+    db_categories: list[CategoryOutputSchema],
+):
+    product_data = ProductInputSchemaFactory().generate(
+        name="Quizzical kettle",
+        category_ids=[db_categories[0].id],
+        inventory=InventoryInputSchemaFactory().generate(),
+    )
+    response = await async_client.post(
+        "products/", content=product_data.json(), headers=staff_auth_headers
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    product_id = response.json()["id"]
+
+    response = await async_client.get("products/autocomplete?q=quizz")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()[0] == {
+        "kind": "product",
+        "id": product_id,
+        "name": product_data.name,
+    }
+
+    response = await async_client.get("products/autocomplete?q=kett&limit=100")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_product_listing_can_include_category_facets(
+    async_client: AsyncClient,
+    db_categories: list[CategoryOutputSchema],
+    db_products: list[ProductOutputSchema],
+):
+    response = await async_client.get("products/?facets=true&size=1")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["results"]) == 1
+    assert {facet["id"]: facet["count"] for facet in response.json()["facets"]} == {
+        category.id: 1 for category in db_categories
+    }
+
+    response = await async_client.get(f"products/facets?name={db_products[0].name}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"id": db_categories[0].id, "name": db_categories[0].name, "count": 1}
+    ]
+
+    response = await async_client.get("products/")
+    assert response.json()["facets"] is None
@@ -0,0 +1,95 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.products.schemas import CategoryOutputSchema, ProductOutputSchema
+from src.apps.products.services.autocomplete_services import (
+    CATEGORY_KIND,
+    PRODUCT_KIND,
+    AutocompleteIndex,
+    autocomplete_index,
+    build_autocomplete_index,
+)
+from src.apps.products.services.product_services import (
+    remove_single_product_from_store,
+)
+
+
+def get_names(index: AutocompleteIndex, query: str, limit: int = 10) -> list[str]:
+    return [suggestion.name for suggestion in index.lookup(query, limit)]
+
+
+def test_suggestions_are_ranked_by_weight_and_match_any_word():
+    index = AutocompleteIndex(max_entries=100, cached_prefix_length=2, top_size=5)
+    index.rebuild(
+        [
+            (PRODUCT_KIND, "1", "Steel Chair", 5),
+            (PRODUCT_KIND, "2", "Office chair", 50),
+            (CATEGORY_KIND, "3", "Chairs", 10),
+            (PRODUCT_KIND, "4", "Crème brûlée torch", 1),
+        ]
+    )
+
+    assert get_names(index, "ch") == ["Office chair", "Chairs", "Steel Chair"]
+    assert get_names(index, "CHAI", limit=2) == ["Office chair", "Chairs"]
+    assert get_names(index, "creme") == ["Crème brûlée torch"]
+    assert get_names(index, "brul") == ["Crème brûlée torch"]
+    assert get_names(index, "?!") == []
+
+
+def test_index_is_updated_incrementally():
+    index = AutocompleteIndex(max_entries=3, cached_prefix_length=2, top_size=1)
+    index.rebuild([(PRODUCT_KIND, "1", "Lamp", 10), (PRODUCT_KIND, "2", "Ladder", 3)])
+
+    index.add(PRODUCT_KIND, "1", "Table lamp")
+    assert get_names(index, "la") == ["Table lamp"]
+    assert get_names(index, "ta") == ["Table lamp"]
+
+    index.remove(PRODUCT_KIND, "1")
+    assert get_names(index, "la") == ["Ladder"]
+    assert get_names(index, "ta") == []
+
+    index.add(PRODUCT_KIND, "3", "Lantern", 0)
+    index.add(PRODUCT_KIND, "4", "Laptop", 0)
+    index.add(PRODUCT_KIND, "5", "Lapel pin", 0)
+    assert get_names(index, "lan") == ["Lantern"]
+    assert get_names(index, "lap") == ["Laptop"]
+
+
+def test_edits_made_during_a_rebuild_are_replayed(monkeypatch):
+    index = AutocompleteIndex(max_entries=10, cached_prefix_length=2, top_size=5)
+    index.rebuild([(PRODUCT_KIND, "1", "Lamp", 10)])
+    build_snapshot = index.build_snapshot
+
+    def build_snapshot_while_editing(items):
+        snapshot = build_snapshot(items)
+        index.add(PRODUCT_KIND, "2", "Ladder", 0)
+        index.remove(PRODUCT_KIND, "1")
+        return snapshot
+
+    monkeypatch.setattr(index, "build_snapshot", build_snapshot_while_editing)
+    index.rebuild([(PRODUCT_KIND, "1", "Lamp", 10), (PRODUCT_KIND, "3", "Lantern", 5)])
+
+    assert get_names(index, "la") == ["Lantern", "Ladder"]
+    assert get_names(index, "lam") == []
+
+
+async def test_index_follows_product_changes(
+    async_session: AsyncSession,
+    db_products: list[ProductOutputSchema],
+    db_categories: list[CategoryOutputSchema],
+):
+    await build_autocomplete_index(async_session)
+    product = db_products[0]
+
+    assert product.id in {
+        suggestion.id for suggestion in autocomplete_index.lookup(product.name, 20)
+    }
+    assert db_categories[0].id in {
+        suggestion.id
+        for suggestion in autocomplete_index.lookup(db_categories[0].name, 20)
+    }
+
+    await remove_single_product_from_store(async_session, product.id)
+
+    assert product.id not in {
+        suggestion.id for suggestion in autocomplete_index.lookup(product.name, 20)
+    }
@@ -0,0 +1,131 @@
+import datetime
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.products.models import Product, ProductInventory
+from src.apps.products.schemas import CategoryOutputSchema, ProductOutputSchema
+from src.apps.products.services.category_services import (
+    get_all_categories,
+    update_single_category,
+)
+from src.apps.products.services.product_services import (
+    create_product,
+    get_all_available_products,
+    get_available_product_validators,
+    get_available_single_product,
+    get_single_product_or_inventory,
+    update_single_product,
+)
+from src.core.factories import (
+    CategoryUpdateSchemaFactory,
+    InventoryInputSchemaFactory,
+    ProductInputSchemaFactory,
+    ProductUpdateSchemaFactory,
+)
+from src.core.pagination.models import PageParams
+
+
+async def rename_product_behind_the_cache(
+    async_session: AsyncSession, product_id: str, name: str
+) -> None:
+    await async_session.execute(
+        update(Product).filter(Product.id == product_id).values(name=name)
+    )
+
+
+async def test_products_are_served_from_cache_until_updated(
+    async_session: AsyncSession, db_products: list[ProductOutputSchema]
+):
+    product_id = db_products[0].id
+    await get_available_single_product(async_session, product_id)
+    await rename_product_behind_the_cache(async_session, product_id, "Stale name")
+
+    product = await get_available_single_product(async_session, product_id)
+    assert product.name == db_products[0].name
+
+    await update_single_product(
+        async_session,
+        ProductUpdateSchemaFactory().generate(name="Fresh name"),
+        product_id,
+    )
+    product = await get_available_single_product(async_session, product_id)
+    assert product.name == "Fresh name"
+
+
+async def test_product_validators_are_served_from_cache_until_updated(
+    async_session: AsyncSession, db_products: list[ProductOutputSchema]
+):
+    product_id = db_products[0].id
+    validators = await get_available_product_validators(async_session, product_id)
+    await async_session.execute(
+        update(Product)
+        .filter(Product.id == product_id)
+        .values(updated_at=Product.updated_at + datetime.timedelta(days=1))
+    )
+
+    cached_validators = await get_available_product_validators(
+        async_session, product_id
+    )
+    assert cached_validators.etag == validators.etag
+    assert cached_validators.last_modified == validators.last_modified
+
+    await update_single_product(
+        async_session,
+        ProductUpdateSchemaFactory().generate(name="Fresh name"),
+        product_id,
+    )
+    assert (
+        await get_available_product_validators(async_session, product_id)
+    ).etag != validators.etag
+
+
+async def test_cached_product_details_keep_inventory_current(
+    async_session: AsyncSession, db_products: list[ProductOutputSchema]
+):
+    product_id = db_products[0].id
+    await get_single_product_or_inventory(async_session, product_id)
+    await async_session.execute(
+        update(ProductInventory)
+        .filter(ProductInventory.product_id == product_id)
+        .values(quantity_for_cart_items=0)
+    )
+
+    product = await get_single_product_or_inventory(async_session, product_id)
+    assert product.inventory.quantity_for_cart_items == 0
+
+
+async def test_first_listing_page_is_invalidated_by_product_writes(
+    async_session: AsyncSession,
+    db_categories: list[CategoryOutputSchema],
+    db_products: list[ProductOutputSchema],
+):
+    page = await get_all_available_products(async_session, PageParams())
+    assert page.total == len(db_products)
+
+    await create_product(
+        async_session,
+        ProductInputSchemaFactory().generate(
+            category_ids=[db_categories[0].id],
+            inventory=InventoryInputSchemaFactory().generate(),
+        ),
+    )
+    page = await get_all_available_products(async_session, PageParams())
+    assert page.total == len(db_products) + 1
+
+
+async def test_category_writes_invalidate_cached_products(
+    async_session: AsyncSession,
+    db_categories: list[CategoryOutputSchema],
+    db_products: list[ProductOutputSchema],
+):
+    await get_all_categories(async_session, PageParams())
+    await get_available_single_product(async_session, db_products[0].id)
+
+    category_input = CategoryUpdateSchemaFactory().generate(name="Renamed category")
+    await update_single_category(async_session, category_input, db_categories[0].id)
+
+    product = await get_available_single_product(async_session, db_products[0].id)
+    assert product.categories[0].name == "Renamed category"
+    categories = await get_all_categories(async_session, PageParams())
+    assert "Renamed category" in {category.name for category in categories.results}
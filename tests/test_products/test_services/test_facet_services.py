@@ -0,0 +1,62 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.products.models import Product
+from src.apps.products.schemas import CategoryOutputSchema, ProductOutputSchema
+from src.apps.products.services.facet_services import get_category_facets
+from src.apps.products.services.product_services import (
+    get_product_facets,
+    remove_single_product_from_store,
+    update_single_product,
+)
+from src.core.factories import ProductUpdateSchemaFactory
+
+
+def get_counts(facets) -> dict[str, int]:
+    return {facet.id: facet.count for facet in facets}
+
+
+async def get_exact_counts(async_session: AsyncSession) -> dict[str, int]:
+    return get_counts(
+        await get_category_facets(
+            async_session, select(Product).filter(Product.removed_from_store == False)
+        )
+    )
+
+
+async def test_category_counts_are_kept_in_sync_with_products(
+    async_session: AsyncSession,
+    db_categories: list[CategoryOutputSchema],
+    db_products: list[ProductOutputSchema],
+):
+    assert get_counts(await get_category_facets(async_session)) == {
+        category.id: 1 for category in db_categories
+    }
+
+    await update_single_product(
+        async_session,
+        ProductUpdateSchemaFactory().generate(
+            category_ids=[db_categories[1].id, db_categories[2].id]
+        ),
+        db_products[0].id,
+    )
+    counts = get_counts(await get_category_facets(async_session))
+    assert counts == {db_categories[1].id: 2, db_categories[2].id: 2}
+    assert counts == await get_exact_counts(async_session)
+
+    await remove_single_product_from_store(async_session, db_products[1].id)
+    counts = get_counts(await get_category_facets(async_session))
+    assert counts == {db_categories[1].id: 1, db_categories[2].id: 2}
+    assert counts == await get_exact_counts(async_session)
+
+
+async def test_filtered_facets_are_counted_exactly(
+    async_session: AsyncSession,
+    db_categories: list[CategoryOutputSchema],
+    db_products: list[ProductOutputSchema],
+):
+    facets = await get_product_facets(
+        async_session, query_params=[("name", db_products[2].name), ("sort", "id__asc")]
+    )
+
+    assert [(facet.id, facet.count) for facet in facets] == [(db_categories[2].id, 1)]
@@ -1,52 +1,154 @@
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apps.products.models import ProductInventory
 from src.apps.products.schemas import InventoryOutputSchema, ProductOutputSchema
 from src.apps.products.services.inventory_services import (
     get_all_inventories,
     get_single_inventory,
+    rebalance_sharded_inventories,
+    record_sold_quantity,
+    reserve_quantity_for_cart_items,
+    sharded_inventories,
     update_single_inventory,
 )
 from src.core.exceptions import AlreadyExists, DoesNotExist, IsOccupied
-from src.core.factories import InventoryInputSchemaFactory
+from src.core.factories import (
+    InventoryInputSchemaFactory,
+    InventoryUpdateSchemaFactory,
+)
 from src.core.pagination.models import PageParams
 from src.core.utils.utils import generate_uuid
 from tests.test_products.conftest import DB_INVENTORY_SCHEMAS
 
 
-def test_if_only_one_inventory_was_returned(
-    sync_session: Session,
+async def test_if_only_one_inventory_was_returned(
+    async_session: AsyncSession,
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
-    inventory = get_single_inventory(sync_session, db_inventories.results[0].id)
+    inventory = await get_single_inventory(async_session, db_inventories.results[0].id)
 
     assert inventory.id == db_inventories.results[0].id
 
 
-def test_raise_exception_while_getting_nonexistent_inventory(
-    sync_session: Session,
+async def test_raise_exception_while_getting_nonexistent_inventory(
+    async_session: AsyncSession,
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
     with pytest.raises(DoesNotExist):
-        get_single_inventory(sync_session, generate_uuid())
+        await get_single_inventory(async_session, generate_uuid())
 
 
-def test_if_multiple_inventories_were_returned(
-    sync_session: Session,
+async def test_if_multiple_inventories_were_returned(
+    async_session: AsyncSession,
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
-    inventories = get_all_inventories(sync_session, PageParams())
+    inventories = await get_all_inventories(async_session, PageParams())
     assert inventories.total == len(DB_INVENTORY_SCHEMAS)
 
 
-def test_raise_exception_while_updating_nonexistent_inventory(
-    sync_session: Session,
+async def test_raise_exception_while_updating_nonexistent_inventory(
+    async_session: AsyncSession,
     db_products: list[ProductOutputSchema],
     db_inventories: list[InventoryOutputSchema],
 ):
     update_data = InventoryInputSchemaFactory().generate()
     with pytest.raises(DoesNotExist):
-        update_single_inventory(sync_session, update_data, generate_uuid())
+        await update_single_inventory(async_session, update_data, generate_uuid())
+
+
+async def test_reservation_fails_without_changes_when_quantity_is_too_big(
+    async_session: AsyncSession,
+    db_products: list[ProductOutputSchema],
+    db_inventories: list[InventoryOutputSchema],
+):
+    inventory = await async_session.get(ProductInventory, db_inventories.results[0].id)
+    product_id, available_quantity = (
+        inventory.product_id,
+        inventory.quantity_for_cart_items,
+    )
+
+    assert (
+        await reserve_quantity_for_cart_items(
+            async_session, product_id, available_quantity + 1
+        )
+        is None
+    )
+    assert (
+        await reserve_quantity_for_cart_items(
+            async_session, product_id, available_quantity
+        )
+        == 0
+    )
+    assert await reserve_quantity_for_cart_items(async_session, product_id, -2) == 2
+
+
+async def test_sharded_inventory_is_reserved_and_read_across_shards(
+    async_session: AsyncSession,
+    db_products: list[ProductOutputSchema],
+    db_inventories: list[InventoryOutputSchema],
+):
+    inventory_id = db_inventories.results[0].id
+    product_id = (await async_session.get(ProductInventory, inventory_id)).product_id
+    sold = db_inventories.results[0].sold
+
+    inventory = await update_single_inventory(
+        async_session,
+        InventoryUpdateSchemaFactory().generate(quantity=10, shard_count=4),
+        inventory_id,
+    )
+    assert (inventory.shard_count, inventory.quantity) == (4, 10)
+    assert inventory.quantity_for_cart_items == 10
+
+    assert await reserve_quantity_for_cart_items(async_session, product_id, 11) is None
+    assert await reserve_quantity_for_cart_items(async_session, product_id, 9) == 1
+    await record_sold_quantity(async_session, product_id, 2)
+    await async_session.commit()
+
+    inventory = await get_single_inventory(async_session, inventory_id)
+    assert (inventory.quantity_for_cart_items, inventory.quantity) == (1, 8)
+    assert inventory.sold == sold + 2
+
+    await rebalance_sharded_inventories(async_session)
+    inventory_object = await async_session.get(ProductInventory, inventory_id)
+    await async_session.refresh(inventory_object)
+    assert (inventory_object.quantity, inventory_object.sold) == (8, sold + 2)
+    assert await get_single_inventory(async_session, inventory_id) == inventory
+
+    inventory = await update_single_inventory(
+        async_session,
+        InventoryUpdateSchemaFactory().generate(quantity=12, shard_count=0),
+        inventory_id,
+    )
+    assert (inventory.shard_count, inventory.quantity) == (0, 12)
+    assert inventory.quantity_for_cart_items == 5
+
+
+async def test_reservation_recovers_from_stale_shard_state(
+    async_session: AsyncSession,
+    db_products: list[ProductOutputSchema],
+    db_inventories: list[InventoryOutputSchema],
+):
+    inventory_id = db_inventories.results[0].id
+    product_id = (await async_session.get(ProductInventory, inventory_id)).product_id
+    await update_single_inventory(
+        async_session,
+        InventoryUpdateSchemaFactory().generate(quantity=10, shard_count=4),
+        inventory_id,
+    )
+    assert await reserve_quantity_for_cart_items(async_session, product_id, 2) is not None
+    assert sharded_inventories[product_id] == (inventory_id, 4)
+
+    # unsharded by another process, which leaves the known shard state stale
+    await update_single_inventory(
+        async_session,
+        InventoryUpdateSchemaFactory().generate(quantity=10, shard_count=0),
+        inventory_id,
+    )
+    sharded_inventories[product_id] = (inventory_id, 4)
+
+    assert await reserve_quantity_for_cart_items(async_session, product_id, 3) == 5
+    assert product_id not in sharded_inventories
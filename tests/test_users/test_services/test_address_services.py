@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.user.schemas import AddressOutputSchema, UserOutputSchema
 from src.apps.user.services.address_services import (
@@ -15,38 +15,38 @@ from src.core.utils.utils import generate_uuid
 from tests.test_users.conftest import DB_ADDRESS_SCHEMAS, db_addresses, db_user
 
 
-def test_if_only_one_address_was_returned(
-    sync_session: Session,
+async def test_if_only_one_address_was_returned(
+    async_session: AsyncSession,
     db_addresses: list[AddressOutputSchema],
 ):
-    address = get_single_address(sync_session, db_addresses.results[0].id)
+    address = await get_single_address(async_session, db_addresses.results[0].id)
 
     assert address.id == db_addresses.results[0].id
 
 
-def test_raise_exception_while_getting_nonexistent_address(
-    sync_session: Session,
+async def test_raise_exception_while_getting_nonexistent_address(
+    async_session: AsyncSession,
     db_addresses: list[AddressOutputSchema],
 ):
     with pytest.raises(DoesNotExist):
-        get_single_address(sync_session, generate_uuid())
+        await get_single_address(async_session, generate_uuid())
 
 
-def test_if_multiple_addresses_were_returned(
-    sync_session: Session,
+async def test_if_multiple_addresses_were_returned(
+    async_session: AsyncSession,
     db_user: UserOutputSchema,
     db_staff_user: UserOutputSchema,
     db_addresses: list[AddressOutputSchema],
 ):
-    addresses = get_all_addresses(sync_session, PageParams())
+    addresses = await get_all_addresses(async_session, PageParams())
 
-    assert addresses.total == get_all_users(sync_session, PageParams()).total
+    assert addresses.total == (await get_all_users(async_session, PageParams())).total
 
 
-def test_raise_exception_while_updating_nonexistent_address(
-    sync_session: Session,
+async def test_raise_exception_while_updating_nonexistent_address(
+    async_session: AsyncSession,
     db_addresses: list[AddressOutputSchema],
 ):
     update_data = AddressInputSchemaFactory().generate()
     with pytest.raises(DoesNotExist):
-        update_single_address(sync_session, update_data, generate_uuid())
+        await update_single_address(async_session, update_data, generate_uuid())
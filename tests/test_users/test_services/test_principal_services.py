@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.admin.services import grant_staff_permissions
+from src.apps.emails.services import update_email
+from src.apps.user.schemas import UserOutputSchema, UserPrincipalSchema
+from src.apps.user.services.principal_services import (
+    PrincipalCache,
+    get_principal,
+    principal_cache,
+)
+from src.apps.user.services.user_services import delete_single_user
+from src.settings.cache import settings
+
+
+def make_principal(email: str) -> UserPrincipalSchema:
+    return UserPrincipalSchema(
+        id=email, email=email, is_active=True, is_superuser=False, is_staff=False
+    )
+
+
+def test_principal_cache_evicts_least_recently_used_entries():
+    principals = PrincipalCache(ttl=60, max_size=2)
+    for email in ("a", "b"):
+        principals.set(email, make_principal(email), principals.generation)
+    principals.get("a")
+    principals.set("c", make_principal("c"), principals.generation)
+
+    assert principals.get("b") is None
+    assert principals.get("a") and principals.get("c")
+
+
+def test_principal_cache_skips_entries_read_before_an_invalidation():
+    principals = PrincipalCache(ttl=60, max_size=2)
+    generation = principals.generation
+    principals.invalidate("a")
+    principals.set("a", make_principal("a"), generation)
+
+    assert principals.get("a") is None
+
+
+def test_principal_cache_entries_expire():
+    principals = PrincipalCache(ttl=0, max_size=2)
+    principals.set("a", make_principal("a"), principals.generation)
+
+    assert principals.get("a") is None
+
+
+@pytest.fixture(params=[False, True], ids=["memory", "redis"])
+def shared_cache(request, monkeypatch):
+    monkeypatch.setattr(settings, "PRINCIPAL_CACHE_SHARED", request.param)
+    return request.param
+
+
+async def test_principal_is_refreshed_after_staff_permissions_change(
+    async_session: AsyncSession, db_user: UserOutputSchema, shared_cache: bool
+):
+    assert not (await get_principal(async_session, db_user.email)).is_staff
+    assert bool(principal_cache.get(db_user.email)) is not shared_cache
+
+    await grant_staff_permissions(async_session, db_user.id)
+
+    assert (await get_principal(async_session, db_user.email)).is_staff
+
+
+async def test_principal_is_dropped_after_email_change_and_deletion(
+    async_session: AsyncSession, db_user: UserOutputSchema, shared_cache: bool
+):
+    await get_principal(async_session, db_user.email)
+    new_email = f"changed.{db_user.email}"
+
+    await update_email(async_session, new_email, db_user.email)
+    assert await get_principal(async_session, db_user.email) is None
+    assert (await get_principal(async_session, new_email)).id == db_user.id
+
+    await delete_single_user(async_session, db_user.id)
+    assert await get_principal(async_session, new_email) is None
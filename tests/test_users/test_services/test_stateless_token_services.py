@@ -0,0 +1,68 @@
+import pytest
+from fastapi import status
+from fastapi_jwt_auth import AuthJWT
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.admin.services import grant_staff_permissions
+from src.apps.jwt import services as token_services
+from src.apps.jwt.services import (
+    RevocationFilter,
+    get_claimed_principal,
+    revoke_subjects,
+)
+from src.apps.user.schemas import UserLoginInputSchema, UserOutputSchema
+from src.settings.jwt_settings import settings
+from tests.test_users.conftest import DB_USER_SCHEMA
+
+
+@pytest.fixture(autouse=True)
+def stateless_tokens(monkeypatch):
+    monkeypatch.setattr(settings, "STATELESS_TOKENS_ENABLED", True)
+    monkeypatch.setattr(
+        token_services, "revocation_filter", RevocationFilter(1 << 12, 5)
+    )
+
+
+async def log_in(async_client: AsyncClient) -> str:
+    login_data = UserLoginInputSchema(
+        email=DB_USER_SCHEMA.email, password=DB_USER_SCHEMA.password
+    )
+    response = await async_client.post("users/login", json=login_data.dict())
+    return response.json()["access_token"]
+
+
+async def test_login_embeds_principal_claims(
+    async_client: AsyncClient, db_user: UserOutputSchema
+):
+    access_token = await log_in(async_client)
+    claims = AuthJWT()._verified_token(access_token)
+
+    principal = get_claimed_principal(claims)
+    assert principal.id == db_user.id
+    assert principal.is_active and not principal.is_staff
+    assert claims["exp"] - claims["iat"] == settings.STATELESS_TOKEN_TTL
+
+
+async def test_revoked_subject_falls_back_to_current_permissions(
+    async_client: AsyncClient, async_session: AsyncSession, db_user: UserOutputSchema
+):
+    headers = {"Authorization": f"Bearer {await log_in(async_client)}"}
+    response = await async_client.get("users/", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    await grant_staff_permissions(async_session, db_user.id)
+
+    response = await async_client.get("users/", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_revocations_are_synced_from_the_table(
+    async_session: AsyncSession, db_user: UserOutputSchema
+):
+    await revoke_subjects(async_session, db_user.email)
+    synced_filter = RevocationFilter(1 << 12, 5)
+
+    await synced_filter.sync(async_session)
+
+    assert db_user.email in synced_filter
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.user.schemas import UserOutputSchema, UserUpdateSchema
 from src.apps.user.services.user_services import (
@@ -21,15 +21,15 @@ from src.core.utils.utils import generate_uuid
 from tests.test_users.conftest import DB_USER_SCHEMA, register_user_without_activation
 
 
-def test_register_user_that_already_exists(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_register_user_that_already_exists(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
     with pytest.raises(AlreadyExists):
-        register_user_without_activation(sync_session, DB_USER_SCHEMA)
+        await register_user_without_activation(async_session, DB_USER_SCHEMA)
 
 
-def test_create_user_with_occupied_email(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_create_user_with_occupied_email(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
     new_address = AddressInputSchemaFactory().generate()
     user_data = UserRegisterSchemaFactory().generate(
@@ -39,11 +39,11 @@ def test_create_user_with_occupied_email(
         address=new_address,
     )
     with pytest.raises(AlreadyExists):
-        register_user_without_activation(sync_session, user_data)
+        await register_user_without_activation(async_session, user_data)
 
 
-def test_create_user_with_occupied_username(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_create_user_with_occupied_username(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
     new_address = AddressInputSchemaFactory().generate()
     user_data = UserRegisterSchemaFactory().generate(
@@ -53,61 +53,61 @@ def test_create_user_with_occupied_username(
         address=new_address,
     )
     with pytest.raises(AlreadyExists):
-        register_user_without_activation(sync_session, user_data)
+        await register_user_without_activation(async_session, user_data)
 
 
-def test_raise_exception_when_activating_account_when_user_does_not_exist(
-    sync_session: Session,
+async def test_raise_exception_when_activating_account_when_user_does_not_exist(
+    async_session: AsyncSession,
 ):
     with pytest.raises(DoesNotExist):
-        activate_account(sync_session, email="nonexistent@mail.com")
+        await activate_account(async_session, email="nonexistent@mail.com")
 
 
-def test_raise_exception_when_activating_account_that_is_already_activated(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_raise_exception_when_activating_account_that_is_already_activated(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
     with pytest.raises(ServiceException):
-        activate_account(sync_session, email=db_user.email)
+        await activate_account(async_session, email=db_user.email)
 
 
-def test_if_only_one_user_was_returned(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_if_only_one_user_was_returned(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
-    user = get_single_user(sync_session, db_user.id)
+    user = await get_single_user(async_session, db_user.id)
 
     assert user.id == db_user.id
 
 
-def test_raise_exception_while_getting_nonexistent_user(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_raise_exception_while_getting_nonexistent_user(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
     with pytest.raises(DoesNotExist):
-        get_single_user(sync_session, generate_uuid())
+        await get_single_user(async_session, generate_uuid())
 
 
-def test_if_multiple_users_were_returned(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_if_multiple_users_were_returned(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
-    users = get_all_users(sync_session, PageParams(page=1, size=5))
+    users = await get_all_users(async_session, PageParams(page=1, size=5))
     assert users.total == 2
 
 
-def test_raise_exception_while_updating_nonexistent_user(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_raise_exception_while_updating_nonexistent_user(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
     with pytest.raises(DoesNotExist):
         update_data = {"first_name": "name"}
-        update_single_user(
-            sync_session, UserUpdateSchema(**update_data), generate_uuid()
+        await update_single_user(
+            async_session, UserUpdateSchema(**update_data), generate_uuid()
         )
 
 
-def test_if_user_can_update_their_username_to_occupied_one(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_if_user_can_update_their_username_to_occupied_one(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
     new_address = AddressInputSchemaFactory().generate()
-    user = register_user_without_activation(
-        sync_session,
+    user = await register_user_without_activation(
+        async_session,
         UserRegisterSchemaFactory().generate(
             password="testtestx", password_repeat="testtestx", address=new_address
         ),
@@ -115,11 +115,13 @@ def test_if_user_can_update_their_username_to_occupied_one(
     update_data = {"username": db_user.username}
 
     with pytest.raises(IsOccupied):
-        update_single_user(sync_session, UserUpdateSchema(**update_data), user.id)
+        await update_single_user(
+            async_session, UserUpdateSchema(**update_data), user.id
+        )
 
 
-def test_raise_exception_while_deleting_nonexistent_user(
-    sync_session: Session, db_user: UserOutputSchema
+async def test_raise_exception_while_deleting_nonexistent_user(
+    async_session: AsyncSession, db_user: UserOutputSchema
 ):
     with pytest.raises(DoesNotExist):
-        delete_single_user(sync_session, generate_uuid())
+        await delete_single_user(async_session, generate_uuid())